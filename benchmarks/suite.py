@@ -0,0 +1,377 @@
+"""Benchmark suite.
+
+Run from the repository's root directory with:
+
+    python -m benchmarks.suite [-k PATTERN] [-o RESULTS.json]
+                               [-b BASELINE.json] [-t TOLERANCE]
+
+Each benchmark reports the minimum and median time per operation over
+several repetitions. With a baseline of a previous run's JSON output,
+the run fails if any median exceeds its baseline by more than the
+tolerance, so that upgrades can be checked against a latency budget.
+"""
+
+from __future__ import annotations
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass
+from datetime import datetime
+from json import dump, load
+from platform import python_implementation, python_version
+from random import Random
+from statistics import median
+from sys import stdout
+from timeit import Timer
+from typing import Any, Callable, Iterator, Optional
+
+from dcorm.context import Context
+from dcorm.engine import Engine
+from dcorm.fields import field
+from dcorm.joins import JoinType
+from dcorm.model import Model
+from dcorm.queries import insert_many, select
+from dcorm.sqlite import SQLITE, SQLiteDatabase
+from dcorm.statement_cache import StatementCache
+
+
+__all__ = ['BENCHMARKS', 'Result', 'compare', 'main', 'run']
+
+
+Setup = Callable[[], Callable[[], Any]]
+BENCHMARKS: dict[str, Setup] = {}
+BOOK_FIELDS = ('id', 'author', 'title', 'published', 'price')
+ROWS = 1000
+SEED = 42
+
+
+@dataclass
+class Result:
+    """Timings of a benchmark in seconds per operation."""
+
+    name: str
+    number: int
+    min: float
+    median: float
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns a JSON-serializable dict."""
+        return {'number': self.number, 'min': self.min, 'median': self.median}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Registers a benchmark.
+
+    The decorated function prepares the benchmark
+    and returns the function to be timed.
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+class Author(Model, table_name='author'):
+    """An author."""
+
+    id: int = field(primary=True)
+    name: str
+    email: str
+
+
+class Book(Model, table_name='book'):
+    """A book."""
+
+    id: int = field(primary=True)
+    author: int
+    title: str
+    published: datetime
+    price: float
+
+
+class Review(Model, table_name='review'):
+    """A review of a book."""
+
+    id: int = field(primary=True)
+    book: int
+    rating: int
+    text: str
+
+
+class Wide(Model, table_name='wide'):
+    """A model with many columns."""
+
+    id: int = field(primary=True)
+    c01: int
+    c02: int
+    c03: str
+    c04: str
+    c05: float
+    c06: float
+    c07: int
+    c08: int
+    c09: str
+    c10: str
+    c11: float
+    c12: float
+    c13: int
+    c14: int
+    c15: str
+    c16: str
+    c17: float
+    c18: float
+    c19: int
+    c20: int
+
+
+def condition():
+    """Returns a condition of moderate size."""
+
+    return (
+        (Book.price > 10) & (Book.price <= 50) & (Book.title != 'Draft')
+        & ((Book.author == 1) | (Book.author == 2) | (Book.author == 3))
+    )
+
+
+def small_query():
+    """Returns a simple query of one table."""
+
+    return select(Book).where(Book.id == 1)
+
+
+def wide_query():
+    """Returns a query of many columns and conditions."""
+
+    query = select(Wide)
+
+    for index in range(1, 21, 2):
+        query.where(getattr(Wide, f'c{index:02d}') == index)
+
+    return query.order_by(Wide.id).limit(100)
+
+
+def joined_query():
+    """Returns a query over several joined tables."""
+
+    return select(Book, Author, Review).join(
+        Author, on=Book.author == Author.id
+    ).join(
+        Review, JoinType.LEFT_OUTER, on=Review.book == Book.id
+    ).where(condition()).order_by(Book.published.desc()).limit(20)
+
+
+def compile_query(make: Callable[[], Any], engine: Engine) -> Callable[
+        [], Any]:
+    """Returns a function compiling the query."""
+
+    query = make()
+    return lambda: Context(engine).sql(query).query()
+
+
+def database(rows: int = ROWS) -> SQLiteDatabase:
+    """Returns an in-memory database with sample data."""
+
+    result = SQLiteDatabase(':memory:')
+    result.execute(
+        'CREATE TABLE book (id INTEGER PRIMARY KEY, author INTEGER,'
+        ' title TEXT, published TEXT, price REAL)'
+    )
+    insert_many(Book, sample_books(rows)).execute(result)
+    return result
+
+
+def sample_rows(rows: int = ROWS) -> list[tuple[Any, ...]]:
+    """Returns sample rows of books."""
+
+    random = Random(SEED)
+    return [
+        (
+            index, random.randrange(100), f'Title {index}',
+            datetime(2000, 1, 1 + index % 28).isoformat(),
+            round(random.uniform(1, 100), 2)
+        ) for index in range(rows)
+    ]
+
+
+def sample_books(rows: int = ROWS) -> list[dict[str, Any]]:
+    """Returns sample rows of books as dicts."""
+
+    return [dict(zip(BOOK_FIELDS, row)) for row in sample_rows(rows)]
+
+
+@benchmark('expression.build')
+def expression_build():
+    """Builds a condition of several expressions."""
+    return condition
+
+
+@benchmark('compile.small')
+def compile_small():
+    """Compiles a single table query."""
+    return compile_query(small_query, SQLITE)
+
+
+@benchmark('compile.wide')
+def compile_wide():
+    """Compiles a query of many columns and conditions."""
+    return compile_query(wide_query, SQLITE)
+
+
+@benchmark('compile.joined')
+def compile_joined():
+    """Compiles a query of three joined tables."""
+    return compile_query(joined_query, SQLITE)
+
+
+@benchmark('compile.joined.cached')
+def compile_joined_cached():
+    """Compiles a query of three joined tables using a statement cache."""
+    return compile_query(
+        joined_query, Engine(statement_cache=StatementCache()))
+
+
+@benchmark('build_and_compile.joined')
+def build_and_compile_joined():
+    """Builds and compiles a query of three joined tables."""
+    return lambda: Context(SQLITE).sql(joined_query()).query()
+
+
+@benchmark('hydrate.1000')
+def hydrate():
+    """Creates records from rows."""
+    rows = sample_rows()
+    hydrator = Book.__hydrator__(BOOK_FIELDS)
+    return lambda: list(map(hydrator, rows))
+
+
+@benchmark('sqlite.select.1000')
+def sqlite_select():
+    """Selects and hydrates all rows from an in-memory database."""
+    db = database()
+    return lambda: list(select(Book).execute(db))
+
+
+@benchmark('sqlite.select.one')
+def sqlite_select_one():
+    """Selects a single row by its primary key."""
+    db = database()
+    return lambda: list(select(Book).where(Book.id == 500).execute(db))
+
+
+@benchmark('sqlite.insert.1000')
+def sqlite_insert():
+    """Inserts rows into an in-memory database."""
+    db = database(0)
+    rows = sample_books()
+
+    def insert():
+        db.execute('DELETE FROM book')
+        insert_many(Book, rows).execute(db)
+
+    return insert
+
+
+def select_benchmarks(pattern: Optional[str]) -> Iterator[tuple[str, Setup]]:
+    """Yields the benchmarks whose names contain the pattern."""
+
+    for name, setup in BENCHMARKS.items():
+        if pattern is None or pattern in name:
+            yield name, setup
+
+
+def measure(name: str, setup: Setup, *, repeat: int = 5,
+            duration: float = 0.2) -> Result:
+    """Runs a benchmark."""
+
+    timer = Timer(setup())
+    number, _ = timer.autorange()
+    number = max(1, int(number * duration / 0.2))
+    timings = [time / number for time in timer.repeat(repeat, number)]
+    return Result(name, number, min(timings), median(timings))
+
+
+def run(pattern: Optional[str] = None, *, repeat: int = 5,
+        duration: float = 0.2) -> list[Result]:
+    """Runs the benchmarks whose names contain the pattern."""
+
+    return [
+        measure(name, setup, repeat=repeat, duration=duration)
+        for name, setup in select_benchmarks(pattern)
+    ]
+
+
+def compare(results: list[Result], baseline: dict[str, Any],
+            tolerance: float) -> list[str]:
+    """Returns the regressions compared to the baseline."""
+
+    regressions = []
+    reference = baseline.get('results', {})
+
+    for result in results:
+        if (previous := reference.get(result.name)) is None:
+            continue
+
+        if result.median > (limit := previous['median'] * (1 + tolerance)):
+            regressions.append(
+                f'{result.name}: {result.median * 1e6:.2f} µs > '
+                f'{limit * 1e6:.2f} µs'
+            )
+
+    return regressions
+
+
+def report(results: list[Result]) -> dict[str, Any]:
+    """Returns the JSON report of the results."""
+
+    return {
+        'python': f'{python_implementation()} {python_version()}',
+        'results': {result.name: result.to_json() for result in results}
+    }
+
+
+def get_args(args: Optional[list[str]] = None) -> Namespace:
+    """Parses the command line arguments."""
+
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', '--pattern', help='run matching benchmarks')
+    parser.add_argument('-o', '--output', help='write results as JSON')
+    parser.add_argument('-b', '--baseline', help='compare to JSON results')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.1,
+                        help='allowed slowdown relative to the baseline')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='repetitions per benchmark')
+    parser.add_argument('-d', '--duration', type=float, default=0.2,
+                        help='approximate seconds per repetition')
+    return parser.parse_args(args)
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    """Runs the benchmark suite."""
+
+    args = get_args(args)
+    results = run(args.pattern, repeat=args.repeat, duration=args.duration)
+
+    for result in results:
+        stdout.write(
+            f'{result.name:<28} {result.median * 1e6:>12.2f} µs'
+            f' (min {result.min * 1e6:.2f} µs)\n'
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(report(results), file, indent=2)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        regressions = compare(results, load(file), args.tolerance)
+
+    for regression in regressions:
+        stdout.write(f'REGRESSION {regression}\n')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
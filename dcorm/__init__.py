@@ -1,33 +1,86 @@
 """A daclasses-based ORM framework for relational databases."""
 
+from dcorm.aio import AsyncConnectionPool, AsyncDatabase
+from dcorm.case import Case
+from dcorm.compiler import register
+from dcorm.context import Context
 from dcorm.database import Database
+from dcorm.engine import Engine
+from dcorm.explain import PlanCheck, PlanNode
 from dcorm.expression import Expression
 from dcorm.column import Column, OrderedColumn
 from dcorm.field_types import FieldType
 from dcorm.fields import field
-from dcorm.inspection import columns
+from dcorm.fingerprint import ShapeError, fingerprint
+from dcorm.identity_map import IdentityMap
+from dcorm.indexes import Index
+from dcorm.inspection import columns, primary_key
 from dcorm.joins import Join, JoinType
+from dcorm.loading import BulkLoader, FileFormat, LoadResult, RowError
 from dcorm.model import ModelType, Model
 from dcorm.operations import Operation
 from dcorm.operators import Operator
-from dcorm.ordering import Ordering
-from dcorm.queries import select
+from dcorm.ordering import Nulls, Ordering
+from dcorm.paramstyle import ParamStyle
+from dcorm.pool import ConnectionPool
+from dcorm.prefetch import related
+from dcorm.queries import bulk_update, create_indexes, create_table, delete
+from dcorm.queries import insert_many, select, update
+from dcorm.result_cache import LRUResultCache, ResultCache
+from dcorm.result_cache import SharedResultCache
+from dcorm.session import Session
+from dcorm.sqlite import AsyncSQLiteDatabase, SQLiteDatabase
+from dcorm.statement_cache import StatementCache
 
 
 __all__ = [
+    'bulk_update',
     'columns',
+    'create_indexes',
+    'create_table',
+    'delete',
     'field',
+    'fingerprint',
+    'insert_many',
+    'primary_key',
+    'register',
+    'related',
     'select',
+    'update',
+    'AsyncConnectionPool',
+    'AsyncDatabase',
+    'AsyncSQLiteDatabase',
+    'BulkLoader',
+    'Case',
     'Column',
+    'ConnectionPool',
+    'Context',
     'Database',
+    'Engine',
     'Expression',
     'FieldType',
+    'FileFormat',
+    'IdentityMap',
+    'Index',
     'Join',
     'JoinType',
+    'LRUResultCache',
+    'LoadResult',
     'Model',
     'ModelType',
+    'Nulls',
     'Operation',
     'Operator',
     'OrderedColumn',
-    'Ordering'
+    'Ordering',
+    'ParamStyle',
+    'PlanCheck',
+    'PlanNode',
+    'ResultCache',
+    'RowError',
+    'SQLiteDatabase',
+    'Session',
+    'ShapeError',
+    'SharedResultCache',
+    'StatementCache'
 ]
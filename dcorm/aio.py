@@ -0,0 +1,498 @@
+"""Asynchronous execution."""
+
+from __future__ import annotations
+from asyncio import AbstractEventLoop, Condition, get_running_loop, wait_for
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from functools import partial
+from inspect import isawaitable
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+from typing import Sequence
+
+from dcorm.database import BaseDatabase, Lease, Parameters, begin
+from dcorm.database import release_savepoint, rollback_savepoint
+from dcorm.pool import BasePool
+from dcorm.results import BaseResultIterator
+
+
+__all__ = [
+    'AsyncConnectionPool',
+    'AsyncDatabase',
+    'AsyncResultIterator',
+    'ThreadedConnection',
+    'ThreadedCursor'
+]
+
+
+Connection = Any    # An asynchronous connection.
+
+
+class ThreadedCursor:
+    """Asynchronous wrapper of a DB-API cursor."""
+
+    def __init__(self, connection: ThreadedConnection, cursor: Any):
+        self.connection = connection
+        self.cursor = cursor
+
+    @property
+    def rowcount(self) -> int:
+        """Returns the amount of affected rows."""
+        return self.cursor.rowcount
+
+    async def execute(self, sql: str, parameters: Parameters = ()) -> None:
+        """Executes an SQL statement."""
+        await self.connection.run(self.cursor.execute, sql, parameters)
+
+    async def executemany(self, sql: str,
+                          parameters: Iterable[Parameters]) -> None:
+        """Executes an SQL statement for each set of parameters."""
+        await self.connection.run(self.cursor.executemany, sql, parameters)
+
+    async def fetchmany(self, size: int) -> list[Any]:
+        """Fetches the given amount of rows."""
+        return await self.connection.run(self.cursor.fetchmany, size)
+
+    async def fetchall(self) -> list[Any]:
+        """Fetches all remaining rows."""
+        return await self.connection.run(self.cursor.fetchall)
+
+    async def close(self) -> None:
+        """Closes the cursor."""
+        await self.connection.run(self.cursor.close)
+
+
+class ThreadedConnection:
+    """Asynchronous wrapper of a blocking DB-API connection.
+
+    All calls are run on a dedicated thread, since drivers
+    may not allow connections to be shared between threads.
+    """
+
+    def __init__(self, connection: Any, executor: ThreadPoolExecutor):
+        self.connection = connection
+        self.executor = executor
+
+    @classmethod
+    async def connect(cls, connect: Callable[[], Any]) -> ThreadedConnection:
+        """Opens a connection on a new thread."""
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            connection = await get_running_loop().run_in_executor(
+                executor, connect)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+
+        return cls(connection, executor)
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Runs the function on the connection's thread."""
+        return await get_running_loop().run_in_executor(
+            self.executor, partial(function, *args))
+
+    async def cursor(self) -> ThreadedCursor:
+        """Returns a new cursor."""
+        return ThreadedCursor(self, await self.run(self.connection.cursor))
+
+    async def commit(self) -> None:
+        """Commits the current transaction."""
+        await self.run(self.connection.commit)
+
+    async def rollback(self) -> None:
+        """Rolls back the current transaction."""
+        await self.run(self.connection.rollback)
+
+    async def close(self) -> None:
+        """Closes the connection and stops its thread."""
+        try:
+            await self.run(self.connection.close)
+        finally:
+            self.executor.shutdown(wait=False)
+
+
+class AsyncConnectionPool(BasePool):
+    """A bounded pool of asynchronous connections.
+
+    Tasks waiting for a connection are served in FIFO order, which
+    applies back-pressure when all connections are in use.
+    """
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._condition = Condition()
+
+    async def _checkout(self) -> Optional[Connection]:
+        """Takes an idle connection or reserves a new one."""
+        expired: list[Connection] = []
+
+        try:
+            async with self._condition:
+                while True:
+                    connection, taken = self._take(expired)
+
+                    if taken:
+                        return connection
+
+                    await self._condition.wait()
+        finally:
+            await close_all(expired)
+
+    async def _discard(self) -> None:
+        """Frees the slot of a discarded connection."""
+        async with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    async def _drop(self, connection: Connection) -> None:
+        """Closes a checked out connection and frees its slot."""
+        await close(connection)
+        await self._discard()
+
+    async def _acquire(self) -> Connection:
+        """Checks out a connection without a timeout.
+
+        If the health check is cancelled, e.g. on timeout,
+        the connection is dropped rather than leaked.
+        """
+        while True:
+            if (connection := await self._checkout()) is None:
+                try:
+                    return await self.connect()
+                except BaseException:
+                    await self._discard()
+                    raise
+
+            try:
+                if self.check is None or await healthy(
+                        connection, self.check):
+                    return connection
+            except BaseException:
+                await self._drop(connection)
+                raise
+
+            await self._drop(connection)
+
+    async def acquire(self) -> Connection:
+        """Checks out a connection from the pool."""
+        if self.timeout is None:
+            connection = await self._acquire()
+        else:
+            try:
+                connection = await wait_for(self._acquire(), self.timeout)
+            except TimeoutError:
+                raise TimeoutError(
+                    'Timed out waiting for a connection.') from None
+
+        self._in_use.add(id(connection))
+        return connection
+
+    async def release(self, connection: Connection, *,
+                      discard: bool = False) -> None:
+        """Returns a connection to the pool."""
+        async with self._condition:
+            if not self._put(connection, discard):
+                return
+
+            self._condition.notify()
+
+        if discard:
+            await close(connection)
+
+    async def close(self) -> None:
+        """Closes all idle connections."""
+        async with self._condition:
+            idle = self._drain()
+            self._condition.notify_all()
+
+        await close_all(idle)
+
+
+class AsyncDatabase(BaseDatabase):
+    """Base class for asynchronous databases.
+
+    Blocking DB-API 2.0 driver connections are run on dedicated
+    threads. Subclasses may override connect() to open connections
+    of an asynchronous driver instead. Connections are leased to
+    tasks and shared with the tasks they spawn.
+    """
+
+    pool_type = AsyncConnectionPool
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._current: ContextVar[Optional[Lease]] = ContextVar(
+            f'dcorm_lease_{id(self)}', default=None)
+
+    @property
+    def _lease(self) -> Optional[Lease]:
+        return self._current.get()
+
+    @_lease.setter
+    def _lease(self, lease: Lease) -> None:
+        self._current.set(lease)
+
+    async def connect(self) -> Connection:
+        """Opens a new connection."""
+        if self.driver is None:
+            raise NotImplementedError(f'No driver set on {type(self)}.')
+
+        return await ThreadedConnection.connect(
+            partial(self.driver.connect, *self.args, **self.kwargs))
+
+    async def ping(self, connection: Connection) -> bool:
+        """Checks whether the connection is usable."""
+        cursor = await connection.cursor()
+
+        try:
+            await cursor.execute('SELECT 1')
+            await cursor.fetchall()
+        finally:
+            await cursor.close()
+
+        return True
+
+    async def acquire(self) -> Connection:
+        """Returns the current task's connection.
+
+        The first call checks a connection out of the pool.
+        Each call must be matched by a call to release().
+        """
+        if (connection := self._leased()) is not None:
+            return connection
+
+        return self._lease_connection(await self.pool.acquire())
+
+    async def release(self, connection: Connection, *,
+                      discard: bool = False) -> None:
+        """Releases a connection acquired by acquire()."""
+        if self._unlease(connection):
+            await self.pool.release(connection, discard=discard)
+
+    async def autocommit(self, connection: Connection) -> None:
+        """Commits unless the connection is in a transaction."""
+        if not self._is_transaction_open(connection):
+            await connection.commit()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Connection]:
+        """Yields the current task's connection."""
+        connection = await self.acquire()
+
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
+
+    @asynccontextmanager
+    async def atomic(self) -> AsyncIterator[Connection]:
+        """Runs the block in a transaction.
+
+        The outermost block begins the transaction explicitly,
+        nested blocks use savepoints.
+        """
+        async with self.connection() as connection:
+            lease = self._leases[id(connection)]
+            await execute(connection, begin(depth := lease.transactions))
+            lease.transactions += 1
+
+            try:
+                yield connection
+            except BaseException:
+                if depth:
+                    await execute_all(connection, rollback_savepoint(depth))
+                else:
+                    await connection.rollback()
+
+                raise
+            else:
+                if depth:
+                    await execute_all(connection, release_savepoint(depth))
+                else:
+                    await connection.commit()
+            finally:
+                lease.transactions = depth
+
+                if not depth:
+                    self._ended(lease)
+
+    @asynccontextmanager
+    async def cursor(self) -> AsyncIterator[Any]:
+        """Yields a cursor.
+
+        Outside of transactions, changes are committed when the block exits.
+        """
+        async with self.connection() as connection:
+            cursor = await connection.cursor()
+
+            try:
+                yield cursor
+            except BaseException:
+                if not self.in_transaction:
+                    await connection.rollback()
+
+                raise
+            else:
+                await self.autocommit(connection)
+            finally:
+                await cursor.close()
+
+    async def execute(self, sql: str, parameters: Parameters = ()) -> int:
+        """Executes an SQL statement and returns the amount of rows."""
+        async with self.cursor() as cursor:
+            await cursor.execute(sql, parameters)
+            return cursor.rowcount
+
+    async def executemany(self, sql: str,
+                          parameters: Iterable[Parameters]) -> int:
+        """Executes an SQL statement for each set of parameters
+        and returns the amount of rows.
+        """
+        async with self.cursor() as cursor:
+            await cursor.executemany(sql, parameters)
+            return cursor.rowcount
+
+    async def fetchall(self, sql: str,
+                       parameters: Parameters = ()) -> list[Any]:
+        """Executes an SQL statement and returns all rows."""
+        async with self.cursor() as cursor:
+            await cursor.execute(sql, parameters)
+            return await cursor.fetchall()
+
+    async def close(self) -> None:
+        """Closes all idle connections."""
+        await self.pool.close()
+
+
+class AsyncResultIterator(BaseResultIterator):
+    """Asynchronously iterates over the rows of a query.
+
+    Batches of results may be processed asynchronously.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._loop: Optional[AbstractEventLoop] = None
+
+    def __aiter__(self) -> AsyncResultIterator:
+        return self
+
+    async def __anext__(self) -> Any:
+        while True:
+            for record in self._batch:
+                return record
+
+            if not (rows := await self._fetch()):
+                await self.aclose()
+                raise StopAsyncIteration()
+
+            self._batch = iter(await self._convert(rows))
+
+    async def __aenter__(self) -> AsyncResultIterator:
+        return self
+
+    async def __aexit__(self, typ, value, traceback):
+        await self.aclose()
+
+    def __del__(self):
+        if self._closed or self._loop is None or self._loop.is_closed():
+            return
+
+        with suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(
+                self._loop.create_task, self.aclose())
+
+    async def open(self) -> AsyncResultIterator:
+        """Executes the query."""
+        self._loop = get_running_loop()
+
+        if self.rows is not None:
+            return self
+
+        self._connection = await self.database.acquire()
+
+        try:
+            self._cursor = await self._connection.cursor()
+            await self._cursor.execute(self.sql, self.parameters)
+        except BaseException:
+            await self.aclose()
+            raise
+
+        return self
+
+    async def _fetch(self) -> Sequence[Any]:
+        """Fetches the next batch of rows."""
+        if (rows := self._given()) is not None:
+            return rows
+
+        if self._cursor is None:
+            await self.open()
+
+        return await self._cursor.fetchmany(self.batch_size)
+
+    async def _convert(self, rows: Sequence[Any]) -> list[Any]:
+        """Converts and processes a batch of rows."""
+        records = self._records(rows)
+
+        if self.process is not None and isawaitable(
+                result := self.process(records)):
+            await result
+
+        return records
+
+    async def aclose(self) -> None:
+        """Releases the cursor and the connection."""
+        cursor, connection = self._detach()
+
+        if cursor is not None:
+            await cursor.close()
+
+        if connection is not None:
+            try:
+                await self.database.autocommit(connection)
+            finally:
+                await self.database.release(connection)
+
+
+async def healthy(connection: Connection,
+                  check: Callable[[Connection], Awaitable[bool]]) -> bool:
+    """Runs the health check on the connection."""
+
+    try:
+        return await check(connection)
+    except Exception:   # pylint: disable=W0703
+        return False
+
+
+async def close(connection: Connection) -> None:
+    """Closes a connection, ignoring errors."""
+
+    with suppress(Exception):
+        await connection.close()
+
+
+async def close_all(connections: list[Connection]) -> None:
+    """Closes the given connections."""
+
+    for connection in connections:
+        await close(connection)
+
+
+async def execute(connection: Connection, sql: str) -> None:
+    """Executes a statement without parameters on the connection."""
+
+    cursor = await connection.cursor()
+
+    try:
+        await cursor.execute(sql)
+    finally:
+        await cursor.close()
+
+
+async def execute_all(connection: Connection,
+                      statements: Iterable[str]) -> None:
+    """Executes statements without parameters on the connection."""
+
+    for statement in statements:
+        await execute(connection, statement)
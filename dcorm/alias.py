@@ -1,9 +1,10 @@
 """Model aliases."""
 
-from dataclasses import dataclass
-from typing import Any, Iterable, Optional
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Iterable, Optional
 
-from dcorm.column import Column
+from dcorm.column import Column, ColumnTable, Identifiers
+from dcorm.context import Context
 from dcorm.engine import Engine
 from dcorm.literal import binary
 
@@ -14,17 +15,19 @@ __all__ = ['Alias', 'AliasManager']
 AS = binary('AS')
 
 
-@dataclass
+@dataclass(slots=True)
 class Alias:
     """A model alias."""
 
     model: Any
     name: Optional[str] = None
+    columns: Optional[ColumnTable] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def __getattr__(self, attribute: str) -> Any:
         """Delegates to the underlying model."""
         if isinstance(value := getattr(self.model, attribute), Column):
-            return Column(self, value.field, value.value)
+            return self.__column_table__.by_name[value.field.name]
 
         if isinstance(value, type(self)):
             value.model = self.model
@@ -36,11 +39,30 @@ class Alias:
         """Returns the alias name."""
         return self.name
 
-    def __sql__(self, engine: Engine) -> Engine:
+    @property
+    def __column_table__(self) -> ColumnTable:
+        """Returns the columns bound to the alias."""
+        if self.columns is None:
+            self.columns = ColumnTable(
+                Column(self, column.field, column.value)
+                for column in self.model.__column_table__
+            )
+
+        return self.columns
+
+    def __identifiers__(self, engine: Engine) -> Identifiers:
+        """Returns the quoted identifiers of the alias and its columns."""
         if self.name is None:
             raise RuntimeError('Alias name not set:', self)
 
-        return engine.sql(self.model).literal(AS).sql(self.name)
+        return self.__column_table__.identifiers(engine, self.name)
+
+    def __fingerprint__(self, _: list[Any]) -> Hashable:
+        return (Alias, self.model, self.name)
+
+    def __sql__(self, context: Context) -> Context:
+        return context.sql(self.model).literal(AS).raw_value(
+            self.__identifiers__(context.engine).table, ())
 
 
 class AliasManager:
@@ -0,0 +1,62 @@
+"""CASE expressions."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional, Sequence
+
+from dcorm.context import Context
+from dcorm.expression import Expression
+from dcorm.expression_base import ExpressionBase
+from dcorm.fingerprint import shape
+from dcorm.literal import Literal, binary, unary
+
+
+__all__ = ['Case']
+
+
+CASE = unary('CASE')
+WHEN = unary('WHEN')
+THEN = binary('THEN')
+ELSE = binary('ELSE')
+END = Literal('END', space_left=True)
+
+
+@dataclass(eq=False, slots=True)
+class Case(ExpressionBase, typ=Expression):
+    """A CASE expression.
+
+    Without an operand, the branches' conditions are evaluated.
+    Without a default, unmatched values result in NULL.
+    """
+
+    operand: Optional[Any]
+    branches: Sequence[tuple[Any, Any]]
+    default: Optional[Any] = None
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            Case,
+            shape(self.operand, values),
+            tuple(
+                (shape(when, values), shape(then, values))
+                for when, then in self.branches
+            ),
+            shape(self.default, values)
+        )
+
+    def __sql__(self, context: Context) -> Context:
+        context.literal(CASE)
+
+        if self.operand is not None:
+            context.sql(self.operand).raw_value(' ', ())
+
+        for index, (when, then) in enumerate(self.branches):
+            if index:
+                context.raw_value(' ', ())
+
+            context.literal(WHEN).sql(when).literal(THEN).sql(then)
+
+        if self.default is not None:
+            context.literal(ELSE).sql(self.default)
+
+        return context.literal(END)
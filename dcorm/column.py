@@ -1,44 +1,67 @@
 """Field accessors."""
 
 from __future__ import annotations
-from dataclasses import dataclass, Field as _Field
-from typing import Any, NamedTuple
+from dataclasses import dataclass, field as _field, Field as _Field
+from types import MappingProxyType
+from typing import Any, Hashable, Iterable, Mapping, NamedTuple, Optional
 
+from dcorm.context import Context
 from dcorm.engine import Engine
 from dcorm.expression import Expression
 from dcorm.expression_base import ExpressionBase
-from dcorm.literal import unary
-from dcorm.ordering import Ordering
+from dcorm.fingerprint import shape
+from dcorm.literal import Literal, unary
+from dcorm.ordering import Nulls, Ordering
 from dcorm.path import Path
 
 
-__all__ = ['NOT_SET', 'Column', 'ColumnSelect', 'OrderedColumn']
+__all__ = [
+    'NOT_SET',
+    'Column',
+    'ColumnSelect',
+    'ColumnTable',
+    'DeferredColumn',
+    'Identifiers',
+    'OrderedColumn',
+    'Projection',
+    'SlotColumn'
+]
 
 
 COMMA = unary(',')
+IS_NULL = Literal('IS NULL', space_left=True)
 NOT_SET = object()
+MAX_IDENTIFIERS = 64    # Cached identifiers per table.
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Column(ExpressionBase, typ=Expression):
     """Represents a column bound to a model."""
 
     table: Any
     field: _Field
     value: Any = NOT_SET
+    name: str = _field(init=False, repr=False)
 
-    def asc(self) -> OrderedColumn:
+    def __post_init__(self):
+        self.name = self.field.metadata.get('column_name', self.field.name)
+
+    def asc(self, nulls: Optional[Nulls] = None) -> OrderedColumn:
         """Returns an ordered column with ascending ordering."""
-        return OrderedColumn(self, Ordering.ASC)
+        return OrderedColumn(self, Ordering.ASC, nulls)
 
-    def desc(self) -> OrderedColumn:
+    def desc(self, nulls: Optional[Nulls] = None) -> OrderedColumn:
         """Returns an ordered column with descending ordering."""
-        return OrderedColumn(self, Ordering.DESC)
+        return OrderedColumn(self, Ordering.DESC, nulls)
 
-    @property
-    def name(self) -> str:
-        """Returns the column's name."""
-        return self.field.metadata.get('column_name', self.field.name)
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        """Returns the column on models and fails on records,
+        whose values of the field have not been loaded.
+        """
+        if instance is None:
+            return self
+
+        raise AttributeError(f'Field {self.field.name!r} is not loaded.')
 
     @property
     def path(self) -> Path:
@@ -47,8 +70,57 @@ class Column(ExpressionBase, typ=Expression):
         path.append(self.name)
         return path
 
-    def __sql__(self, engine: Engine) -> Engine:
-        return engine.sql(self.path)
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (Column, shape(self.table, values), self.name)
+
+    def __sql__(self, context: Context) -> Context:
+        return context.raw_value(
+            self.table.__identifiers__(context.engine).columns[self.name],
+            ()
+        )
+
+
+@dataclass(eq=False, slots=True)
+class DeferredColumn(Column):
+    """A column that is not selected with its model.
+
+    Its values are loaded on first access to the field of a record.
+    """
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        return load_deferred(instance, self)
+
+
+@dataclass(eq=False, slots=True)
+class SlotColumn(Column):
+    """A column of a slotted model.
+
+    Delegates attribute access on records to the slot.
+    Unset slots of deferred columns are loaded on access.
+    """
+
+    slot: Any = None
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            if not self.field.metadata.get('lazy'):
+                raise
+
+        return load_deferred(instance, self)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.slot.__delete__(instance)
 
 
 class ColumnSelect(list):
@@ -57,21 +129,142 @@ class ColumnSelect(list):
     def __init__(self, *columns: Column):
         super().__init__(columns)
 
-    def __sql__(self, engine: Engine) -> Engine:
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return tuple(shape(column, values) for column in self)
+
+    def __sql__(self, context: Context) -> Context:
         for index, column in enumerate(self, start=1):
-            engine.sql(column)
+            context.sql(column)
 
             if index < len(self):
-                engine.literal(COMMA)
+                context.literal(COMMA)
 
-        return engine
+        return context
 
 
 class OrderedColumn(NamedTuple):
-    """Represents a table column with ordering."""
+    """Represents a table column with ordering.
+
+    Without a placement of NULLs, the engine's default applies.
+    On engines not supporting NULLS FIRST / LAST, the placement
+    is emulated by ordering by the column's NULL test first.
+    """
 
     field: Column
     ordering: Ordering
+    nulls: Optional[Nulls] = None
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            OrderedColumn,
+            shape(self.field, values),
+            self.ordering,
+            self.nulls
+        )
+
+    def __sql__(self, context: Context) -> Context:
+        if self.nulls is None:
+            return context.sql(self.field).literal(self.ordering)
+
+        if context.engine.nulls_ordering:
+            return context.sql(self.field).literal(self.ordering).literal(
+                self.nulls)
+
+        return context.sql(self.field).literal(IS_NULL).literal(
+            Ordering.DESC if self.nulls is Nulls.FIRST else Ordering.ASC
+        ).literal(COMMA).sql(self.field).literal(self.ordering)
+
+
+class Identifiers(NamedTuple):
+    """Quoted identifiers of a table and its columns."""
+
+    table: str
+    columns: Mapping[str, str]
+    select: str     # All selected columns, separated by commas.
+
+
+class ColumnTable:
+    """The columns of a model or alias.
+
+    Deferred columns are not selected with the model, unless it has
+    no primary key to load them by. The quoted identifiers are
+    rendered once per engine and table path. Only the most recently
+    rendered ones are kept, since engines may be short-lived.
+    """
+
+    __slots__ = (
+        'columns', 'names', 'by_name', 'primary_key', 'selected',
+        'selected_names', '_identifiers'
+    )
+
+    def __init__(self, columns: Iterable[Column]):
+        self.columns = tuple(columns)
+        self.names = tuple(column.field.name for column in self.columns)
+        self.by_name = MappingProxyType(dict(zip(self.names, self.columns)))
+        self.primary_key = next((
+            column for column in self.columns
+            if column.field.metadata.get('primary')
+        ), None)
+        self.selected = self.columns if self.primary_key is None else tuple(
+            column for column in self.columns
+            if not column.field.metadata.get('lazy')
+        )
+        self.selected_names = tuple(
+            column.field.name for column in self.selected)
+        self._identifiers: dict[
+            tuple[Engine, tuple[str, ...]], Identifiers] = {}
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def identifiers(self, engine: Engine, *path: str) -> Identifiers:
+        """Returns the quoted identifiers of the table at the given path."""
+        try:
+            return self._identifiers[engine, path]
+        except KeyError:
+            pass
+
+        if len(self._identifiers) >= MAX_IDENTIFIERS:
+            self._identifiers.pop(next(iter(self._identifiers)), None)
+
+        table = '.'.join(map(engine.quote, path))
+        columns = {
+            column.name: f'{table}.{engine.quote(column.name)}'
+            for column in self.columns
+        }
+        return self._identifiers.setdefault((engine, path), Identifiers(
+            table, MappingProxyType(columns), ', '.join(
+                columns[column.name] for column in self.selected)))
+
+
+class Projection(NamedTuple):
+    """A selection of some columns of a model or alias."""
+
+    table: Any
+    columns: tuple[Column, ...]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Returns the field names of the selected columns."""
+        return tuple(column.field.name for column in self.columns)
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (Projection, shape(self.table, values), self.names)
+
+    def __sql__(self, context: Context) -> Context:
+        return ColumnSelect(*self.columns).__sql__(context)
+
+
+def load_deferred(record: Any, column: Column) -> Any:
+    """Loads the value of a deferred column of a record."""
+
+    try:
+        loader = record.__deferred__
+    except AttributeError:
+        raise AttributeError(
+            f'Deferred field {column.field.name!r} is not loaded.') from None
 
-    def __sql__(self, engine: Engine) -> Engine:
-        return engine.sql(self.field).sql(self.ordering)
+    return loader.load(record, column)
@@ -0,0 +1,173 @@
+"""Columnar query results."""
+
+from __future__ import annotations
+from array import array
+from math import nan
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+from dcorm.column import Column, Projection
+from dcorm.field_types import FieldType
+from dcorm.relations import model_of
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = ['ColumnBuffer', 'buffers', 'columns_of']
+
+
+Converter = Callable[[Any], Any]
+ColumnArray = Union[array, list, Any]   # Any for NumPy arrays.
+
+# Types of numeric columns as array type codes and NumPy dtypes.
+TYPECODES = {
+    FieldType.AUTO: 'q',
+    FieldType.BIGAUTO: 'q',
+    FieldType.BIGINT: 'q',
+    FieldType.BOOL: 'b',
+    FieldType.DOUBLE: 'd',
+    FieldType.FLOAT: 'd',
+    FieldType.INT: 'q',
+    FieldType.SMALLINT: 'q'
+}
+DTYPES = {
+    FieldType.AUTO: 'int64',
+    FieldType.BIGAUTO: 'int64',
+    FieldType.BIGINT: 'int64',
+    FieldType.BOOL: 'bool',
+    FieldType.DOUBLE: 'float64',
+    FieldType.FLOAT: 'float64',
+    FieldType.INT: 'int64',
+    FieldType.SMALLINT: 'int64'
+}
+
+
+class ColumnBuffer:
+    """Collects the values of a column.
+
+    Numeric columns are stored in NumPy arrays, which are preallocated
+    and grown by doubling, or in arrays of the standard library. NULLs
+    of floating point columns are stored as NaN. If an integer or
+    boolean column contains NULLs, it falls back to storing objects.
+    Other columns are stored as objects, i.e. in NumPy arrays of
+    objects or lists, with their values converted by the converter.
+    """
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            field_type: FieldType,
+            converter: Optional[Converter],
+            capacity: int,
+            use_numpy: bool
+    ):
+        self.converter = converter
+        self.use_numpy = use_numpy
+        self.size = 0
+
+        if use_numpy:
+            self.data = numpy.empty(
+                capacity, dtype=DTYPES.get(field_type, object))
+            self.numeric = field_type in DTYPES
+        else:
+            if (typecode := TYPECODES.get(field_type)) is None:
+                self.data = []
+            else:
+                self.data = array(typecode)
+
+            self.numeric = typecode is not None
+
+        self.floating = TYPECODES.get(field_type) == 'd'
+
+    def extend(self, values: Sequence[Any]) -> None:
+        """Appends a batch of values."""
+        if self.numeric:
+            if None in values:
+                if self.floating:
+                    values = [nan if value is None else value
+                              for value in values]
+                else:
+                    self._to_objects()
+
+        if not self.numeric and (converter := self.converter) is not None:
+            values = [None if value is None else converter(value)
+                      for value in values]
+
+        if not self.use_numpy:
+            self.data.extend(values)
+            return
+
+        if (end := self.size + len(values)) > len(self.data):
+            self._grow(end)
+
+        self.data[self.size:end] = values
+        self.size = end
+
+    def result(self) -> ColumnArray:
+        """Returns the column's values."""
+        if not self.use_numpy or self.size == len(self.data):
+            return self.data
+
+        return self.data[:self.size].copy()
+
+    def _grow(self, size: int) -> None:
+        """Grows the NumPy array to hold at least the given size."""
+        data = numpy.empty(max(size, 2 * len(self.data)),
+                           dtype=self.data.dtype)
+        data[:self.size] = self.data[:self.size]
+        self.data = data
+
+    def _to_objects(self) -> None:
+        """Falls back to storing objects."""
+        self.numeric = False
+
+        if self.use_numpy:
+            self.data = self.data.astype(object)
+        else:
+            self.data = self.data.tolist()
+
+
+def columns_of(items: Iterable[Any]) -> list[Column]:
+    """Returns the selected columns."""
+
+    result = []
+
+    for item in items:
+        if isinstance(item, Column):
+            result.append(item)
+        elif isinstance(item, Projection):
+            result.extend(item.columns)
+        else:
+            result.extend(item.__column_table__.selected)
+
+    return result
+
+
+def buffers(columns: Sequence[Column], capacity: int,
+            use_numpy: Optional[bool] = None) -> dict[str, ColumnBuffer]:
+    """Returns buffers of the columns by their field names.
+
+    NumPy arrays are used, if NumPy is installed and not disabled.
+    """
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError('NumPy is not installed.')
+
+    result = {}
+
+    for column in columns:
+        if (name := column.field.name) in result:
+            raise ValueError(f'Duplicate column name: {name!r}')
+
+        model = model_of(column.table)
+        result[name] = ColumnBuffer(
+            model.__field_types__[name],
+            model.__converters__.get(name),
+            capacity,
+            use_numpy
+        )
+
+    return result
@@ -0,0 +1,85 @@
+"""Type-dispatched SQL compilation.
+
+Context.sql() looks up how to render an object by its type. Node types
+implement the __sql__(self, context) protocol. Types that cannot be
+changed, e.g. those of third-party libraries, can be made compilable by
+registering a compiler function for them:
+
+    @register(Point)
+    def compile_point(point: Point, context: Context) -> Context:
+        return context.raw_value(
+            f'POINT({PARAM}, {PARAM})', (point.x, point.y))
+
+Parameters are marked by dcorm.paramstyle.PARAM, which is replaced
+by the placeholders of the engine's parameter style. Registered
+compilers take precedence over __sql__() methods of the same class
+and are inherited by subclasses. Objects of types without either
+are rendered as bound values.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from dcorm.context import Context
+
+
+__all__ = ['Compiler', 'compiler', 'register', 'registered', 'unregister']
+
+
+Compiler = Callable[[Any, 'Context'], 'Context']
+COMPILERS: dict[type, Compiler] = {}
+DISPATCH: dict[type, Optional[Compiler]] = {}
+
+
+def register(typ: type) -> Callable[[Compiler], Compiler]:
+    """Returns a decorator to register a compiler for the given type."""
+
+    def decorator(function: Compiler) -> Compiler:
+        COMPILERS[typ] = function
+        DISPATCH.clear()
+        return function
+
+    return decorator
+
+
+def unregister(typ: type) -> None:
+    """Removes the compiler registered for the given type."""
+
+    del COMPILERS[typ]
+    DISPATCH.clear()
+
+
+def compiler(typ: type) -> Optional[Compiler]:
+    """Returns the compiler for objects of the given type.
+
+    Returns None if the objects are to be rendered as values.
+    """
+
+    try:
+        return DISPATCH[typ]
+    except KeyError:
+        DISPATCH[typ] = function = resolve(typ)
+        return function
+
+
+def registered(typ: type) -> bool:
+    """Checks whether objects of the given type are
+    rendered by a registered compiler function.
+    """
+
+    return bool(COMPILERS) and (function := compiler(typ)) is not None and (
+        function != getattr(typ, '__sql__', None))
+
+
+def resolve(typ: type) -> Optional[Compiler]:
+    """Finds the compiler for the given type along its MRO."""
+
+    for base in typ.__mro__:
+        if (function := COMPILERS.get(base)) is not None:
+            return function
+
+        if '__sql__' in vars(base):
+            return getattr(typ, '__sql__')
+
+    return None
@@ -0,0 +1,101 @@
+"""Compilation context."""
+
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Iterable, Union
+
+from dcorm.compiler import compiler
+from dcorm.containers import CONTAINERS
+from dcorm.engine import Engine
+from dcorm.literal import Literal
+from dcorm.paramstyle import PARAM
+
+
+__all__ = ['Context']
+
+
+class Context:
+    """State of a single SQL compilation against an engine."""
+
+    __slots__ = ('engine', '_sql', '_values')
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._sql: list[str] = []
+        self._values: list[Any] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.engine!r})'
+
+    def quote(self, string: str) -> str:
+        """Quotes the given string."""
+        return self.engine.quote(string)
+
+    def raw_value(self, frmt: str, values: Iterable[Any]) -> Context:
+        """Append values with a pre-defined format string."""
+        self._sql.append(frmt)
+        self._values.extend(values)
+        return self
+
+    def value(self, value: Any) -> Context:
+        """Set a value."""
+        if value is None:
+            self._sql.append('NULL')
+        elif isinstance(value, CONTAINERS):
+            values = tuple(value)
+            self._sql.append(f'({", ".join(PARAM * len(values))})')
+            self._values.extend(values)
+        else:
+            self._sql.append(PARAM)
+            self._values.append(value)
+
+        return self
+
+    def sql(self, obj: Any) -> Context:
+        """Renders any given object by the compiler of its type."""
+        if (function := compiler(type(obj))) is None:
+            return self.value(obj)
+
+        return function(obj, self)
+
+    def literal(self, obj: Union[Enum, Literal]) -> Context:
+        """Processes a literal."""
+        self._sql.append(self.engine.literal(obj))
+        return self
+
+    @property
+    def template(self) -> str:
+        """Returns the SQL template with parameter markers."""
+        return ''.join(self._sql)
+
+    @property
+    def values(self) -> list[Any]:
+        """Returns the values in order of their parameter markers."""
+        return self._values
+
+    def query(self) -> tuple[str, Union[list[Any], dict[str, Any]]]:
+        """Returns the SQL string and the bind parameters."""
+        param = self.engine.param
+        return (param.template(self.template), param.parameters(self._values))
+
+    def query_string(self) -> str:
+        """Returns the query string with inlined values for debugging."""
+        head, *tail = self.template.split(PARAM)
+        return head + ''.join(
+            render(value) + sql for value, sql in zip(self._values, tail)
+        )
+
+
+def render(value: Any) -> str:
+    """Renders a value as an SQL literal for debugging."""
+
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+
+    if isinstance(value, (float, int)):
+        return repr(value)
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"X'{bytes(value).hex()}'"
+
+    return "'" + str(value).replace("'", "''") + "'"
@@ -1,14 +1,398 @@
 """Database definitions."""
 
+from __future__ import annotations
+from contextlib import contextmanager
+from os import getpid
+from threading import local
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+
+from dcorm.context import Context
 from dcorm.engine import Engine
+from dcorm.pool import BasePool, Connection, ConnectionPool
+
+if TYPE_CHECKING:
+    from dcorm.explain import PlanCheck
+    from dcorm.result_cache import ResultCache
+
+
+__all__ = ['BaseDatabase', 'Database']
+
+
+BEGIN = 'BEGIN'
+Parameters = Union[list[Any], dict[str, Any]]
+
+
+class Lease:    # pylint: disable=R0903
+    """A connection used by a thread or by a task and the tasks it spawns."""
+
+    __slots__ = ('connection', 'references', 'transactions', 'written')
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.references = 0
+        self.transactions = 0
+        self.written: set[str] = set()   # Tables written in the transaction.
+
+
+class BaseDatabase:
+    """Base class of synchronous and asynchronous databases.
+
+    Subclasses configure the SQL engine and the DB-API 2.0 driver module.
+    Instances hold a connection pool and optionally a cache of the
+    results of select queries and a check of the queries' plans.
+    Positional and excess keyword arguments are passed on to the
+    driver's connect() function. Transactions are begun explicitly,
+    so connections must not begin transactions implicitly.
+
+    A connection is leased to the current thread or task, until
+    all its acquisitions have been released. Subclasses track the
+    current lease and perform the I/O.
+    """
+
+    driver: Optional[ModuleType] = None
+    pool_type: type[BasePool] = BasePool
+
+    def __init_subclass__(
+            cls, *,
+            engine: Optional[Engine] = None,
+            driver: Optional[ModuleType] = None
+    ):
+        """Sets the database engine and driver."""
+        if engine is not None:
+            cls.engine = engine
+
+        if driver is not None:
+            cls.driver = driver
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            *args: Any,
+            schema: Optional[str] = None,
+            min_connections: int = 0,
+            max_connections: int = 8,
+            idle_timeout: Optional[float] = None,
+            timeout: Optional[float] = None,
+            result_cache: Optional[ResultCache] = None,
+            plan_check: Optional[PlanCheck] = None,
+            **kwargs: Any
+    ):
+        self.schema = schema
+        self.args = args
+        self.kwargs = kwargs
+        self.result_cache = result_cache
+        self.plan_check = plan_check
+        self.pool = self.pool_type(
+            self.connect,
+            min_size=min_connections,
+            max_size=max_connections,
+            idle_timeout=idle_timeout,
+            timeout=timeout,
+            check=self.ping
+        )
+        self._leases: dict[int, Lease] = {}
+
+    @property
+    def _lease(self) -> Optional[Lease]:
+        """Returns the current thread's or task's lease."""
+        raise NotImplementedError()
+
+    @_lease.setter
+    def _lease(self, lease: Lease) -> None:
+        """Sets the current thread's or task's lease."""
+        raise NotImplementedError()
+
+    @property
+    def in_transaction(self) -> bool:
+        """Checks whether the current thread or task is in a transaction."""
+        return (lease := self._lease) is not None and bool(
+            lease.transactions)
+
+    def connect(self) -> Any:
+        """Opens a new connection."""
+        raise NotImplementedError()
+
+    def ping(self, connection: Connection) -> Any:
+        """Checks whether the connection is usable."""
+        raise NotImplementedError()
+
+    def compile(self, obj: Any) -> tuple[str, Parameters]:
+        """Compiles the given object into SQL and parameters."""
+        return Context(self.engine).sql(obj).query()
+
+    def _leased(self) -> Optional[Connection]:
+        """Returns the current lease's connection and references
+        it again, or returns None if there is no such connection.
+        """
+        if (lease := self._lease) is None or not lease.references:
+            return None
+
+        lease.references += 1
+        return lease.connection
+
+    def _lease_connection(self, connection: Connection) -> Connection:
+        """Leases a connection checked out of the pool."""
+        lease = self._leases[id(connection)] = Lease(connection)
+        lease.references = 1
+        self._lease = lease
+        return connection
+
+    def _unlease(self, connection: Connection) -> bool:
+        """Drops a reference to a leased connection and returns
+        whether the connection is to be returned to the pool.
+        """
+        lease = self._leases[id(connection)]
+        lease.references -= 1
+
+        if lease.references:
+            return False
+
+        del self._leases[id(connection)]
+        return True
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """Invalidates the cached results read from the tables.
+
+        Within a transaction, concurrent queries may cache results read
+        before it ends. Thus, the results are invalidated again when the
+        outermost transaction commits or rolls back.
+        """
+        if (cache := self.result_cache) is None:
+            return
+
+        cache.invalidate(tables := set(tables))
+
+        if (lease := self._lease) is not None and lease.transactions:
+            lease.written.update(tables)
+
+    def _ended(self, lease: Lease) -> None:
+        """Invalidates the cached results read from the
+        tables written in the ended outermost transaction.
+        """
+        written, lease.written = lease.written, set()
+
+        if written and (cache := self.result_cache) is not None:
+            cache.invalidate(written)
+
+    def _is_transaction_open(self, connection: Connection) -> bool:
+        """Checks whether the connection is in a transaction."""
+        return bool(self._leases[id(connection)].transactions)
+
+
+class Database(BaseDatabase):
+    """Base class for databases.
+
+    Connections are leased to threads.
+    """
+
+    pool_type = ConnectionPool
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._pid = getpid()
+        self._local = local()
+
+    @property
+    def _state(self) -> local:
+        """Returns the thread-local state."""
+        if self._pid != getpid():
+            self._pid = getpid()
+            self._local = local()
+            self._leases.clear()
+
+        return self._local
+
+    @property
+    def _lease(self) -> Optional[Lease]:
+        return getattr(self._state, 'lease', None)
+
+    @_lease.setter
+    def _lease(self, lease: Lease) -> None:
+        self._state.lease = lease
+
+    def connect(self) -> Connection:
+        """Opens a new connection."""
+        if self.driver is None:
+            raise NotImplementedError(f'No driver set on {type(self)}.')
+
+        return self.driver.connect(*self.args, **self.kwargs)
+
+    def ping(self, connection: Connection) -> bool:
+        """Checks whether the connection is usable."""
+        cursor = connection.cursor()
+
+        try:
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+        finally:
+            cursor.close()
+
+        return True
+
+    def acquire(self) -> Connection:
+        """Returns the current thread's connection.
+
+        The first call checks a connection out of the pool.
+        Each call must be matched by a call to release(),
+        which may happen on another thread.
+        """
+        if (connection := self._leased()) is not None:
+            return connection
+
+        return self._lease_connection(self.pool.acquire())
+
+    def release(self, connection: Connection, *,
+                discard: bool = False) -> None:
+        """Releases a connection acquired by acquire()."""
+        if self._unlease(connection):
+            self.pool.release(connection, discard=discard)
+
+    def autocommit(self, connection: Connection) -> None:
+        """Commits unless the connection is in a transaction."""
+        if not self._is_transaction_open(connection):
+            connection.commit()
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """Yields the current thread's connection."""
+        connection = self.acquire()
+
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def atomic(self) -> Iterator[Connection]:
+        """Runs the block in a transaction.
+
+        The outermost block begins the transaction explicitly,
+        nested blocks use savepoints.
+        """
+        with self.connection() as connection:
+            lease = self._leases[id(connection)]
+            execute(connection, begin(depth := lease.transactions))
+            lease.transactions += 1
+
+            try:
+                yield connection
+            except BaseException:
+                if depth:
+                    execute_all(connection, rollback_savepoint(depth))
+                else:
+                    connection.rollback()
+
+                raise
+            else:
+                if depth:
+                    execute_all(connection, release_savepoint(depth))
+                else:
+                    connection.commit()
+            finally:
+                lease.transactions = depth
+
+                if not depth:
+                    self._ended(lease)
+
+    @contextmanager
+    def cursor(self) -> Iterator[Any]:
+        """Yields a cursor.
+
+        Outside of transactions, changes are committed when the block exits.
+        """
+        with self.connection() as connection:
+            cursor = connection.cursor()
+
+            try:
+                yield cursor
+            except BaseException:
+                if not self.in_transaction:
+                    connection.rollback()
+
+                raise
+            else:
+                self.autocommit(connection)
+            finally:
+                cursor.close()
+
+    def execute(self, sql: str, parameters: Parameters = ()) -> int:
+        """Executes an SQL statement and returns the amount of rows."""
+        with self.cursor() as cursor:
+            cursor.execute(sql, parameters)
+            return cursor.rowcount
+
+    def executemany(self, sql: str,
+                    parameters: Iterable[Parameters]) -> int:
+        """Executes an SQL statement for each set of parameters
+        and returns the amount of rows.
+        """
+        with self.cursor() as cursor:
+            cursor.executemany(sql, parameters)
+            return cursor.rowcount
+
+    def fetchall(self, sql: str, parameters: Parameters = ()) -> list[Any]:
+        """Executes an SQL statement and returns all rows."""
+        with self.cursor() as cursor:
+            cursor.execute(sql, parameters)
+            return cursor.fetchall()
+
+    def close(self) -> None:
+        """Closes all idle connections."""
+        self.pool.close()
+
+
+def get_database(database: Optional[BaseDatabase],
+                 default: Optional[BaseDatabase]) -> BaseDatabase:
+    """Returns the given database or else the default database."""
+
+    if database is None and (database := default) is None:
+        raise ValueError('No database to execute the query on.')
+
+    return database
+
+
+def begin(depth: int) -> str:
+    """Returns the statement beginning a transaction
+    or, within a transaction, a savepoint.
+    """
+
+    return f'SAVEPOINT {savepoint(depth)}' if depth else BEGIN
+
+
+def savepoint(depth: int) -> str:
+    """Returns the name of the savepoint at the given transaction depth."""
+
+    return f'dcorm_{depth}'
+
+
+def release_savepoint(depth: int) -> tuple[str, ...]:
+    """Returns the statements releasing the savepoint."""
+
+    return (f'RELEASE SAVEPOINT {savepoint(depth)}',)
+
+
+def rollback_savepoint(depth: int) -> tuple[str, ...]:
+    """Returns the statements rolling back and releasing the savepoint."""
+
+    return (
+        f'ROLLBACK TO SAVEPOINT {savepoint(depth)}',
+        f'RELEASE SAVEPOINT {savepoint(depth)}'
+    )
+
+
+def execute(connection: Connection, sql: str) -> None:
+    """Executes a statement without parameters on the connection."""
 
+    cursor = connection.cursor()
 
-__all__ = ['Database']
+    try:
+        cursor.execute(sql)
+    finally:
+        cursor.close()
 
 
-class Database:     # pylint: disable=R0903
-    """Base class for databases."""
+def execute_all(connection: Connection, statements: Iterable[str]) -> None:
+    """Executes statements without parameters on the connection."""
 
-    def __init_subclass__(cls, *, engine: Engine):
-        """Sets the database engine."""
-        cls.engine = engine
+    for statement in statements:
+        execute(connection, statement)
@@ -0,0 +1,196 @@
+"""Loading of deferred columns."""
+
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional
+
+from dcorm.column import Column
+from dcorm.prefetch import Steps, arun, chunks, run
+
+
+__all__ = ['DeferredLoader', 'aload']
+
+
+Fetch = Callable[[Column, Column, tuple[Any, ...]], Iterable[Any]]
+AsyncFetch = Callable[
+    [Column, Column, tuple[Any, ...]], Awaitable[list[Any]]]
+
+
+class DeferredLoader:
+    """Loads a deferred column for a batch of records at once.
+
+    The records are fetched by their primary keys,
+    with one query per chunk of keys. Records whose deferred
+    columns are all loaded are detached from the loader, so
+    that it does not keep the rest of the batch alive.
+    """
+
+    __slots__ = ('records', 'chunk_size', 'fetch', 'afetch')
+
+    def __init__(
+            self,
+            records: list[Any],
+            chunk_size: int,
+            *,
+            fetch: Optional[Fetch] = None,
+            afetch: Optional[AsyncFetch] = None
+    ):
+        self.records = records
+        self.chunk_size = chunk_size
+        self.fetch = fetch
+        self.afetch = afetch
+
+    def load(self, record: Any, column: Column) -> Any:
+        """Loads the column for the records still missing
+        its value and returns the value of the given record.
+        """
+        if self.fetch is None:
+            raise RuntimeError(
+                f'Deferred field {column.field.name!r} of asynchronous '
+                'results must be loaded with aload().'
+            )
+
+        run(loading(type(record), column, self.records, self.chunk_size),
+            self.fetch)
+        self.release()
+        return value_of(record, column.field.name)
+
+    async def aload(self, model: Any, column: Column) -> None:
+        """Asynchronously loads the column for
+        the records still missing its value.
+        """
+        if self.afetch is None:
+            raise RuntimeError('Results are not asynchronous.')
+
+        await arun(loading(model, column, self.records, self.chunk_size),
+                   self.afetch)
+        self.release()
+
+    def release(self) -> None:
+        """Detaches the records whose deferred columns are all loaded."""
+        pending = []
+
+        for record in self.records:
+            if record is None:
+                continue
+
+            if all(is_loaded(record, name) for name in deferred(record)):
+                object.__delattr__(record, '__deferred__')
+            else:
+                pending.append(record)
+
+        self.records = pending
+
+
+async def aload(records: Iterable[Any], column: Column) -> None:
+    """Asynchronously loads a deferred column for records
+    of asynchronous results, with one query per batch.
+    """
+
+    loaders = {}
+
+    for record in records:
+        if (loader := getattr(record, '__deferred__', None)) is not None:
+            loaders[id(loader)] = (loader, type(record))
+
+    for loader, model in loaders.values():
+        await loader.aload(model, column)
+
+
+def loading(model: Any, column: Column, records: Iterable[Any],
+            chunk_size: int) -> Steps:
+    """Yields the queries loading the column for the model's records
+    still missing its value by chunks of their primary keys and stores
+    the sent back values.
+    """
+
+    key, column, pending = missing(model, column, records)
+
+    for keys in chunks(list(pending), chunk_size):
+        store_all(pending, key, column, (yield key, column, keys))
+
+
+def missing(model: Any, column: Column, records: Iterable[Any]) -> tuple[
+        Column, Column, dict[Any, Any]]:
+    """Returns the model's primary key and column and the
+    records missing the column's value by their keys.
+    """
+
+    key = model.__column_table__.primary_key
+    column = model.__column_table__.by_name[name := column.field.name]
+    return key, column, {
+        value_of(record, key.field.name): record for record in records
+        if isinstance(record, model) and not is_loaded(record, name)
+    }
+
+
+def store_all(pending: dict[Any, Any], key: Column, column: Column,
+              rows: Iterable[Any]) -> None:
+    """Stores the loaded values of the column by the records' keys."""
+
+    convert = key.table.__converters__.get(key.field.name)
+
+    for value, loaded in rows:
+        if convert is not None:
+            value = convert(value)
+
+        if (record := pending.get(value)) is not None:
+            store(record, column.field.name, loaded)
+
+
+def is_loaded(record: Any, name: str) -> bool:
+    """Checks whether the record has a value for the field."""
+
+    if (slot := slot_of(record, name)) is None:
+        return name in record.__dict__
+
+    try:
+        slot.__get__(record, type(record))
+    except AttributeError:
+        return False
+
+    return True
+
+
+def deferred(record: Any) -> Iterator[str]:
+    """Yields the names of the record's deferred fields."""
+
+    table = type(record).__column_table__
+    return (name for name in table.names if name not in table.selected_names)
+
+
+def value_of(record: Any, name: str) -> Any:
+    """Returns the loaded value of the field."""
+
+    if (slot := slot_of(record, name)) is None:
+        try:
+            return record.__dict__[name]
+        except KeyError:
+            pass
+    else:
+        try:
+            return slot.__get__(record, type(record))
+        except AttributeError:
+            pass
+
+    raise LookupError(f'{type(record).__name__} record no longer exists.')
+
+
+def store(record: Any, name: str, value: Any) -> None:
+    """Stores the converted database value of the
+    field, bypassing Model.__setattr__().
+    """
+
+    if value is not None and (
+            converter := type(record).__converters__.get(name)) is not None:
+        value = converter(value)
+
+    if (slot := slot_of(record, name)) is None:
+        record.__dict__[name] = value
+    else:
+        slot.__set__(record, value)
+
+
+def slot_of(record: Any, name: str) -> Optional[Any]:
+    """Returns the slot member of the field if the model is slotted."""
+
+    return type(record).__slot_members__.get(name)
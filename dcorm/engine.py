@@ -1,83 +1,88 @@
 """SQL engine configuration."""
 
-from __future__ import annotations
-from contextlib import suppress
-from dataclasses import KW_ONLY, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Optional, Union
 
 from dcorm.csq import CSQParens
-from dcorm.field_types import FieldType
+from dcorm.field_types import SQL_TYPES, FieldType
 from dcorm.literal import Literal
+from dcorm.operations import Operation
 from dcorm.operators import Operator
+from dcorm.ordering import Nulls, Ordering
+from dcorm.paramstyle import ParamStyle
+from dcorm.statement_cache import StatementCache
 
 
 __all__ = ['Engine']
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class Engine:   # pylint: disable=R0902
-    """An SQL engine."""
+    """An SQL engine.
 
-    field_types: dict[str, FieldType] = field(default_factory=dict)
+    Engines are immutable and may be shared between threads.
+    The state of a single compilation is held by a Context.
+    Literals are rendered once per engine, with the engine's
+    operator substitutions applied.
+    """
+
+    field_types: dict[str, Union[FieldType, str]] = field(
+        default_factory=dict)
     operators: dict[Operator, Operator] = field(default_factory=dict)
-    param: str = '?'
+    param: ParamStyle = ParamStyle.QMARK
     quotes: str = '"{}"'
     csq_parens: CSQParens = CSQParens.NEVER
     for_update: bool = False
     index_schema_prefix: bool = False
     index_using_precedes_table: bool = False
+    index_include: bool = False    # Supports INCLUDE columns of indexes.
+    references_schema: bool = True  # Qualifies referenced tables by schema.
     limit_max: Optional[int] = None
-    nulls_ordering: bool = False
-    _: KW_ONLY
-    _sql: list[str] = field(default_factory=list)
-    _values: list[str] = field(default_factory=list)
-
-    def quote(self, string: str) -> str:
-        """Quotes the given string."""
-        return self.quotes.format(string)
-
-    def raw_value(self, frmt: str, values: Iterable[Any]) -> Engine:
-        """Append values with a pre-defined format string."""
-        self._sql.append(frmt)
-        self._values.extend(values)
-        return self
-
-    def value(self, value: Any) -> Engine:
-        """Set a value."""
-        if isinstance(value, (bool, float, int)):
-            self._sql.append('%s')
-        elif isinstance(value, str):
-            self._sql.append("'%s'")
+    nulls_ordering: bool = False   # Supports NULLS FIRST / LAST.
+    max_params: Optional[int] = None
+    explain: str = 'EXPLAIN'   # Prefix of statements returning query plans.
+    statement_cache: Optional[StatementCache] = None
+    literals: dict[Any, str] = field(
+        default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        for enum in (Operation, Operator, Ordering, Nulls):
+            for member in enum:
+                self.literal(member)
+
+    def literal(self, obj: Union[Enum, Literal]) -> str:
+        """Returns the rendered literal."""
+        try:
+            return self.literals[obj]
+        except KeyError:
+            pass
+
+        if isinstance(obj, Operator):
+            string = str(self.operators.get(obj, obj).value)
+        elif isinstance(obj, Enum):
+            string = self.literal(obj.value)
+        elif isinstance(obj, Literal):
+            string = str(obj)
         else:
-            raise TypeError(f'Cannot serialize value: {type(value)}')
+            raise TypeError(f'Invalid literal type: {type(obj)}')
 
-        self._values.append(value)
-        return self
+        self.literals[obj] = string
+        return string
 
-    def sql(self, obj: Any) -> Engine:
-        """Returns an SQL object from any given object."""
-        with suppress(AttributeError):
-            return obj.__sql__(self)
+    def sql_type(self, field_type: FieldType) -> str:
+        """Returns the SQL type of a field type.
 
-        return self.value(obj)
+        The engine's field types override the default SQL types
+        by field type name, with either an SQL type or a field type.
+        """
+        sql_type = self.field_types.get(field_type.name, field_type)
 
-    def literal(self, obj: Union[Enum, Literal]) -> Engine:
-        """Processes a literal."""
-        if isinstance(obj, Enum):
-            return self.literal(obj.value)
+        if isinstance(sql_type, FieldType):
+            return SQL_TYPES[sql_type]
 
-        if isinstance(obj, Literal):
-            self._sql.append(str(obj))
-            return self
+        return sql_type
 
-        raise TypeError(f'Invalid literal type: {type(obj)}')
-
-    def query(self) -> tuple[str, list[str]]:
-        """Returns the query parameters."""
-        return (''.join(self._sql), self._values)
-
-    def query_string(self) -> str:
-        """Returns the query string."""
-        template, values = self.query()
-        return template % tuple(values)
+    def quote(self, string: str) -> str:
+        """Quotes the given string."""
+        return self.quotes.format(string)
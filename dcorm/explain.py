@@ -0,0 +1,235 @@
+"""Query plans."""
+
+from __future__ import annotations
+from re import compile as regex
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Optional
+from typing import Sequence, Union
+from warnings import warn
+
+from dcorm.database import Database, Parameters
+
+if TYPE_CHECKING:
+    from dcorm.aio import AsyncDatabase
+
+
+__all__ = ['PlanCheck', 'PlanNode', 'aexplain', 'explain', 'parse_plan']
+
+
+SCAN = regex(r'SCAN (?:TABLE )?(\S+)(?: AS (\S+))?$')
+STEP = regex(r'(?:SCAN|SEARCH) (?:TABLE )?(\S+)(?: AS (\S+))?')
+TEMP_B_TREE = 'USE TEMP B-TREE'
+
+
+class PlanNode:
+    """A node of a query plan.
+
+    The root node has no detail and holds the plan's top level steps.
+    """
+
+    __slots__ = ('id', 'detail', 'children')
+
+    def __init__(self, id: int, detail: str):   # pylint: disable=W0622
+        self.id = id
+        self.detail = detail
+        self.children: list[PlanNode] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.id!r}, {self.detail!r})'
+
+    def __str__(self) -> str:
+        return '\n'.join(
+            '  ' * depth + node.detail for depth, node in self._lines(0))
+
+    def __iter__(self) -> Iterator[PlanNode]:
+        """Yields all descendant nodes in depth-first order."""
+        for child in self.children:
+            yield child
+            yield from child
+
+    def _lines(self, depth: int) -> Iterator[tuple[int, PlanNode]]:
+        """Yields the descendant nodes with their depths."""
+        for child in self.children:
+            yield depth, child
+            yield from child._lines(depth + 1)  # pylint: disable=W0212
+
+    @property
+    def scans(self) -> list[str]:
+        """Returns the names of the fully scanned tables.
+
+        Scans of indexes, subqueries and constant rows are not included.
+        """
+        return [
+            match.group(2) or match.group(1) for node in self
+            if (match := SCAN.match(node.detail)) is not None
+        ]
+
+    @property
+    def temp_sorts(self) -> list[str]:
+        """Returns the details of sorts using temporary B-trees."""
+        return [
+            node.detail for node in self
+            if node.detail.startswith(TEMP_B_TREE)
+        ]
+
+    @property
+    def temp_sort_tables(self) -> list[tuple[Optional[str], str]]:
+        """Returns the names of the tables read by the steps preceding
+        sorts using temporary B-trees, if any, and the sorts' details.
+        """
+        result = []
+        name = None
+
+        for node in self:
+            if (match := STEP.match(node.detail)) is not None:
+                name = match.group(2) or match.group(1)
+            elif node.detail.startswith(TEMP_B_TREE):
+                result.append((name, node.detail))
+
+        return result
+
+
+class PlanCheck:
+    """Checks the plans of executed queries in development.
+
+    If a query fully scans a table with at least the threshold amount of
+    rows, or sorts with a temporary B-tree after reading such a table, a
+    warning is issued or, optionally, a RuntimeError raised. The sizes of
+    the tables are counted only for queries with such plans. Set it as a
+    database's plan check, e.g. in tests against fixtures. Queries that
+    are iterated asynchronously without aexecute() or served from the
+    result cache are not checked.
+    """
+
+    __slots__ = ('threshold', 'error', 'scans', 'sorts')
+
+    def __init__(self, threshold: int = 1000, *, error: bool = False,
+                 scans: bool = True, sorts: bool = True):
+        self.threshold = threshold
+        self.error = error
+        self.scans = scans
+        self.sorts = sorts
+
+    def check(self, database: Database, sql: str, parameters: Parameters,
+              tables: Mapping[str, str]) -> None:
+        """Checks the plan of the query on the given
+        tables by their names in the plan.
+        """
+        plan = explain(database, sql, parameters)
+
+        for name, problem in self._problems(plan, tables):
+            self._report(problem, count(database, name), sql)
+
+    async def acheck(self, database: AsyncDatabase, sql: str,
+                     parameters: Parameters,
+                     tables: Mapping[str, str]) -> None:
+        """Asynchronously checks the plan of the query on
+        the given tables by their names in the plan.
+        """
+        plan = await aexplain(database, sql, parameters)
+
+        for name, problem in self._problems(plan, tables):
+            self._report(problem, await acount(database, name), sql)
+
+    def _problems(self, plan: PlanNode, tables: Mapping[str, str]
+                  ) -> Iterator[tuple[str, str]]:
+        """Yields the tables to count and the problems of the plan."""
+        if self.scans:
+            for name in dict.fromkeys(plan.scans):
+                if (table := tables.get(name)) is not None:
+                    yield table, f'Full scan of table {table!r}'
+
+        if not self.sorts:
+            return
+
+        sorts: dict[str, str] = {}
+
+        for name, detail in plan.temp_sort_tables:
+            if (table := tables.get(name)) is not None:
+                sorts.setdefault(table, detail)
+
+        for table, detail in sorts.items():
+            yield table, (
+                f'Temporary B-tree sort ({detail}) reading table {table!r}')
+
+    def _report(self, problem: str, size: int, sql: str) -> None:
+        """Reports a problem of the plan if the table is large enough."""
+        if size < self.threshold:
+            return
+
+        message = f'{problem} with {size} rows: {sql}'
+
+        if self.error:
+            raise RuntimeError(message)
+
+        warn(message)
+
+
+def parse_plan(rows: Iterable[Sequence[Any]]) -> PlanNode:
+    """Returns the query plan of the rows returned by EXPLAIN.
+
+    Rows of SQLite's EXPLAIN QUERY PLAN, i.e. of an ID, the parent ID,
+    an unused value and the detail, form a tree. Other rows become top
+    level steps, whose details are their values separated by spaces.
+    """
+
+    root = PlanNode(0, '')
+    nodes = {0: root}
+
+    for index, row in enumerate(rows, start=1):
+        if len(row) == 4 and isinstance(row[0], int):
+            node = nodes[row[0]] = PlanNode(row[0], str(row[3]))
+            nodes.get(row[1], root).children.append(node)
+        else:
+            root.children.append(PlanNode(index, ' '.join(map(str, row))))
+
+    return root
+
+
+def explain(database: Database, sql: str,
+            parameters: Parameters = ()) -> PlanNode:
+    """Returns the plan of the query."""
+
+    return parse_plan(database.fetchall(
+        f'{database.engine.explain} {sql}', parameters))
+
+
+async def aexplain(database: AsyncDatabase, sql: str,
+                   parameters: Parameters = ()) -> PlanNode:
+    """Asynchronously returns the plan of the query."""
+
+    return parse_plan(await database.fetchall(
+        f'{database.engine.explain} {sql}', parameters))
+
+
+def count(database: Database, table: str) -> int:
+    """Returns the amount of rows of a table."""
+
+    return database.fetchall(count_statement(database, table))[0][0]
+
+
+async def acount(database: AsyncDatabase, table: str) -> int:
+    """Asynchronously returns the amount of rows of a table."""
+
+    return (await database.fetchall(count_statement(database, table)))[0][0]
+
+
+def count_statement(database: Union[Database, AsyncDatabase],
+                    table: str) -> str:
+    """Returns a statement counting the rows of a schema-qualified table."""
+
+    return 'SELECT COUNT(*) FROM ' + '.'.join(
+        map(database.engine.quote, table.split('.')))
+
+
+def plan_names(tables: Iterable[str],
+               aliases: Optional[Mapping[str, str]] = None) -> dict[str, str]:
+    """Returns the schema-qualified table names by their names
+    in query plans, i.e. their unqualified names or aliases.
+    """
+
+    result = {table.rsplit('.', 1)[-1]: table for table in tables}
+
+    if aliases is not None:
+        result.update(aliases)
+
+    return result
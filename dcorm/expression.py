@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Hashable, Optional
 
-from dcorm.engine import Engine
-from dcorm.expression_base import ExpressionBase
+from dcorm.context import Context
+from dcorm.expression_base import ExpressionBase, Junction
+from dcorm.fingerprint import shape
 from dcorm.operators import Operator
 
 
 __all__ = ['Expression']
 
 
-@dataclass(eq=False)
+UNARY = {Operator.NOT, Operator.BITWISE_NEGATION}
+
+
+@dataclass(eq=False, slots=True)
 class Expression(ExpressionBase):
     """Conditional expression for WHERE clauses."""
 
@@ -20,8 +24,29 @@ class Expression(ExpressionBase):
     operator: Operator
     rhs: Optional[Any] = None   # Allow for unary operators.
 
-    def __sql__(self, engine: Engine) -> Engine:
-        if self.rhs is None:
-            return engine.literal(self.operator).sql(self.lhs)
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        if self.operator in UNARY:
+            return (Expression, self.operator, shape(self.lhs, values))
+
+        return (
+            Expression,
+            shape(self.lhs, values),
+            self.operator,
+            shape(self.rhs, values)
+        )
+
+    def __sql__(self, context: Context) -> Context:
+        if self.operator in UNARY:
+            return operand(context.literal(self.operator), self.lhs)
+
+        return operand(
+            operand(context, self.lhs).literal(self.operator), self.rhs)
+
+
+def operand(context: Context, obj: Any) -> Context:
+    """Renders an operand, enclosing nested expressions in parentheses."""
+
+    if isinstance(obj, (Expression, Junction)):
+        return context.raw_value('(', ()).sql(obj).raw_value(')', ())
 
-        return engine.sql(self.lhs).literal(self.operator).sql(self.rhs)
+    return context.sql(obj)
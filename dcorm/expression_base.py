@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 from contextlib import suppress
-from typing import Any, Optional, Union
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Union
 
+from dcorm.containers import CONTAINERS
+from dcorm.fingerprint import shape
 from dcorm.operators import Operator
 
+if TYPE_CHECKING:
+    from dcorm.context import Context
 
-__all__ = ['ExpressionBase']
+
+__all__ = ['ExpressionBase', 'Junction', 'junction']
 
 
 class ExpressionBase:
     """Base class for expressions."""
 
+    __slots__ = ()
+    # __eq__() builds expressions, so hash by identity. Use
+    # fingerprint() for structural keys.
+    __hash__ = object.__hash__
+
     def __init_subclass__(cls, typ: Optional[type] = None):
-        cls.__expression_type__ = typ or cls
+        # Classes re-created by dataclass(slots=True) do not receive typ,
+        # but inherit an explicitly set type through their namespace.
+        if typ is not None:
+            cls.__expression_type__ = typ
+
+    @property
+    def __expression_type__(self) -> type:
+        """Returns the type of expressions derived from this one."""
+        return type(self)
 
     def __invert__(self) -> ExpressionBase:
         with suppress(AttributeError):
@@ -23,7 +42,6 @@ class ExpressionBase:
 
         return self.__expression_type__(self, Operator.NOT)
 
-
     def __and__(self, other: Any) -> Union[ExpressionBase, bool]:
         if other is True:
             return self
@@ -31,7 +49,7 @@ class ExpressionBase:
         if other is False:
             return False
 
-        return self.__expression_type__(self, Operator.AND, other)
+        return junction(Operator.AND, self, other)
 
     def __rand__(self, other: Any) -> Union[ExpressionBase, bool]:
         if other is True:
@@ -40,7 +58,7 @@ class ExpressionBase:
         if other is False:
             return False
 
-        return self.__expression_type__(other, Operator.AND, self)
+        return junction(Operator.AND, other, self)
 
     def __or__(self, other: Any) -> Union[ExpressionBase, bool]:
         if other is True:
@@ -49,7 +67,7 @@ class ExpressionBase:
         if other is False:
             return self
 
-        return self.__expression_type__(self, Operator.OR, other)
+        return junction(Operator.OR, self, other)
 
     def __ror__(self, other: Any) -> Union[ExpressionBase, bool]:
         if other is True:
@@ -58,7 +76,7 @@ class ExpressionBase:
         if other is False:
             return self
 
-        return self.__expression_type__(other, Operator.OR, self)
+        return junction(Operator.OR, other, self)
 
     def __add__(self, other: Any) -> ExpressionBase:
         return self.__expression_type__(self, Operator.ADD, other)
@@ -97,7 +115,7 @@ class ExpressionBase:
         return self.__expression_type__(self, Operator.EQ, other)
 
     def __lt__(self, other: Any) -> ExpressionBase:
-        return self.__expression_type__(self, Operator.EQ, other)
+        return self.__expression_type__(self, Operator.LT, other)
 
     def __le__(self, other: Any) -> ExpressionBase:
         return self.__expression_type__(self, Operator.LE, other)
@@ -112,9 +130,12 @@ class ExpressionBase:
         if other is None:
             return self.__expression_type__(self, Operator.IS_NOT, other)
 
-        return self.__expression_type__(self, Operator.GE, other)
+        return self.__expression_type__(self, Operator.NE, other)
 
     def __lshift__(self, other: Any) -> ExpressionBase:
+        if isinstance(other, CONTAINERS):
+            other = tuple(other)    # Consume iterators only once.
+
         return self.__expression_type__(self, Operator.IN, other)
 
     def __rshift__(self, other: Any) -> ExpressionBase:
@@ -131,3 +152,58 @@ class ExpressionBase:
 
     def __rmatmul__(self, other: Any) -> ExpressionBase:
         return self.__expression_type__(other, Operator.CONCAT, self)
+
+
+@dataclass(eq=False, slots=True)
+class Junction(ExpressionBase):
+    """Conditions joined by AND or OR.
+
+    Chains of the same operator are kept flat, so
+    that they are compiled without deep recursion.
+    """
+
+    operator: Operator
+    operands: tuple[Any, ...]
+
+    @property
+    def __expression_type__(self) -> type:
+        for operand in self.operands:
+            if isinstance(operand, ExpressionBase):
+                return operand.__expression_type__
+
+        return type(self)
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            Junction,
+            self.operator,
+            tuple(shape(operand, values) for operand in self.operands)
+        )
+
+    def __sql__(self, context: Context) -> Context:
+        operator = self.operator
+
+        for index, operand in enumerate(self.operands):
+            if index:
+                context.literal(operator)
+
+            if isinstance(operand, Junction):
+                context.raw_value('(', ()).sql(operand).raw_value(')', ())
+            else:
+                context.sql(operand)
+
+        return context
+
+
+def junction(operator: Operator, lhs: Any, rhs: Any) -> Junction:
+    """Joins two conditions, flattening junctions of the same operator."""
+
+    operands = []
+
+    for operand in (lhs, rhs):
+        if isinstance(operand, Junction) and operand.operator is operator:
+            operands.extend(operand.operands)
+        else:
+            operands.append(operand)
+
+    return Junction(operator, tuple(operands))
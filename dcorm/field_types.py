@@ -1,30 +1,113 @@
 """Database field types."""
 
-from enum import Enum
+from dataclasses import Field
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum, unique
+from typing import Any
+from uuid import UUID
 
+from dcorm.hydration import field_hints, unwrap
 
-__all__ = ['FieldType']
 
+__all__ = ['SQL_TYPES', 'FieldType', 'field_types']
 
+
+@unique
 class FieldType(Enum):
-    """Database field types."""
+    """Database field types.
+
+    Their SQL types are given by SQL_TYPES, where
+    several field types may have the same SQL type.
+    The members' values are their names, since members
+    with equal values would be aliases of one another,
+    e.g. INT of AUTO. Use the sql property instead of
+    the value, which used to be the SQL type.
+    """
 
-    AUTO = 'INTEGER'
-    BIGAUTO = 'BIGINT'
+    AUTO = 'AUTO'
+    BIGAUTO = 'BIGAUTO'
     BIGINT = 'BIGINT'
     BLOB = 'BLOB'
-    BOOL = 'BOOLEAN'
+    BOOL = 'BOOL'
     CHAR = 'CHAR'
     DATE = 'DATE'
     DATETIME = 'DATETIME'
     DECIMAL = 'DECIMAL'
-    DEFAULT = ''
-    DOUBLE = 'REAL'
-    FLOAT = 'REAL'
-    INT = 'INTEGER'
+    DEFAULT = 'DEFAULT'
+    DOUBLE = 'DOUBLE'
+    FLOAT = 'FLOAT'
+    INT = 'INT'
     SMALLINT = 'SMALLINT'
     TEXT = 'TEXT'
     TIME = 'TIME'
-    UUID = 'TEXT'
-    UUIDB = 'BLOB'
+    UUID = 'UUID'
+    UUIDB = 'UUIDB'
     VARCHAR = 'VARCHAR'
+
+    @property
+    def sql(self) -> str:
+        """Returns the default SQL type."""
+        return SQL_TYPES[self]
+
+
+SQL_TYPES = {
+    FieldType.AUTO: 'INTEGER',
+    FieldType.BIGAUTO: 'BIGINT',
+    FieldType.BIGINT: 'BIGINT',
+    FieldType.BLOB: 'BLOB',
+    FieldType.BOOL: 'BOOLEAN',
+    FieldType.CHAR: 'CHAR',
+    FieldType.DATE: 'DATE',
+    FieldType.DATETIME: 'DATETIME',
+    FieldType.DECIMAL: 'DECIMAL',
+    FieldType.DEFAULT: '',
+    FieldType.DOUBLE: 'REAL',
+    FieldType.FLOAT: 'REAL',
+    FieldType.INT: 'INTEGER',
+    FieldType.SMALLINT: 'SMALLINT',
+    FieldType.TEXT: 'TEXT',
+    FieldType.TIME: 'TIME',
+    FieldType.UUID: 'TEXT',
+    FieldType.UUIDB: 'BLOB',
+    FieldType.VARCHAR: 'VARCHAR'
+}
+
+
+PYTHON_TYPES = {
+    bool: FieldType.BOOL,
+    bytes: FieldType.BLOB,
+    date: FieldType.DATE,
+    datetime: FieldType.DATETIME,
+    Decimal: FieldType.DECIMAL,
+    float: FieldType.DOUBLE,
+    int: FieldType.INT,
+    str: FieldType.TEXT,
+    time: FieldType.TIME,
+    UUID: FieldType.UUID
+}
+
+
+def field_types(model: type) -> dict[str, FieldType]:
+    """Returns the field types of a model's fields.
+
+    Fields may set their type with the field_type metadata.
+    Otherwise it is derived from the field's annotation.
+    """
+
+    hints = field_hints(model)
+    fields: dict[str, Field] = model.__dataclass_fields__
+    return {
+        name: field.metadata.get('field_type') or python_field_type(
+            hints[name])
+        for name, field in fields.items()
+    }
+
+
+def python_field_type(typ: Any) -> FieldType:
+    """Returns the field type of a Python type."""
+
+    try:
+        return PYTHON_TYPES.get(unwrap(typ), FieldType.DEFAULT)
+    except TypeError:   # Unhashable annotation.
+        return FieldType.DEFAULT
@@ -1,6 +1,7 @@
 """Field definitions."""
 
 from dataclasses import field as _field, Field
+from typing import Any
 
 
 __all__ = ['field']
@@ -25,7 +26,20 @@ def make_field(*args, **kwargs) -> Field:
 
 
 def field(*args, index: bool = False, primary: bool = False,
-          unique: bool = False, **kwargs) -> Field:
-    """Creates a field."""
+          unique: bool = False, references: Any = None, lazy: bool = False,
+          **kwargs) -> Field:
+    """Creates a field.
+
+    A field referencing a column, a model or the name of a model,
+    optionally followed by a dot and a field name, is a foreign key.
+    Models are referenced by their primary key.
+
+    Lazy fields are not selected with their model. Their values are
+    loaded by primary key on first access, for all records of the same
+    batch of results at once.
+    """
+    if references is not None:
+        kwargs['references'] = references
+
     return make_field(*args, index=index, primary=primary, unique=unique,
-                      **kwargs)
+                      lazy=lazy, **kwargs)
@@ -0,0 +1,56 @@
+"""Structural fingerprints of SQL nodes."""
+
+from typing import Any, Hashable, NamedTuple
+
+from dcorm.compiler import registered
+from dcorm.containers import CONTAINERS
+
+
+__all__ = ['Fingerprint', 'ShapeError', 'fingerprint', 'shape']
+
+
+class ShapeError(TypeError):
+    """Indicates that an object has no structural key."""
+
+
+class Fingerprint(NamedTuple):
+    """A node's structural key and its values in render order."""
+
+    key: Hashable
+    values: list[Any]
+
+
+def shape(obj: Any, values: list[Any]) -> Hashable:
+    """Returns the structural key of the given object.
+
+    Values that would be rendered as parameters are
+    appended to the given list in their render order.
+    Objects rendered by registered compilers may render
+    any SQL and parameters, so they have no such key.
+    """
+
+    if registered(typ := type(obj)):
+        raise ShapeError(f'Objects of {typ} have no structural key.')
+
+    try:
+        method = obj.__fingerprint__
+    except AttributeError:
+        if obj is None:
+            return None
+
+        if isinstance(obj, CONTAINERS):
+            items = tuple(obj)
+            values.extend(items)
+            return (tuple, len(items))
+
+        values.append(obj)
+        return type(obj)
+
+    return method(values)
+
+
+def fingerprint(obj: Any) -> Fingerprint:
+    """Returns the fingerprint of the given object."""
+
+    values = []
+    return Fingerprint(shape(obj, values), values)
@@ -0,0 +1,165 @@
+"""Conversion of database rows into records."""
+
+from dataclasses import Field
+from datetime import date, datetime, time
+from decimal import Decimal
+from types import NoneType, UnionType
+from typing import Any, Callable, Optional, Sequence, Union
+from typing import get_args, get_origin, get_type_hints
+from uuid import UUID
+
+
+__all__ = ['converters', 'field_hints', 'make_hydrator']
+
+
+Converter = Callable[[Any], Any]
+TRUSTED = {object, bytes, float, int, str}
+
+
+def convert_date(value: Any) -> date:
+    """Converts a database value into a date."""
+
+    if isinstance(value, date):
+        return value
+
+    return date.fromisoformat(value)
+
+
+def convert_datetime(value: Any) -> datetime:
+    """Converts a database value into a datetime."""
+
+    if isinstance(value, datetime):
+        return value
+
+    return datetime.fromisoformat(value)
+
+
+def convert_time(value: Any) -> time:
+    """Converts a database value into a time."""
+
+    if isinstance(value, time):
+        return value
+
+    return time.fromisoformat(value)
+
+
+def convert_uuid(value: Any) -> UUID:
+    """Converts a database value into a UUID."""
+
+    if isinstance(value, UUID):
+        return value
+
+    if isinstance(value, (bytes, memoryview)):
+        return UUID(bytes=bytes(value))
+
+    return UUID(value)
+
+
+CONVERTERS = {
+    bool: bool,
+    date: convert_date,
+    datetime: convert_datetime,
+    time: convert_time,
+    Decimal: Decimal,
+    UUID: convert_uuid
+}
+
+
+def unwrap(typ: Any) -> Any:
+    """Returns X for Optional[X] and the type itself otherwise."""
+
+    if get_origin(typ) not in {Union, UnionType}:
+        return typ
+
+    if len(args := [arg for arg in get_args(typ) if arg is not NoneType]) == 1:
+        return args[0]
+
+    return typ
+
+
+def make_converter(typ: Any) -> Optional[Converter]:
+    """Returns a converter for database values of the given type."""
+
+    if (typ := unwrap(typ)) in TRUSTED or not isinstance(typ, type):
+        return None
+
+    try:
+        return CONVERTERS[typ]
+    except KeyError:
+        pass
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, typ):
+            return value
+
+        return typ(value)
+
+    return convert
+
+
+def field_hints(model: type) -> dict[str, Any]:
+    """Returns the resolved type hints of a model's fields.
+
+    Fields whose annotations cannot be resolved keep their raw type.
+    """
+
+    try:
+        hints = get_type_hints(model)
+    except (NameError, TypeError):  # Unresolvable forward references.
+        hints = {}
+
+    fields: dict[str, Field] = model.__dataclass_fields__
+    return {
+        name: hints.get(name, field.type) for name, field in fields.items()
+    }
+
+
+def converters(model: type) -> dict[str, Optional[Converter]]:
+    """Returns the database value converters of a model's fields."""
+
+    hints = field_hints(model)
+    fields: dict[str, Field] = model.__dataclass_fields__
+    return {
+        name: field.metadata.get('converter') or make_converter(hints[name])
+        for name, field in fields.items()
+    }
+
+
+def make_hydrator(
+        model: type,
+        names: Sequence[str],
+        convert: dict[str, Optional[Converter]],
+        slots: dict[str, Any]
+) -> Callable[[Sequence[Any]], Any]:
+    """Generates a function that creates records of the model from rows,
+    whose values correspond to the given field names.
+
+    The values are stored directly in the records' __dict__ or slots,
+    bypassing Model.__setattr__().
+    """
+
+    namespace = {'cls': model, 'new': object.__new__}
+    items = []
+    setters = []
+
+    for index, name in enumerate(names):
+        if (converter := convert.get(name)) is None:
+            value = f'row[{index}]'
+        else:
+            namespace[f'c{index}'] = converter
+            value = f'None if (v := row[{index}]) is None else c{index}(v)'
+
+        if (slot := slots.get(name)) is None:
+            items.append(f'{name!r}: {value}')
+        else:
+            namespace[f's{index}'] = slot.__set__
+            setters.append(f'    s{index}(record, {value})\n')
+
+    source = 'def hydrate(row):\n    record = new(cls)\n'
+
+    if items:
+        source += f'    record.__dict__.update({{{", ".join(items)}}})\n'
+
+    source += ''.join(setters) + '    return record\n'
+    exec(source, namespace)     # pylint: disable=W0122
+    return namespace['hydrate']
@@ -0,0 +1,103 @@
+"""Identity maps of records."""
+
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional, Sequence
+
+from dcorm.results import RowFactory
+
+
+__all__ = ['IdentityMap']
+
+
+class IdentityMap:
+    """LRU cache of records keyed on their model and primary key."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._records: OrderedDict[tuple[Any, Hashable], Any] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, model: Any, key: Hashable) -> Optional[Any]:
+        """Returns the record if cached."""
+        with self._lock:
+            try:
+                record = self._records[model, key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._records.move_to_end((model, key))
+            self.hits += 1
+            return record
+
+    def add(self, model: Any, key: Hashable, record: Any) -> Any:
+        """Stores a record, evicting the least recently used one.
+
+        Returns the cached record if one has been stored meanwhile.
+        """
+        with self._lock:
+            record = self._records.setdefault((model, key), record)
+            self._records.move_to_end((model, key))
+
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+
+            return record
+
+    def invalidate(self, model: Any,
+                   keys: Optional[Sequence[Hashable]] = None) -> None:
+        """Removes the given or all records of the model."""
+        with self._lock:
+            if keys is not None:
+                for key in keys:
+                    self._records.pop((model, key), None)
+
+                return
+
+            for identity in [
+                    identity for identity in self._records
+                    if identity[0] is model
+            ]:
+                del self._records[identity]
+
+    def clear(self) -> None:
+        """Clears the identity map."""
+        with self._lock:
+            self._records.clear()
+            self.hits = self.misses = 0
+
+    def hydrator(self, model: Any, names: Sequence[str]) -> RowFactory:
+        """Returns a function that creates records of the model from
+        rows, re-using the cached records of their primary keys.
+
+        Rows without the primary key are always hydrated.
+        """
+        hydrate = model.__hydrator__(names)
+
+        if (primary_key := model.__column_table__.primary_key) is None:
+            return hydrate
+
+        try:
+            index = names.index(name := primary_key.field.name)
+        except ValueError:
+            return hydrate
+
+        convert = model.__converters__.get(name) or (lambda value: value)
+
+        def hydrator(row: Sequence[Any]) -> Any:
+            if (key := row[index]) is None:
+                return hydrate(row)
+
+            if (record := self.get(model, key := convert(key))) is not None:
+                return record
+
+            return self.add(model, key, hydrate(row))
+
+        return hydrator
@@ -0,0 +1,159 @@
+"""Index declarations."""
+
+from __future__ import annotations
+from hashlib import sha1
+from typing import Any, Iterator, Optional, Sequence, Union
+
+from dcorm.column import Column, OrderedColumn
+from dcorm.context import Context
+from dcorm.engine import Engine
+from dcorm.ordering import Ordering
+
+
+__all__ = ['Index', 'indexes_of']
+
+
+ENGINE = Engine()   # Renders the conditions of index names.
+IndexItem = Union[str, Column, OrderedColumn]
+
+
+class Index:
+    """An index of a model's table.
+
+    The indexed columns are given by field name, as columns or as ordered
+    columns. Since the model's columns are not available while declaring
+    it, the condition of a partial index may be given as a function that
+    returns the condition for the model. Included columns cover queries
+    without being part of the key.
+    """
+
+    __slots__ = ('items', 'name', 'unique', 'where', 'include', 'using')
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            *items: IndexItem,
+            name: Optional[str] = None,
+            unique: bool = False,
+            where: Any = None,
+            include: Sequence[Union[str, Column]] = (),
+            using: Optional[str] = None
+    ):
+        if not items:
+            raise ValueError('Index has no columns.')
+
+        self.items = items
+        self.name = name
+        self.unique = unique
+        self.where = where
+        self.include = tuple(include)
+        self.using = using
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({", ".join(map(repr, self.items))})'
+
+    def columns(self, model: Any) -> list[tuple[Column, Optional[Ordering]]]:
+        """Returns the indexed columns of the model and their orderings."""
+        result = []
+
+        for item in self.items:
+            if isinstance(item, OrderedColumn):
+                result.append((column_of(model, item.field), item.ordering))
+            else:
+                result.append((column_of(model, item), None))
+
+        return result
+
+    def included(self, model: Any) -> list[Column]:
+        """Returns the included columns of the model."""
+        return [column_of(model, item) for item in self.include]
+
+    def condition(self, model: Any) -> Any:
+        """Returns the condition of a partial index or None."""
+        if callable(self.where):
+            return self.where(model)
+
+        return self.where
+
+    def index_name(self, model: Any) -> str:
+        """Returns the name of the index.
+
+        Unless it is named explicitly, the name consists of the table's
+        and columns' names, a marker of unique indexes and a short hash
+        of the condition, included columns and method, if any.
+        """
+        if self.name is not None:
+            return self.name
+
+        parts = [model.__table_name__, *(
+            column.name for column, _ in self.columns(model))]
+
+        if self.unique:
+            parts.append('unique')
+
+        if digest := self._digest(model):
+            parts.append(digest)
+
+        return '_'.join(parts)
+
+    def _digest(self, model: Any) -> str:
+        """Returns a short hash of the condition, included columns
+        and method of the index or an empty string if it has none.
+        """
+        if (condition := self.condition(model)) is not None:
+            condition = Context(ENGINE).sql(condition).query_string()
+
+        included = [column.name for column in self.included(model)]
+
+        if condition is None and not included and self.using is None:
+            return ''
+
+        return sha1(repr((condition, included, self.using)).encode(
+            )).hexdigest()[:8]
+
+
+def column_of(model: Any, item: Union[str, Column]) -> Column:
+    """Returns the model's column of the given field name or column."""
+
+    if isinstance(item, str):
+        try:
+            return model.__column_table__.by_name[item]
+        except KeyError:
+            raise ValueError(
+                f'{model.__name__} has no field {item!r}.') from None
+
+    if item.table is not model:
+        raise ValueError(f'Column {item.name!r} is not of {model.__name__}.')
+
+    return item
+
+
+def indexes_of(model: Any) -> Iterator[Index]:
+    """Yields the indexes of the model's fields with index or unique
+    metadata, followed by the indexes declared on the model.
+
+    Raises a ValueError if two indexes have the same name.
+    """
+
+    names = set()
+
+    for index in declared_indexes(model):
+        if (name := index.index_name(model)) in names:
+            raise ValueError(f'Duplicate index name: {name!r}')
+
+        names.add(name)
+        yield index
+
+
+def declared_indexes(model: Any) -> Iterator[Index]:
+    """Yields the indexes of the model's fields and of the model."""
+
+    for column in model.__column_table__:
+        if (metadata := column.field.metadata).get('primary'):
+            continue
+
+        if metadata.get('unique'):
+            yield Index(column.field.name, unique=True)
+        elif metadata.get('index'):
+            yield Index(column.field.name)
+
+    yield from model.__indexes__
@@ -7,14 +7,13 @@ from dcorm.column import NOT_SET, Column
 from dcorm.model import Model, ModelType
 
 
-__all__ = ['columns']
+__all__ = ['columns', 'primary_key']
 
 
-def model_columns(model: ModelType) -> Iterator[Column]:
-    """Yields columns from a model."""
+def model_columns(model: Union[Alias, ModelType]) -> Iterator[Column]:
+    """Yields columns from a model or alias."""
 
-    for field in model.__dataclass_fields__.values():
-        yield Column(model, field)
+    return iter(model.__column_table__)
 
 
 def record_columns(record: Model) -> Iterator[Column]:
@@ -34,3 +33,12 @@ def columns(obj: Union[Alias, Model, ModelType]) -> Iterator[Column]:
         return model_columns(obj)
 
     raise TypeError(f'Cannot extract columns from {type(obj)}.')
+
+
+def primary_key(model: Union[Alias, ModelType]) -> Column:
+    """Returns the model's primary key column."""
+
+    if (column := model.__column_table__.primary_key) is not None:
+        return column
+
+    raise ValueError(f'Model has no primary key: {model}')
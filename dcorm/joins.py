@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 from enum import Enum
-from typing import NamedTuple, Optional, Union
+from typing import Any, Hashable, NamedTuple, Optional, Union
 
 from dcorm.alias import Alias
-from dcorm.engine import Engine
+from dcorm.context import Context
 from dcorm.expression import Expression
+from dcorm.fingerprint import shape
 from dcorm.literal import binary
 from dcorm.model import Model
 
 
-__all__ = ['JoinType', 'Join']
+__all__ = ['JoinType', 'Join', 'tables']
 
 
 ON = binary('ON')
@@ -46,10 +47,32 @@ class Join(NamedTuple):
         """Returns a subsequent join."""
         return type(self)(self, typ, other, on)
 
-    def __sql__(self, engine: Engine) -> Engine:
-        engine.sql(self.lhs).literal(self.type).sql(self.rhs)
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            Join,
+            shape(self.lhs, values),
+            self.type,
+            shape(self.rhs, values),
+            None if self.on is None else shape(self.on, values)
+        )
+
+    def __sql__(self, context: Context) -> Context:
+        context.sql(self.lhs).literal(self.type).sql(self.rhs)
 
         if self.on is not None:
-            engine.literal(ON).sql(self.on)
+            context.literal(ON).sql(self.on)
+
+        return context
+
+
+def tables(source: Union[Alias, Model, Join]) -> list[Union[Alias, Model]]:
+    """Returns the tables of a join in the order they are joined."""
+
+    result = []
+
+    while isinstance(source, Join):
+        result.append(source.rhs)
+        source = source.lhs
 
-        return engine
+    result.append(source)
+    return result[::-1]
@@ -0,0 +1,440 @@
+"""Bulk loading of records from files."""
+
+from __future__ import annotations
+from csv import reader
+from dataclasses import MISSING, Field
+from decimal import Decimal
+from enum import Enum
+from itertools import islice
+from json import loads
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator
+from typing import NamedTuple, Optional, Sequence, Union
+
+from dcorm.database import Database, get_database
+from dcorm.field_types import FieldType
+
+if TYPE_CHECKING:
+    from dcorm.aio import AsyncDatabase
+
+
+__all__ = [
+    'BATCH_SIZE', 'COMMIT_INTERVAL', 'BulkLoader', 'FileFormat',
+    'LoadResult', 'RowError'
+]
+
+
+BATCH_SIZE = 1000
+COMMIT_INTERVAL = 100_000
+FALSE = frozenset({'0', 'f', 'false', 'n', 'no', 'off'})
+TRUE = frozenset({'1', 't', 'true', 'y', 'yes', 'on'})
+
+Converter = Callable[[Any], Any]
+
+
+class FileFormat(Enum):
+    """Formats of files to load records from."""
+
+    CSV = 'csv'
+    JSONL = 'jsonl'
+
+
+class RowError(NamedTuple):
+    """A row of a file that could not be loaded."""
+
+    line: int   # The row's last line in the file.
+    row: Any
+    error: Exception
+
+
+class LoadResult(NamedTuple):
+    """The amount of loaded rows and the errors of rows not loaded."""
+
+    inserted: int
+    errors: list[RowError]
+
+
+class Row(NamedTuple):
+    """A parsed and converted row."""
+
+    line: int
+    raw: Any
+    values: tuple[Any, ...]
+
+
+class BulkLoader:   # pylint: disable=R0902
+    """Loads records of a model from a CSV or JSON lines file.
+
+    The file is parsed incrementally. Each row is converted by a function
+    generated for the loaded fields, which applies the fields' converters
+    to the values. Rows are inserted in chunks with multi-row INSERT
+    statements, where a transaction is committed after the given amount
+    of rows. Thus, memory usage is bounded by the chunk size.
+
+    The first row of CSV files names the fields, unless they are given.
+    Empty values of CSV files are NULL, unless configured otherwise.
+    JSON lines files contain one object per line. Fields not present in
+    a row are set to their defaults.
+
+    Rows that fail to parse, convert or insert are skipped and reported
+    to the error handler or, without a handler, in the result. If a
+    chunk fails to insert, its rows are inserted one by one to find the
+    failing ones. If the error handler raises, the loading is aborted
+    and the rows inserted since the last commit are rolled back. Within
+    a transaction, the rows are committed along with it instead.
+    """
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            model: Any,
+            file: IO[str],
+            format: FileFormat,     # pylint: disable=W0622
+            *,
+            fields: Optional[Sequence[str]] = None,
+            null: Optional[str] = '',
+            batch_size: Optional[int] = None,
+            commit_every: int = COMMIT_INTERVAL,
+            on_error: Optional[Callable[[RowError], None]] = None
+    ):
+        self.model = model
+        self.file = file
+        self.format = format
+        self.fields = fields
+        self.null = null
+        self.batch_size = batch_size
+        self.commit_every = commit_every
+        self.on_error = on_error
+        self.errors: list[RowError] = []
+        self._statements: dict[int, str] = {}
+
+    def rows(self) -> tuple[list[Field], Iterator[Row]]:
+        """Returns the loaded fields and the converted rows."""
+        if self.format is FileFormat.CSV:
+            return self._csv_rows()
+
+        return self._jsonl_rows()
+
+    def chunks(self, database: Union[Database, AsyncDatabase]) -> Iterator[
+            tuple[list[Field], list[Row]]]:
+        """Yields the loaded fields and chunks of rows,
+        which are sized like those of bulk inserts.
+        """
+        # Imported here, since the insert queries depend on models.
+        # pylint: disable-next=C0415
+        from dcorm.queries.insert import BulkInsert
+
+        fields, rows = self.rows()
+        size = BulkInsert(
+            self.model, (), batch_size=self.batch_size or BATCH_SIZE
+        ).chunk_size(database, len(fields))
+
+        while chunk := list(islice(rows, size)):
+            yield fields, chunk
+
+    def execute(self, database: Optional[Database] = None) -> LoadResult:
+        """Loads the rows and returns the result."""
+        database = get_database(database, self.model.__database__)
+
+        chunks = self.chunks(database)
+        count = 0
+        done = False
+
+        try:
+            while not done:
+                with database.atomic():
+                    rows = 0
+
+                    for fields, chunk in chunks:
+                        count += self._insert(database, fields, chunk)
+
+                        if (rows := rows + len(chunk)) >= self.commit_every:
+                            break
+                    else:
+                        done = True
+        finally:
+            self._invalidate(database)
+
+        return LoadResult(count, self.errors)
+
+    async def aexecute(self, database: Optional[AsyncDatabase] = None
+                       ) -> LoadResult:
+        """Asynchronously loads the rows and returns the result."""
+        database = get_database(database, self.model.__database__)
+
+        chunks = self.chunks(database)
+        count = 0
+        done = False
+
+        try:
+            while not done:
+                async with database.atomic():
+                    rows = 0
+
+                    for fields, chunk in chunks:
+                        count += await self._ainsert(database, fields, chunk)
+
+                        if (rows := rows + len(chunk)) >= self.commit_every:
+                            break
+                    else:
+                        done = True
+        finally:
+            self._invalidate(database)
+
+        return LoadResult(count, self.errors)
+
+    def _insert(self, database: Database, fields: list[Field],
+                chunk: list[Row]) -> int:
+        """Inserts a chunk of rows within a savepoint
+        and returns the amount of inserted rows.
+        """
+        sql, parameters = self._statement(database, fields, chunk)
+
+        try:
+            with database.atomic():
+                return database.execute(sql, parameters)
+        except database.driver.Error as error:
+            if len(chunk) == 1:
+                self._report(chunk[0].line, chunk[0].raw, error)
+                return 0
+
+        return sum(self._insert(database, fields, [row]) for row in chunk)
+
+    async def _ainsert(self, database: AsyncDatabase, fields: list[Field],
+                       chunk: list[Row]) -> int:
+        """Asynchronously inserts a chunk of rows within a
+        savepoint and returns the amount of inserted rows.
+        """
+        sql, parameters = self._statement(database, fields, chunk)
+
+        try:
+            async with database.atomic():
+                return await database.execute(sql, parameters)
+        except database.driver.Error as error:
+            if len(chunk) == 1:
+                self._report(chunk[0].line, chunk[0].raw, error)
+                return 0
+
+        count = 0
+
+        for row in chunk:
+            count += await self._ainsert(database, fields, [row])
+
+        return count
+
+    def _statement(self, database: Union[Database, AsyncDatabase],
+                   fields: list[Field], chunk: list[Row]) -> tuple[
+            str, Any]:
+        """Returns the INSERT statement and parameters of a chunk.
+
+        The statements are compiled once per amount of rows.
+        """
+        if (sql := self._statements.get(len(chunk))) is None:
+            # Imported here, since the insert queries depend on models.
+            # pylint: disable-next=C0415
+            from dcorm.queries.insert import InsertQuery
+
+            columns = self.model.__column_table__.by_name
+            sql, _ = database.compile(InsertQuery(
+                self.model, [columns[field.name] for field in fields],
+                [range(len(fields))] * len(chunk)
+            ))
+            self._statements[len(chunk)] = sql
+
+        return sql, database.engine.param.parameters(
+            [value for row in chunk for value in row.values])
+
+    def _csv_rows(self) -> tuple[list[Field], Iterator[Row]]:
+        """Returns the loaded fields and the converted rows of a CSV file."""
+        rows = reader(self.file)
+
+        if (names := self.fields) is None:
+            names = next(rows, [])
+
+        fields = loaded_fields(self.model, names)
+        convert = make_row_converter(
+            fields, text_converters(self.model), names, self.null)
+        return fields, self._convert(
+            convert, ((rows.line_num, row) for row in rows if row))
+
+    def _jsonl_rows(self) -> tuple[list[Field], Iterator[Row]]:
+        """Returns the loaded fields and the converted
+        rows of a JSON lines file.
+        """
+        if (names := self.fields) is None:
+            # pylint: disable-next=E1101
+            names = list(self.model.__dataclass_fields__)
+
+        fields = loaded_fields(self.model, names)
+        convert = make_row_converter(fields, self.model.__converters__)
+        return fields, self._convert(convert, self._objects())
+
+    def _objects(self) -> Iterator[tuple[int, Any]]:
+        """Yields the line numbers and parsed objects of a JSON lines file.
+
+        Lines that are not valid JSON objects are reported.
+        """
+        for number, line in enumerate(self.file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                if not isinstance(obj := loads(line), dict):
+                    raise TypeError(f'Not a JSON object: {line.strip()}')
+            except ValueError as error:
+                self._report(number, line, error)
+            except TypeError as error:
+                self._report(number, obj, error)
+            else:
+                yield number, obj
+
+    def _convert(self, convert: Converter,
+                 rows: Iterable[tuple[int, Any]]) -> Iterator[Row]:
+        """Converts the rows and reports the ones that fail."""
+        for line, raw in rows:
+            try:
+                yield Row(line, raw, convert(raw))
+            except KeyError as error:
+                self._report(line, raw, ValueError(
+                    f'Missing value for field: {error.args[0]}'))
+            except (IndexError, TypeError, ValueError, ArithmeticError
+                    ) as error:
+                self._report(line, raw, error)
+
+    def _invalidate(self, database: Union[Database, AsyncDatabase]) -> None:
+        """Invalidates the database's cached results read from the table."""
+        database.invalidate(['.'.join(self.model.__table_path__)])
+
+    def _report(self, line: int, row: Any, error: Exception) -> None:
+        """Reports a row that could not be loaded."""
+        if self.on_error is None:
+            self.errors.append(RowError(line, row, error))
+        else:
+            self.on_error(RowError(line, row, error))
+
+
+def parse_bool(value: str) -> bool:
+    """Parses a boolean from text."""
+
+    if (value := value.strip().lower()) in TRUE:
+        return True
+
+    if value in FALSE:
+        return False
+
+    raise ValueError(f'Not a boolean: {value!r}')
+
+
+TEXT_CONVERTERS = {
+    FieldType.AUTO: int,
+    FieldType.BIGAUTO: int,
+    FieldType.BIGINT: int,
+    FieldType.BOOL: parse_bool,
+    FieldType.DECIMAL: Decimal,
+    FieldType.DOUBLE: float,
+    FieldType.FLOAT: float,
+    FieldType.INT: int,
+    FieldType.SMALLINT: int
+}
+
+
+def text_converters(model: Any) -> dict[str, Optional[Converter]]:
+    """Returns converters of text values to the values of a model's
+    fields, i.e. the fields' converters or parsers of their types.
+    """
+
+    # pylint: disable-next=E1101
+    fields: dict[str, Field] = model.__dataclass_fields__
+    return {
+        name: field.metadata.get('converter') or TEXT_CONVERTERS.get(
+            model.__field_types__[name], model.__converters__.get(name))
+        for name, field in fields.items()
+    }
+
+
+def loaded_fields(model: Any, names: Sequence[str]) -> list[Field]:
+    """Returns the fields with the given names and those with defaults."""
+
+    # pylint: disable-next=E1101
+    fields: dict[str, Field] = model.__dataclass_fields__
+
+    if unknown := [name for name in names if name not in fields]:
+        raise ValueError(f'Unknown fields: {unknown}')
+
+    if len(set(names)) < len(names):
+        raise ValueError(f'Duplicate fields: {list(names)}')
+
+    return [
+        field for field in fields.values() if field.name in names
+        or field.default is not MISSING or field.default_factory is not MISSING
+    ]
+
+
+def make_row_converter(
+        fields: Sequence[Field],
+        convert: dict[str, Optional[Converter]],
+        columns: Optional[Sequence[str]] = None,
+        null: Optional[str] = None
+) -> Converter:
+    """Generates a function that converts a row into the values of the
+    given fields, applying the converters to non-NULL values.
+
+    With the names of its columns, a row is a sequence of text values,
+    where the null string represents NULL. Otherwise, it is a dict of
+    values by field name. Missing values are set to the fields' defaults.
+    """
+
+    namespace = {'MISSING': MISSING, 'null': null}
+    lines = []
+
+    if columns is not None:
+        lines.append(
+            f'if len(row) != {len(columns)}:\n        raise ValueError('
+            f'f"Expected {len(columns)} values, got {{len(row)}}.")'
+        )
+
+    for index, field in enumerate(fields):
+        value = f'v{index}'
+        namespace[f'd{index}'] = field.default
+        namespace[f'f{index}'] = field.default_factory
+
+        if field.default is not MISSING:
+            default = f'd{index}'
+        elif field.default_factory is not MISSING:
+            default = f'f{index}()'
+        else:
+            default = None
+
+        namespace[f'c{index}'] = converter = convert.get(field.name)
+
+        if columns is None:
+            if default is None:
+                lines.append(f'{value} = row[{field.name!r}]')
+            else:
+                lines.append(
+                    f'if ({value} := row.get({field.name!r}, MISSING)) '
+                    f'is MISSING:\n        {value} = {default}'
+                )
+
+                if converter is not None:
+                    lines.append(f'elif {value} is not None:\n'
+                                 f'        {value} = c{index}({value})')
+
+                continue
+        elif field.name in columns:
+            lines.append(f'{value} = row[{columns.index(field.name)}]')
+
+            if null is not None:
+                lines.append(f'if {value} == null:\n        {value} = None')
+        else:
+            lines.append(f'{value} = {default}')
+            continue
+
+        if converter is not None:
+            lines.append(f'if {value} is not None:\n'
+                         f'        {value} = c{index}({value})')
+
+    body = ''.join(f'    {line}\n' for line in lines)
+    values = ''.join(f'v{index}, ' for index in range(len(fields)))
+    source = f'def convert(row):\n{body}    return ({values})\n'
+    exec(source, namespace)     # pylint: disable=W0122
+    return namespace['convert']
+
@@ -1,13 +1,25 @@
 """Model definition."""
 
-from dataclasses import dataclass
-from typing import Any, Optional
+from __future__ import annotations
+from dataclasses import MISSING, dataclass
+from typing import IO, TYPE_CHECKING, Any, Callable, ClassVar, Hashable
+from typing import Optional, Sequence, Union, get_origin
 
 from dcorm.alias import Alias
-from dcorm.column import Column
+from dcorm.column import Column, ColumnTable, DeferredColumn, Identifiers
+from dcorm.column import SlotColumn
+from dcorm.context import Context
 from dcorm.database import Database
 from dcorm.engine import Engine
+from dcorm.field_types import field_types
+from dcorm.hydration import converters, make_hydrator
+from dcorm.indexes import Index
+from dcorm.loading import BulkLoader, FileFormat, LoadResult
 from dcorm.path import Path
+from dcorm.relations import GRAPH
+
+if TYPE_CHECKING:
+    from dcorm.aio import AsyncDatabase
 
 
 __all__ = ['ModelType', 'Model']
@@ -16,11 +28,19 @@ __all__ = ['ModelType', 'Model']
 class ModelType(type):
     """Metaclass for models."""
 
+    def __new__(mcs, name: str, bases: tuple[type, ...],
+                namespace: dict[str, Any], *, slots: bool = False,
+                **kwargs: Any):
+        if slots:
+            namespace = slotted(namespace)
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
     @property
-    def __schema__(cls) -> str:
+    def __schema__(cls) -> Optional[str]:
         """Returns the database schema."""
         if (database :=  cls.__database__) is not None:
-            return database
+            return database.schema
 
         return None
 
@@ -31,31 +51,77 @@ class ModelType(type):
 
         return Path(cls.__schema__, cls.__table_name__)
 
-    def __sql__(cls, engine: Engine) -> Engine:
-        return engine.sql(cls.__table_path__)
+    def __identifiers__(cls, engine: Engine) -> Identifiers:
+        """Returns the quoted identifiers of the table and its columns."""
+        if (schema := cls.__schema__) is None:
+            return cls.__column_table__.identifiers(engine, cls.__table_name__)
+
+        return cls.__column_table__.identifiers(
+            engine, schema, cls.__table_name__)
+
+    def __fingerprint__(cls, _: list[Any]) -> Hashable:
+        return cls
+
+    def __sql__(cls, context: Context) -> Context:
+        return context.raw_value(
+            cls.__identifiers__(context.engine).table, ())
+
+    def __hydrator__(cls, names: Sequence[str]) -> Callable[
+            [Sequence[Any]], Model]:
+        """Returns a function that creates records from database rows
+        whose values correspond to the given field names.
+        """
+        try:
+            return cls.__hydrators__[names]
+        except KeyError:
+            hydrator = make_hydrator(
+                cls, names, cls.__converters__, cls.__slot_members__)
+            return cls.__hydrators__.setdefault(tuple(names), hydrator)
 
 
 class Model(metaclass=ModelType):
-    """Model base class to inherit actual dataclass models from."""
+    """Model base class to inherit actual dataclass models from.
+
+    Pass slots=True to store the fields of records in slots
+    instead of a per-instance __dict__.
+    """
 
+    __slots__ = ()
     __database__ = None
 
     def __init_subclass__(
             cls, *,
             database: Optional[Database] = None,
-            table_name: Optional[str] = None
+            table_name: Optional[str] = None,
+            indexes: Sequence[Index] = ()
         ):
         """Initialize the model with meta data."""
+        cls.__slot_members__ = members = slot_members(cls)
         dataclass(cls)
 
         if database is not None:
             cls.__database__ = database
 
         cls.__table_name__ = table_name or cls.__name__.lower()
+        cls.__indexes__ = tuple(indexes)
 
         # pylint: disable-next=E1101
         for attribute, field in cls.__dataclass_fields__.items():
-            setattr(cls, attribute, Column(cls, field))
+            if (member := members.get(attribute)) is not None:
+                setattr(cls, attribute, SlotColumn(cls, field, slot=member))
+            elif field.metadata.get('lazy'):
+                setattr(cls, attribute, DeferredColumn(cls, field))
+            else:
+                setattr(cls, attribute, Column(cls, field))
+
+        cls.__column_table__ = ColumnTable(
+            getattr(cls, attribute) for attribute in cls.__dataclass_fields__
+        )
+        GRAPH.register(cls)
+        cls.__converters__ = converters(cls)
+        cls.__field_types__ = field_types(cls)
+        cls.__hydrators__ = {}
+        cls.__hydrator__(tuple(cls.__dataclass_fields__))
 
     def __setattr__(self, attribute: str, value: Any) -> None:
         """Hook to set special field values."""
@@ -76,3 +142,92 @@ class Model(metaclass=ModelType):
     def alias(cls, name: Optional[str] = None) -> Alias:
         """Creates a model alias."""
         return Alias(cls, name)
+
+    @classmethod
+    def load_from(    # pylint: disable=W0622
+            cls,
+            file: IO[str],
+            format: Union[FileFormat, str] = FileFormat.CSV,
+            database: Optional[Database] = None,
+            **kwargs: Any
+    ) -> LoadResult:
+        """Loads records from a CSV or JSON lines file.
+
+        Excess keyword arguments are passed on to the BulkLoader.
+        """
+        return BulkLoader(cls, file, FileFormat(format), **kwargs).execute(
+            database)
+
+    @classmethod
+    async def aload_from(  # pylint: disable=W0622
+            cls,
+            file: IO[str],
+            format: Union[FileFormat, str] = FileFormat.CSV,
+            database: Optional[AsyncDatabase] = None,
+            **kwargs: Any
+    ) -> LoadResult:
+        """Asynchronously loads records from a CSV or JSON lines file.
+
+        Excess keyword arguments are passed on to the BulkLoader.
+        """
+        return await BulkLoader(
+            cls, file, FileFormat(format), **kwargs).aexecute(database)
+
+
+def is_class_var(annotation: Any) -> bool:
+    """Checks whether the annotation declares a class variable."""
+
+    if isinstance(annotation, str):
+        return annotation.startswith(('ClassVar', 'typing.ClassVar'))
+
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
+
+
+def slotted(namespace: dict[str, Any]) -> dict[str, Any]:
+    """Declares slots for the fields of a model's namespace.
+
+    Since slots conflict with class attributes, the fields' defaults
+    are moved aside until the model is processed by dataclass().
+    Additional slots hold prefetched related records and the loader
+    of deferred columns.
+    """
+
+    names = [
+        name for name, annotation in namespace.get(
+            '__annotations__', {}).items()
+        if not is_class_var(annotation)
+    ]
+    namespace = dict(namespace)
+    namespace['__slot_defaults__'] = {
+        name: namespace.pop(name, MISSING) for name in names
+    }
+    namespace['__slots__'] = (
+        *namespace.get('__slots__', ()), *names, '__related__', '__deferred__')
+    return namespace
+
+
+def slot_members(model: ModelType) -> dict[str, Any]:
+    """Returns the slot member descriptors of a model's fields.
+
+    The model's own slot members are removed from its namespace and
+    the fields' defaults are restored for dataclass() to process them.
+    """
+
+    members = {}
+
+    for base in reversed(model.__mro__[1:]):
+        members.update(base.__dict__.get('__slot_members__', {}))
+
+    if (defaults := model.__dict__.get('__slot_defaults__')) is None:
+        return members
+
+    for name, default in defaults.items():
+        members[name] = model.__dict__[name]
+
+        if default is MISSING:
+            delattr(model, name)
+        else:
+            setattr(model, name, default)
+
+    delattr(model, '__slot_defaults__')
+    return members
@@ -1,11 +1,11 @@
-"""Ordering type definition."""
+"""Ordering type definitions."""
 
 from enum import Enum
 
 from dcorm.literal import Literal
 
 
-__all__ = ['Ordering']
+__all__ = ['Nulls', 'Ordering']
 
 
 class Ordering(Enum):
@@ -13,3 +13,10 @@ class Ordering(Enum):
 
     ASC = Literal('ASC', space_left=True)
     DESC = Literal('DESC', space_left=True)
+
+
+class Nulls(Enum):
+    """Placements of NULLs in an ordering."""
+
+    FIRST = Literal('NULLS FIRST', space_left=True)
+    LAST = Literal('NULLS LAST', space_left=True)
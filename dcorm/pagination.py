@@ -0,0 +1,174 @@
+"""Keyset pagination."""
+
+from __future__ import annotations
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Optional, Sequence, Union
+
+from dcorm.column import Column, OrderedColumn
+from dcorm.expression import Expression
+from dcorm.expression_base import Junction
+from dcorm.ordering import Nulls, Ordering
+from dcorm.operators import Operator
+
+
+__all__ = ['key_order', 'key_getter', 'keyset', 'plain_key_getter']
+
+
+Condition = Union[Expression, Junction, bool]
+
+
+def key_order(order: Sequence[OrderedColumn],
+              primary_key: Column) -> list[OrderedColumn]:
+    """Returns a total ordering for keyset pagination.
+
+    The primary key is appended as a tie-breaker unless ordered by.
+    Other columns without a placement of NULLs sort them as the
+    smallest values, i.e. first in ascending and last in descending
+    order. The primary key is assumed not to be NULL.
+    """
+
+    result = []
+
+    for item in order:
+        if item.field is primary_key or item.nulls is not None:
+            result.append(item)
+        elif item.ordering is Ordering.ASC:
+            result.append(item._replace(nulls=Nulls.FIRST))
+        else:
+            result.append(item._replace(nulls=Nulls.LAST))
+
+    if all(item.field is not primary_key for item in order):
+        result.append(primary_key.asc())
+
+    return result
+
+
+def key_getter(items: Sequence[Any], order: Sequence[OrderedColumn]
+               ) -> Callable[[Any], tuple[Any, ...]]:
+    """Returns a function that returns the values of the
+    ordered columns from a result of the selected items.
+    """
+
+    getters = []
+
+    for item in order:
+        column = item.field
+
+        for index, selected in enumerate(items):
+            if selected is column:
+                getters.append((index, None))
+                break
+
+            if not isinstance(selected, Column) and column.table is selected:
+                getters.append((index, attrgetter(column.field.name)))
+                break
+        else:
+            raise ValueError(f'Ordered column is not selected: {column}')
+
+    if len(items) == 1:
+        return lambda row: tuple(
+            row if get is None else get(row) for _, get in getters)
+
+    getters = [
+        itemgetter(index) if get is None
+        else lambda row, index=index, get=get: get(row[index])
+        for index, get in getters
+    ]
+    return lambda row: tuple(get(row) for get in getters)
+
+
+def plain_key_getter(columns: Sequence[Column],
+                     order: Sequence[OrderedColumn], keyed: bool
+                     ) -> Callable[[Any], tuple[Any, ...]]:
+    """Returns a function that returns the values of the ordered
+    columns from a plain row of the selected columns.
+
+    Keyed rows are accessed by field name, others by index.
+    """
+
+    keys = []
+
+    for item in order:
+        for index, column in enumerate(columns):
+            if column is item.field:
+                keys.append(column.field.name if keyed else index)
+                break
+        else:
+            raise ValueError(f'Ordered column is not selected: {item.field}')
+
+    get = itemgetter(*keys)
+
+    if len(keys) == 1:
+        return lambda row: (get(row),)
+
+    return get
+
+
+def keyset(order: Sequence[OrderedColumn],
+           values: Sequence[Any]) -> Condition:
+    """Returns the condition selecting the rows that follow
+    the row with the given values in the given ordering.
+
+    For columns c1 ... cn, the rows that follow are those where
+    c1 follows v1, or c1 equals v1 and c2 follows v2, and so on.
+    If the first value is not NULL, the rows are also bounded by
+    it, so that an index on the first column can be used.
+    """
+
+    terms = []
+    equal = []
+
+    for item, value in zip(order, values):
+        if (after := follows(item, value)) is not False:
+            terms.append(Junction(Operator.AND, (*equal, after))
+                         if equal else after)
+
+        equal.append(Expression(
+            item.field, Operator.IS if value is None else Operator.EQ, value))
+
+    if len(terms) < 2:
+        return terms[0] if terms else False
+
+    condition = Junction(Operator.OR, tuple(terms))
+
+    if (bound := lower_bound(order[0], values[0])) is None:
+        return condition
+
+    return Junction(Operator.AND, (bound, condition))
+
+
+def follows(item: OrderedColumn, value: Any) -> Condition:
+    """Returns the condition of the column's value
+    following the given value in the ordering.
+    """
+
+    if value is None:
+        if item.nulls is Nulls.FIRST:
+            return Expression(item.field, Operator.IS_NOT, None)
+
+        return False
+
+    if item.ordering is Ordering.ASC:
+        after = item.field > value
+    else:
+        after = item.field < value
+
+    if item.nulls is Nulls.LAST:
+        return Junction(Operator.OR, (
+            after, Expression(item.field, Operator.IS, None)))
+
+    return after
+
+
+def lower_bound(item: OrderedColumn, value: Any) -> Optional[Expression]:
+    """Returns the bound of the first column or None
+    if the following rows may contain NULLs.
+    """
+
+    if value is None or item.nulls is Nulls.LAST:
+        return None
+
+    if item.ordering is Ordering.ASC:
+        return item.field >= value
+
+    return item.field <= value
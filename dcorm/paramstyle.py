@@ -0,0 +1,63 @@
+"""Bind parameter styles."""
+
+from enum import Enum
+from typing import Any, Union
+
+
+__all__ = ['PARAM', 'ParamStyle']
+
+
+PARAM = '\0'    # Marks a parameter in compiled templates.
+
+
+class ParamStyle(Enum):
+    """DB-API 2.0 parameter styles."""
+
+    QMARK = 'qmark'
+    FORMAT = 'format'
+    NUMERIC = 'numeric'
+    NAMED = 'named'
+    PYFORMAT = 'pyformat'
+
+    def placeholder(self, index: int) -> str:
+        """Returns the placeholder for the parameter at the given index."""
+        if self is ParamStyle.QMARK:
+            return '?'
+
+        if self is ParamStyle.FORMAT:
+            return '%s'
+
+        if self is ParamStyle.NUMERIC:
+            return f':{index + 1}'
+
+        if self is ParamStyle.NAMED:
+            return f':p{index + 1}'
+
+        return f'%(p{index + 1})s'
+
+    def template(self, template: str) -> str:
+        """Replaces the parameter markers of a template with placeholders."""
+        if self is ParamStyle.QMARK:
+            return template.replace(PARAM, '?')
+
+        if self in {ParamStyle.FORMAT, ParamStyle.PYFORMAT}:
+            template = template.replace('%', '%%')
+
+        if self is ParamStyle.FORMAT:
+            return template.replace(PARAM, '%s')
+
+        head, *tail = template.split(PARAM)
+        return head + ''.join(
+            self.placeholder(index) + sql for index, sql in enumerate(tail)
+        )
+
+    def parameters(self, values: list[Any]) -> Union[
+            list[Any], dict[str, Any]]:
+        """Returns the parameters in the form expected by the driver."""
+        if self in {ParamStyle.NAMED, ParamStyle.PYFORMAT}:
+            return {
+                f'p{index}': value
+                for index, value in enumerate(values, start=1)
+            }
+
+        return values
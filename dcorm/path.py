@@ -1,6 +1,8 @@
 """SQL statement nodes."""
 
-from dcorm.engine import Engine
+from typing import Any, Hashable
+
+from dcorm.context import Context
 
 
 __all__ = ['Path']
@@ -12,10 +14,8 @@ class Path(list):
     def __init__(self, *items: str):
         super().__init__(items)
 
-    @property
-    def template(self) -> str:
-        """Returns the template string."""
-        return '.'.join(['%s'] * len(self))
+    def __fingerprint__(self, _: list[Any]) -> Hashable:
+        return (Path, *self)
 
-    def __sql__(self, engine: Engine) -> Engine:
-        return engine.raw_value(f'{engine.quote(self.template)}', self)
+    def __sql__(self, context: Context) -> Context:
+        return context.raw_value('.'.join(map(context.quote, self)), ())
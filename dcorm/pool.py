@@ -0,0 +1,233 @@
+"""Database connection pooling."""
+
+from collections import deque
+from contextlib import suppress
+from os import getpid
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Optional
+
+
+__all__ = ['BasePool', 'ConnectionPool']
+
+
+Connection = Any    # A DB-API 2.0 connection.
+
+
+class BasePool:
+    """Bookkeeping of a bounded pool of connections.
+
+    Connections are re-used in LIFO order. Idle connections exceeding
+    the idle timeout are removed, as long as more than min_size
+    connections are open. Subclasses synchronize access to the
+    bookkeeping and open, check and close the connections.
+    """
+
+    def __init__(
+            self,
+            connect: Callable[[], Any],
+            *,
+            min_size: int = 0,
+            max_size: int = 8,
+            idle_timeout: Optional[float] = None,
+            timeout: Optional[float] = None,
+            check: Optional[Callable[[Connection], Any]] = None
+    ):
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError(f'Invalid pool size: {min_size}..{max_size}')
+
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.check = check
+        self._reset()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Returns the amount of idle connections."""
+        return len(self._idle)
+
+    def _reset(self) -> None:
+        """Resets the pool's state."""
+        self._idle: deque[tuple[Connection, float]] = deque()
+        self._in_use: set[int] = set()
+        self._size = 0
+
+    def _prune(self, expired: list[Connection]) -> None:
+        """Moves connections that have been idle for too long to expired."""
+        if self.idle_timeout is None:
+            return
+
+        now = monotonic()
+
+        while (
+                self._idle and self._size > self.min_size
+                and now - self._idle[0][1] > self.idle_timeout
+        ):
+            expired.append(self._idle.popleft()[0])
+            self._size -= 1
+
+    def _take(self, expired: list[Connection]) -> tuple[
+            Optional[Connection], bool]:
+        """Takes an idle connection or reserves the slot of a new one.
+
+        Returns the idle connection or None and whether either
+        succeeded. Expired connections are moved to expired, to
+        be closed once access to the pool has been released.
+        """
+        self._prune(expired)
+
+        if self._idle:
+            return self._idle.pop()[0], True
+
+        if self._size < self.max_size:
+            self._size += 1
+            return None, True
+
+        return None, False
+
+    def _put(self, connection: Connection, discard: bool) -> bool:
+        """Puts back a connection in use and returns
+        whether it was checked out of the pool.
+        """
+        try:
+            self._in_use.remove(id(connection))
+        except KeyError:    # Not ours, e.g. from before a fork.
+            return False
+
+        if discard:
+            self._size -= 1
+        else:
+            self._idle.append((connection, monotonic()))
+
+        return True
+
+    def _drain(self) -> list[Connection]:
+        """Removes and returns the idle connections."""
+        idle = [connection for connection, _ in self._idle]
+        self._idle.clear()
+        self._size -= len(idle)
+        return idle
+
+
+class ConnectionPool(BasePool):
+    """A bounded, thread-safe pool of DB-API connections.
+
+    If the process has been forked, all connections
+    inherited from the parent process are abandoned.
+    """
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._pid = getpid()
+        self._condition = Condition()
+
+    def _check_fork(self) -> None:
+        """Abandons the connections of the parent process after a fork."""
+        if self._pid != getpid():
+            self._reset()
+
+    def _checkout(self, deadline: Optional[float]) -> Optional[Connection]:
+        """Takes an idle connection or reserves a new one."""
+        expired: list[Connection] = []
+
+        try:
+            with self._condition:
+                while True:
+                    connection, taken = self._take(expired)
+
+                    if taken:
+                        return connection
+
+                    if deadline is None:
+                        self._condition.wait()
+                    elif (remaining := deadline - monotonic()) <= 0:
+                        raise TimeoutError(
+                            'Timed out waiting for a connection.')
+                    else:
+                        self._condition.wait(remaining)
+        finally:
+            close_all(expired)
+
+    def _discard(self) -> None:
+        """Frees the slot of a discarded connection."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def acquire(self) -> Connection:
+        """Checks out a connection from the pool."""
+        self._check_fork()
+        deadline = None if self.timeout is None else monotonic() + self.timeout
+
+        while True:
+            if (connection := self._checkout(deadline)) is None:
+                try:
+                    connection = self.connect()
+                except BaseException:
+                    self._discard()
+                    raise
+
+                break
+
+            if self.check is None or healthy(connection, self.check):
+                break
+
+            close(connection)
+            self._discard()
+
+        with self._condition:
+            self._in_use.add(id(connection))
+
+        return connection
+
+    def release(self, connection: Connection, *,
+                discard: bool = False) -> None:
+        """Returns a connection to the pool."""
+        self._check_fork()
+
+        with self._condition:
+            if not self._put(connection, discard):
+                return
+
+            self._condition.notify()
+
+        if discard:
+            close(connection)
+
+    def close(self) -> None:
+        """Closes all idle connections."""
+        with self._condition:
+            idle = self._drain()
+            self._condition.notify_all()
+
+        close_all(idle)
+
+
+def healthy(connection: Connection,
+            check: Callable[[Connection], bool]) -> bool:
+    """Runs the health check on the connection."""
+
+    try:
+        return check(connection)
+    except Exception:   # pylint: disable=W0703
+        return False
+
+
+def close(connection: Connection) -> None:
+    """Closes a connection, ignoring errors."""
+
+    with suppress(Exception):
+        connection.close()
+
+
+def close_all(connections: list[Connection]) -> None:
+    """Closes the given connections."""
+
+    for connection in connections:
+        close(connection)
@@ -0,0 +1,189 @@
+"""Batched prefetching of related records."""
+
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Awaitable, Callable, Generator, Iterable, Iterator
+from typing import NamedTuple, Sequence
+
+from dcorm.column import Column
+from dcorm.relations import GRAPH
+
+
+__all__ = ['Prefetch', 'plan', 'prefetch', 'aprefetch', 'related']
+
+
+Fetch = Callable[[Any, Column, tuple[Any, ...]], Iterable[Any]]
+AsyncFetch = Callable[[Any, Column, tuple[Any, ...]], Awaitable[list[Any]]]
+Query = tuple[Any, Column, tuple[Any, ...]]
+Steps = Generator[Query, Iterable[Any], None]     # Queries and their rows.
+
+
+class Prefetch(NamedTuple):
+    """Prefetching of the target model's records related to the records
+    of the source model by a foreign key.
+    """
+
+    source: Any         # The model of the records to attach to.
+    target: Any         # The model of the records to fetch.
+    key: Column         # The source column providing the keys.
+    column: Column      # The target column to match the keys.
+    many: bool          # Whether to attach lists of records.
+
+    def keys(self, records: Iterable[Any]) -> list[Any]:
+        """Returns the unique keys of the given source records."""
+        name = self.key.field.name
+        return list(dict.fromkeys(
+            key for record in records
+            if (key := getattr(record, name)) is not None
+        ))
+
+    def attach(self, records: Iterable[Any], related: list[Any]) -> None:
+        """Attaches the related records to the source records."""
+        column, key = self.column.field.name, self.key.field.name
+        index: dict[Any, Any] = {}
+
+        if self.many:
+            for record in related:
+                index.setdefault(getattr(record, column), []).append(record)
+        else:
+            for record in related:
+                index[getattr(record, column)] = record
+
+        default = list if self.many else lambda: None
+
+        for record in records:
+            attached(record)[self.target] = index.get(
+                getattr(record, key), default())
+
+
+def plan(root: Any, models: Sequence[Any]) -> list[Prefetch]:
+    """Plans the prefetching of the given models.
+
+    Each model is related to the root model
+    or to a model prefetched before it.
+    """
+
+    plans = []
+    sources = [root]
+
+    for model in models:
+        for source in reversed(sources):
+            if foreign_keys := GRAPH.foreign_keys(source, model):
+                break
+        else:
+            raise ValueError(f'No relation to {model} from {sources}.')
+
+        if len(foreign_keys) > 1:
+            raise ValueError(
+                f'Ambiguous relation between {source} and {model}.')
+
+        column, target = foreign_keys[0]
+
+        if column.table is source:
+            plans.append(Prefetch(source, model, column, target, False))
+        else:
+            plans.append(Prefetch(source, model, target, column, True))
+
+        sources.append(model)
+
+    return plans
+
+
+def chunks(keys: list[Any], size: int) -> Iterator[tuple[Any, ...]]:
+    """Yields chunks of keys."""
+
+    keys = iter(keys)
+
+    while chunk := tuple(islice(keys, size)):
+        yield chunk
+
+
+def prefetching(records: list[Any], plans: list[Prefetch],
+                chunk_size: int) -> Steps:
+    """Yields the queries fetching the related records, with one query
+    per plan and chunk of keys, and attaches the sent back records.
+    """
+
+    fetched = {plans[0].source: records} if plans else {}
+
+    for item in plans:
+        related = []
+
+        for chunk in chunks(item.keys(sources := fetched[item.source]),
+                            chunk_size):
+            related.extend((yield item.target, item.column, chunk))
+
+        item.attach(sources, related)
+        fetched[item.target] = related
+
+
+def prefetch(records: list[Any], plans: list[Prefetch], fetch: Fetch,
+             chunk_size: int) -> None:
+    """Fetches the related records and attaches them."""
+
+    run(prefetching(records, plans, chunk_size), fetch)
+
+
+async def aprefetch(records: list[Any], plans: list[Prefetch],
+                    fetch: AsyncFetch, chunk_size: int) -> None:
+    """Asynchronously fetches the related records and attaches them."""
+
+    await arun(prefetching(records, plans, chunk_size), fetch)
+
+
+def run(steps: Steps, fetch: Fetch) -> None:
+    """Fetches the rows of the steps' queries and sends them back."""
+
+    try:
+        query = next(steps)
+
+        while True:
+            query = steps.send(fetch(*query))
+    except StopIteration:
+        pass
+
+
+async def arun(steps: Steps, fetch: AsyncFetch) -> None:
+    """Asynchronously fetches the rows of the
+    steps' queries and sends them back.
+    """
+
+    try:
+        query = next(steps)
+
+        while True:
+            query = steps.send(await fetch(*query))
+    except StopIteration:
+        pass
+
+
+def attached(record: Any) -> dict[Any, Any]:
+    """Returns the prefetched relations of a record."""
+
+    try:
+        return record.__related__
+    except AttributeError:
+        object.__setattr__(record, '__related__', result := {})
+        return result
+
+
+def related(record: Any, model: Any) -> Any:
+    """Returns the prefetched records of the model related to the record.
+
+    Returns a record or None for models referenced by the record
+    and a list of records for models referencing the record.
+    """
+
+    try:
+        return record.__related__[model]
+    except (AttributeError, KeyError):
+        raise LookupError(f'{model} has not been prefetched.') from None
+
+
+def chunk_size(engine: Any, default: int) -> int:
+    """Returns the maximum amount of keys per query."""
+
+    if (limit := engine.max_params) is None:
+        return default
+
+    return max(1, min(default, limit))
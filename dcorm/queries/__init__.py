@@ -1,6 +1,18 @@
 """SQL queries."""
 
+from dcorm.queries.create import create_indexes, create_table
+from dcorm.queries.delete import delete
+from dcorm.queries.insert import insert_many
 from dcorm.queries.select import select
+from dcorm.queries.update import bulk_update, update
 
 
-__all__ = ['select']
+__all__ = [
+    'bulk_update',
+    'create_indexes',
+    'create_table',
+    'delete',
+    'insert_many',
+    'select',
+    'update'
+]
@@ -0,0 +1,317 @@
+"""Data definition queries."""
+
+from __future__ import annotations
+from types import NoneType, UnionType
+from typing import Any, Hashable, Iterator, Optional, Union
+from typing import get_args, get_origin
+
+from dcorm.aio import AsyncDatabase
+from dcorm.column import COMMA, Column
+from dcorm.context import Context
+from dcorm.database import Database, get_database
+from dcorm.engine import Engine
+from dcorm.field_types import FieldType
+from dcorm.hydration import field_hints
+from dcorm.indexes import Index, indexes_of
+from dcorm.literal import Literal, binary, unary
+from dcorm.model import ModelType
+from dcorm.operations import Operation
+from dcorm.queries.query import Query
+from dcorm.relations import GRAPH
+
+
+__all__ = [
+    'CreateIndex', 'CreateIndexes', 'CreateTable', 'create_indexes',
+    'create_table'
+]
+
+
+IF_NOT_EXISTS = unary('IF NOT EXISTS')
+INCLUDE = binary('INCLUDE')
+INDEX = unary('INDEX')
+NOT_NULL = Literal('NOT NULL', space_left=True)
+ON = binary('ON')
+PRIMARY_KEY = Literal('PRIMARY KEY', space_left=True)
+REFERENCES = binary('REFERENCES')
+TABLE = unary('TABLE')
+UNIQUE = unary('UNIQUE')
+USING = binary('USING')
+WHERE = binary('WHERE')
+
+
+class CreateTable(Query):
+    """A CREATE TABLE query of a model.
+
+    Column types are derived from the fields' types, where the engine may
+    substitute types by name. Fields not annotated as optional are NOT
+    NULL. Foreign keys reference their target's table and column.
+    """
+
+    def __init__(self, model: ModelType, safe: bool = True):
+        super().__init__(Operation.CREATE)
+        self._model = model
+        self._safe = safe
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (CreateTable, self._model, self._safe)
+
+    def _compile(self, context: Context) -> Context:
+        context.literal(self._operation).literal(TABLE)
+
+        if self._safe:
+            context.literal(IF_NOT_EXISTS)
+
+        context.sql(self._model).raw_value(' (', ())
+        columns = self._model.__column_table__
+        keys = [column for column in columns
+                if column.field.metadata.get('primary')]
+        nullable = nullable_fields(self._model)
+
+        for index, column in enumerate(columns):
+            if index:
+                context.literal(COMMA)
+
+            column_definition(
+                context, column, column.field.name in nullable,
+                primary=len(keys) == 1 and keys[0] is column
+            )
+
+        if len(keys) > 1:
+            names = ', '.join(context.quote(key.name) for key in keys)
+            context.literal(COMMA).raw_value(
+                f'{PRIMARY_KEY.keyword} ({names})', ())
+
+        return context.raw_value(')', ())
+
+    @property
+    def _database(self) -> Optional[Database]:
+        return self._model.__database__
+
+
+class CreateIndex(Query):
+    """A CREATE INDEX query of an index of a model.
+
+    The condition of a partial index is rendered with inlined values,
+    since data definitions cannot have bound parameters. On engines not
+    supporting INCLUDE, included columns are appended to the key columns
+    of non-unique indexes.
+    """
+
+    def __init__(self, model: ModelType, index: Index, safe: bool = True):
+        super().__init__(Operation.CREATE)
+        self._model = model
+        self._index = index
+        self._safe = safe
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (CreateIndex, self._model, self._index, self._safe)
+
+    def __sql__(self, context: Context) -> Context:
+        # Not cached, since the conditions' values are inlined.
+        return self._compile(context)
+
+    def _compile(self, context: Context) -> Context:
+        engine = context.engine
+        index = self._index
+        context.literal(self._operation)
+
+        if index.unique:
+            context.literal(UNIQUE)
+
+        context.literal(INDEX)
+
+        if self._safe:
+            context.literal(IF_NOT_EXISTS)
+
+        name = engine.quote(index.index_name(self._model))
+        table = self._model.__identifiers__(engine).table
+
+        if (schema := self._model.__schema__) is not None and (
+                engine.index_schema_prefix):
+            name = f'{engine.quote(schema)}.{name}'
+            table = engine.quote(self._model.__table_name__)
+
+        context.raw_value(name, ())
+
+        if index.using is not None and engine.index_using_precedes_table:
+            context.literal(USING).raw_value(index.using, ())
+
+        context.literal(ON).raw_value(table, ())
+
+        if index.using is not None and not engine.index_using_precedes_table:
+            context.literal(USING).raw_value(index.using, ())
+
+        items = [
+            engine.quote(column.name) + (
+                '' if ordering is None else engine.literal(ordering))
+            for column, ordering in index.columns(self._model)
+        ]
+        included = [
+            engine.quote(column.name)
+            for column in index.included(self._model)
+        ]
+
+        if included and not engine.index_include:
+            if index.unique:
+                raise ValueError(
+                    'Engine does not support INCLUDE with unique indexes.')
+
+            items.extend(included)
+            included = []
+
+        context.raw_value(f' ({", ".join(items)})', ())
+
+        if included:
+            context.literal(INCLUDE).raw_value(f'({", ".join(included)})', ())
+
+        if (condition := index.condition(self._model)) is not None:
+            context.literal(WHERE).raw_value(
+                inline(engine, self._model, condition), ())
+
+        return context
+
+    @property
+    def _database(self) -> Optional[Database]:
+        return self._model.__database__
+
+
+class CreateIndexes:
+    """Creates the indexes of a model.
+
+    These are the indexes of fields with index or unique metadata
+    and the indexes declared on the model. All indexes are created
+    within one transaction.
+    """
+
+    def __init__(self, model: ModelType, safe: bool = True):
+        self.model = model
+        self.safe = safe
+
+    def __iter__(self) -> Iterator[CreateIndex]:
+        return (
+            CreateIndex(self.model, index, self.safe)
+            for index in indexes_of(self.model)
+        )
+
+    def execute(self, database: Optional[Database] = None) -> int:
+        """Creates the indexes and returns their amount."""
+        database = get_database(database, self.model.__database__)
+
+        queries = list(self)
+
+        with database.atomic():
+            for query in queries:
+                query.execute(database)
+
+        return len(queries)
+
+    async def aexecute(self, database: Optional[AsyncDatabase] = None) -> int:
+        """Asynchronously creates the indexes and returns their amount."""
+        database = get_database(database, self.model.__database__)
+
+        queries = list(self)
+
+        async with database.atomic():
+            for query in queries:
+                await query.aexecute(database)
+
+        return len(queries)
+
+
+def column_definition(context: Context, column: Column, nullable: bool,
+                      primary: bool) -> Context:
+    """Renders the definition of a column.
+
+    Referenced tables are qualified by their schema,
+    unless the engine only references tables of the same schema.
+    """
+
+    engine = context.engine
+    context.raw_value(engine.quote(column.name), ())
+
+    if sql_type := column_type(engine, column):
+        context.raw_value(f' {sql_type}', ())
+
+    if not nullable:
+        context.literal(NOT_NULL)
+
+    if primary:
+        context.literal(PRIMARY_KEY)
+
+    if (reference := column.field.metadata.get('references')) is None:
+        return context
+
+    if (target := GRAPH.resolve(reference, column.table.__module__)) is None:
+        raise ValueError(f'Unresolved reference: {reference!r}')
+
+    if engine.references_schema:
+        table = target.table.__identifiers__(engine).table
+    else:
+        table = engine.quote(target.table.__table_name__)
+
+    return context.literal(REFERENCES).raw_value(
+        f'{table} ({engine.quote(target.name)})', ())
+
+
+def column_type(engine: Engine, column: Column) -> str:
+    """Returns the SQL type of a column.
+
+    Foreign keys have the type of the referenced column.
+    """
+
+    field_type = column.table.__field_types__[column.field.name]
+
+    if field_type is FieldType.DEFAULT and (
+            reference := column.field.metadata.get('references')) is not None:
+        if (target := GRAPH.resolve(
+                reference, column.table.__module__)) is not None:
+            return column_type(engine, target)
+
+    return engine.sql_type(field_type)
+
+
+def nullable_fields(model: ModelType) -> set[str]:
+    """Returns the names of the fields annotated as optional."""
+
+    return {
+        name for name, typ in field_hints(model).items() if is_optional(typ)
+    }
+
+
+def is_optional(typ: Any) -> bool:
+    """Checks whether the type admits None."""
+
+    if typ in {Any, None, NoneType, object}:
+        return True
+
+    return get_origin(typ) in {Union, UnionType} and NoneType in get_args(typ)
+
+
+def inline(engine: Engine, model: ModelType, condition: Any) -> str:
+    """Renders a condition on the model's columns with
+    unqualified column names and inlined values.
+    """
+
+    compiled = Context(engine).sql(condition)
+    template = compiled.template.replace(
+        f'{model.__identifiers__(engine).table}.', '')
+    return Context(engine).raw_value(
+        template, compiled.values).query_string()
+
+
+def create_table(model: ModelType, safe: bool = True) -> CreateTable:
+    """Creates a CREATE TABLE query of the model.
+
+    A safe query does not fail if the table exists.
+    """
+
+    return CreateTable(model, safe)
+
+
+def create_indexes(model: ModelType, safe: bool = True) -> CreateIndexes:
+    """Creates the indexes of the model.
+
+    Safe queries do not fail if an index exists.
+    """
+
+    return CreateIndexes(model, safe)
@@ -0,0 +1,58 @@
+"""Delete queries."""
+
+from __future__ import annotations
+from typing import Any, Hashable, Optional
+
+from dcorm.context import Context
+from dcorm.database import Database
+from dcorm.fingerprint import shape
+from dcorm.literal import binary, unary
+from dcorm.model import ModelType
+from dcorm.operations import Operation
+from dcorm.queries.query import Query
+from dcorm.result_cache import table_names
+
+
+__all__ = ['DeleteQuery', 'delete']
+
+
+FROM = unary('FROM')
+WHERE = binary('WHERE')
+
+
+class DeleteQuery(Query):
+    """A DELETE query."""
+
+    def __init__(self, model: ModelType):
+        super().__init__(Operation.DELETE)
+        self._model = model
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            DeleteQuery,
+            self._model,
+            None if (condition := self._condition) is True
+            else shape(condition, values)
+        )
+
+    def _compile(self, context: Context) -> Context:
+        context.literal(self._operation).literal(FROM).sql(self._model)
+
+        if (condition := self._condition) is not True:
+            context.literal(WHERE).sql(condition)
+
+        return context
+
+    @property
+    def _database(self) -> Optional[Database]:
+        return self._model.__database__
+
+    @property
+    def _tables(self) -> tuple[str, ...]:
+        return table_names(self._model)
+
+
+def delete(model: ModelType) -> DeleteQuery:
+    """Creates a delete query."""
+
+    return DeleteQuery(model)
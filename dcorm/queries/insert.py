@@ -0,0 +1,230 @@
+"""Insert queries."""
+
+from __future__ import annotations
+from dataclasses import MISSING, Field
+from itertools import islice
+from typing import Any, Hashable, Iterable, Iterator, Optional, Sequence
+from typing import Union
+
+from dcorm.aio import AsyncDatabase
+from dcorm.column import Column
+from dcorm.context import Context
+from dcorm.database import Database, get_database
+from dcorm.literal import binary, unary
+from dcorm.model import Model, ModelType
+from dcorm.operations import Operation
+from dcorm.queries.query import Query
+from dcorm.result_cache import invalidate, table_names
+
+
+__all__ = ['BATCH_SIZE', 'BulkInsert', 'InsertQuery', 'insert_many']
+
+
+BATCH_SIZE = 1000
+INTO = unary('INTO')
+VALUES = binary('VALUES')
+Row = Union[Model, dict[str, Any]]
+
+
+class InsertQuery(Query):
+    """An INSERT query of one or more rows."""
+
+    def __init__(self, model: ModelType, columns: Sequence[Column],
+                 rows: Sequence[Sequence[Any]]):
+        super().__init__(Operation.INSERT)
+        self._model = model
+        self._columns = columns
+        self._rows = rows
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        for row in self._rows:
+            values.extend(row)
+
+        return (
+            InsertQuery,
+            self._model,
+            tuple(column.name for column in self._columns),
+            len(self._rows)
+        )
+
+    def _compile(self, context: Context) -> Context:
+        context.literal(self._operation).literal(INTO).sql(self._model)
+        context.raw_value(
+            f' ({", ".join(map(context.quote, self._names))})', ()
+        ).literal(VALUES)
+
+        for index, row in enumerate(self._rows):
+            if index:
+                context.raw_value(', ', ())
+
+            context.value(tuple(row))
+
+        return context
+
+    @property
+    def _names(self) -> Iterator[str]:
+        """Yields the column names."""
+        return (column.name for column in self._columns)
+
+    @property
+    def _database(self) -> Optional[Database]:
+        return self._model.__database__
+
+    @property
+    def _tables(self) -> tuple[str, ...]:
+        return table_names(self._model)
+
+
+class BulkInsert:
+    """Inserts many rows in chunks.
+
+    The rows are consumed lazily. Each chunk is inserted with a multi-row
+    INSERT statement that respects the engine's limit of bound parameters
+    or, alternatively, with executemany(). All chunks are inserted within
+    one transaction.
+    """
+
+    def __init__(
+            self,
+            model: ModelType,
+            rows: Iterable[Row],
+            *,
+            executemany: bool = False,
+            batch_size: Optional[int] = None
+    ):
+        self.model = model
+        self.rows = rows
+        self.executemany = executemany
+        self.batch_size = batch_size
+
+    def chunk_size(self, database: Database, columns: int) -> int:
+        """Returns the amount of rows to insert per statement."""
+        size = self.batch_size or BATCH_SIZE
+
+        if self.executemany or (limit := database.engine.max_params) is None:
+            return size
+
+        return max(1, min(size, limit // max(1, columns)))
+
+    def chunks(self, database: Database) -> Iterator[
+            tuple[list[Column], list[tuple[Any, ...]]]]:
+        """Yields the columns and chunks of value rows."""
+        rows = iter(self.rows)
+
+        if (first := next(rows, None)) is None:
+            return
+
+        fields = row_fields(self.model, first)
+        columns = [getattr(self.model, field.name) for field in fields]
+        size = self.chunk_size(database, len(columns))
+        values = (row_values(fields, row) for row in rows)
+        yield columns, [row_values(fields, first), *islice(values, size - 1)]
+
+        while chunk := list(islice(values, size)):
+            yield columns, chunk
+
+    def statement(self, database: Union[Database, AsyncDatabase],
+                  columns: list[Column], chunk: list[tuple[Any, ...]]
+                  ) -> tuple[bool, str, Any]:
+        """Returns whether to use executemany(),
+        the SQL and the parameters of a chunk.
+        """
+        if not self.executemany:
+            return False, *database.compile(
+                InsertQuery(self.model, columns, chunk))
+
+        sql, _ = database.compile(
+            InsertQuery(self.model, columns, [range(len(columns))]))
+        param = database.engine.param
+        return True, sql, [param.parameters(list(row)) for row in chunk]
+
+    def execute(self, database: Optional[Database] = None) -> int:
+        """Inserts the rows and returns the amount of inserted rows."""
+        database = get_database(database, self.model.__database__)
+
+        count = 0
+
+        with database.atomic():
+            for columns, chunk in self.chunks(database):
+                many, sql, parameters = self.statement(
+                    database, columns, chunk)
+                count += (database.executemany if many else database.execute)(
+                    sql, parameters)
+
+        invalidate(database, table_names(self.model))
+        return count
+
+    async def aexecute(self, database: Optional[AsyncDatabase] = None) -> int:
+        """Asynchronously inserts the rows and returns
+        the amount of inserted rows.
+        """
+        database = get_database(database, self.model.__database__)
+
+        count = 0
+
+        async with database.atomic():
+            for columns, chunk in self.chunks(database):
+                many, sql, parameters = self.statement(
+                    database, columns, chunk)
+                count += await (
+                    database.executemany if many else database.execute
+                )(sql, parameters)
+
+        invalidate(database, table_names(self.model))
+        return count
+
+
+def row_fields(model: ModelType, row: Row) -> list[Field]:
+    """Returns the fields to insert, determined by the first row.
+
+    Records provide all fields. Dicts provide the fields
+    whose names are keys or which have a default.
+    """
+
+    # pylint: disable-next=E1101
+    fields = model.__dataclass_fields__.values()
+
+    if isinstance(row, Model):
+        return list(fields)
+
+    return [
+        field for field in fields if field.name in row
+        or field.default is not MISSING or field.default_factory is not MISSING
+    ]
+
+
+def row_values(fields: list[Field], row: Row) -> tuple[Any, ...]:
+    """Returns the values of the given fields from a row."""
+
+    if isinstance(row, Model):
+        return tuple(getattr(row, field.name) for field in fields)
+
+    return tuple(field_value(field, row) for field in fields)
+
+
+def field_value(field: Field, row: dict[str, Any]) -> Any:
+    """Returns the field's value from a dict or its default."""
+
+    try:
+        return row[field.name]
+    except KeyError:
+        if field.default is not MISSING:
+            return field.default
+
+        if field.default_factory is not MISSING:
+            return field.default_factory()
+
+        raise ValueError(f'Missing value for field: {field.name}') from None
+
+
+def insert_many(
+        model: ModelType,
+        rows: Iterable[Row],
+        *,
+        executemany: bool = False,
+        batch_size: Optional[int] = None
+) -> BulkInsert:
+    """Creates a bulk insert of records or dicts."""
+
+    return BulkInsert(
+        model, rows, executemany=executemany, batch_size=batch_size)
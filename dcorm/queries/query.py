@@ -1,11 +1,19 @@
 """Basic SQL queries."""
 
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Hashable, Optional, Union
 
-from dcorm.database import Database
+from dcorm.aio import AsyncDatabase
+from dcorm.context import Context
+from dcorm.database import Database, Parameters, get_database
+from dcorm.explain import PlanNode, aexplain, explain, plan_names
 from dcorm.expression import Expression
+from dcorm.expression_base import Junction
+from dcorm.fingerprint import ShapeError, shape
 from dcorm.operations import Operation
+from dcorm.operators import Operator
+from dcorm.result_cache import invalidate
+from dcorm.simplify import simplify
 
 
 __all__ = ['Query']
@@ -16,13 +24,135 @@ class Query:    # pylint: disable=R0903
 
     def __init__(self, operation: Operation):
         self._operation: Operation = operation
-        self._where: Union[Expression, bool] = True
+        self._where: list[Union[Expression, bool]] = []
+        self._simplified: Optional[Union[Expression, bool]] = None
 
     def where(self, expression: Union[Expression, bool]) -> Query:
         """Updates the where clause."""
-        self._where &= expression
+        self._where.append(expression)
+        self._simplified = None
         return self
 
-    def execute(self, database: Optional[Database] = None) -> Any:
-        """Executes the query."""
+    @property
+    def _conditions(self) -> list[Union[Expression, bool]]:
+        """Returns the conditions of the where clause."""
+        return self._where
+
+    @property
+    def _condition(self) -> Union[Expression, bool]:
+        """Returns the simplified conjunction of the where clauses."""
+        if self._simplified is None:
+            self._simplified = simplify(
+                Junction(Operator.AND, tuple(self._conditions)))
+
+        return self._simplified
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
         raise NotImplementedError()
+
+    def __sql__(self, context: Context) -> Context:
+        """Renders the query, re-using a cached template if possible.
+
+        Queries of objects rendered by registered compilers are not cached.
+        """
+        if (cache := (engine := context.engine).statement_cache) is None:
+            return self._compile(context)
+
+        values = []
+
+        try:
+            key = (engine, shape(self, values))
+        except ShapeError:
+            return self._compile(context)
+
+        if (template := cache.get(key)) is None:
+            compiled = self._compile(Context(engine))
+            template, values = compiled.template, compiled.values
+            cache.set(key, template)
+
+        return context.raw_value(template, values)
+
+    def _compile(self, context: Context) -> Context:
+        """Renders the query without using the statement cache."""
+        raise NotImplementedError()
+
+    @property
+    def _database(self) -> Optional[Database]:
+        """Returns the database of the queried model."""
+        return None
+
+    @property
+    def _tables(self) -> tuple[str, ...]:
+        """Returns the names of the tables the query reads or writes."""
+        return ()
+
+    @property
+    def _plan_tables(self) -> dict[str, str]:
+        """Returns the names of the tables the query
+        reads or writes by their names in query plans.
+        """
+        return plan_names(self._tables)
+
+    def _get_database(self, database: Optional[Database]) -> Database:
+        """Returns the database to execute the query on."""
+        return get_database(database, self._database)
+
+    def _statement(self, database: Union[Database, AsyncDatabase]
+                   ) -> tuple[str, Parameters]:
+        """Returns the SQL and parameters of the query."""
+        return database.compile(self)
+
+    def _check_plan(self, database: Database, sql: str,
+                    parameters: Parameters) -> None:
+        """Checks the query's plan if the database has a plan check."""
+        if (check := database.plan_check) is not None and self._tables:
+            check.check(database, sql, parameters, self._plan_tables)
+
+    async def _acheck_plan(self, database: AsyncDatabase, sql: str,
+                           parameters: Parameters) -> None:
+        """Asynchronously checks the query's plan
+        if the database has a plan check.
+        """
+        if (check := database.plan_check) is not None and self._tables:
+            await check.acheck(database, sql, parameters, self._plan_tables)
+
+    def explain(self, database: Optional[Database] = None) -> PlanNode:
+        """Returns the query's plan as a tree."""
+        database = self._get_database(database)
+        return explain(database, *self._statement(database))
+
+    async def aexplain(self, database: Optional[AsyncDatabase] = None
+                       ) -> PlanNode:
+        """Asynchronously returns the query's plan as a tree."""
+        database = self._get_database(database)
+        return await aexplain(database, *self._statement(database))
+
+    def execute(self, database: Optional[Database] = None) -> Any:
+        """Executes the query and returns the amount of affected rows.
+
+        Cached results read from the written tables are invalidated.
+        """
+        database = self._get_database(database)
+        sql, parameters = self._statement(database)
+        self._check_plan(database, sql, parameters)
+
+        try:
+            return database.execute(sql, parameters)
+        finally:
+            invalidate(database, self._tables)
+
+    async def aexecute(self, database: Optional[AsyncDatabase] = None) -> Any:
+        """Asynchronously executes the query and returns
+        the amount of affected rows.
+
+        Cached results read from the written tables are invalidated.
+        """
+        database = self._get_database(database)
+        sql, parameters = self._statement(database)
+        await self._acheck_plan(database, sql, parameters)
+
+        try:
+            return await database.execute(sql, parameters)
+        finally:
+            invalidate(database, self._tables)
+
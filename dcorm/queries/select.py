@@ -1,21 +1,36 @@
 """Select queries."""
 
 from __future__ import annotations
-from typing import Iterator, Optional, Union
+from typing import Any, AsyncIterator, Callable, Hashable, Iterator
+from typing import Optional, Sequence
+from typing import Union
 from warnings import warn
 
+from dcorm.aio import AsyncDatabase, AsyncResultIterator
 from dcorm.alias import Alias, AliasManager
-from dcorm.column import Column, ColumnSelect, OrderedColumn
-from dcorm.database import Database
-from dcorm.engine import Engine
+from dcorm.column import COMMA, Column, ColumnSelect, OrderedColumn
+from dcorm.column import Projection
+from dcorm.columnar import ColumnArray, ColumnBuffer, buffers, columns_of
+from dcorm.context import Context
+from dcorm.deferred import DeferredLoader
+from dcorm.database import Database, Parameters
 from dcorm.expression import Expression
-from dcorm.inspection import columns
-from dcorm.joins import Join, JoinType
+from dcorm.expression_base import Junction
+from dcorm.fingerprint import shape
+from dcorm.identity_map import IdentityMap
+from dcorm.joins import Join, JoinType, tables
 from dcorm.literal import binary
 from dcorm.model import ModelType
 from dcorm.operations import Operation
+from dcorm.pagination import key_getter, key_order, keyset, plain_key_getter
 from dcorm.queries.query import Query
-from dcorm.relations import find_relation
+from dcorm.prefetch import Prefetch, aprefetch, chunk_size, plan, prefetch
+from dcorm.relations import find_path, find_relation, model_of
+from dcorm.explain import plan_names
+from dcorm.result_cache import ResultCache, cache_key, table_name
+from dcorm.result_cache import table_names
+from dcorm.results import BATCH_SIZE, ResultIterator, RowFactory, RowType
+from dcorm.results import plain_row_factory, row_factory
 
 
 __all__ = ['select']
@@ -24,6 +39,9 @@ __all__ = ['select']
 SelectItem = Union[Alias, ModelType, Column]
 FROM = binary('FROM')
 WHERE = binary('WHERE')
+ORDER_BY = binary('ORDER BY')
+LIMIT = binary('LIMIT')
+OFFSET = binary('OFFSET')
 
 
 def extract_columns(item: SelectItem) -> Iterator[Column]:
@@ -34,7 +52,7 @@ def extract_columns(item: SelectItem) -> Iterator[Column]:
         return
 
     if isinstance(item, (Alias, ModelType)):
-        yield from columns(item)
+        yield from item.__column_table__.selected
         return
 
     raise TypeError(f'Cannot extract columns from {type(item)}.')
@@ -57,11 +75,93 @@ class SelectQuery(Query):
         self._limit: Optional[int] = None
         self._offset: Optional[int] = None
         self._alias_manager: AliasManager = AliasManager()
+        self._join_columns_only = False
+        self._prefetch: list[ModelType] = []
+        self._after: Optional[Union[Expression, Junction, bool]] = None
+        self._cached = False
+        self._cache_ttl: Optional[float] = None
+        self._row_type: Optional[RowType] = None
 
-    def __sql__(self, engine: Engine) -> Engine:
-        return engine.literal(self._operation).sql(
-            ColumnSelect(*self._columns)).literal(FROM).sql(
-            self._from).literal(WHERE).sql(self._where)
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            SelectQuery,
+            tuple(shape(item, values) for item in self._selection),
+            shape(self._from, values),
+            None if (condition := self._condition) is True
+            else shape(condition, values),
+            tuple(shape(item, values) for item in self._order_by),
+            None if self._limit is None else shape(self._limit, values),
+            None if self._offset is None else shape(self._offset, values)
+        )
+
+    def _compile(self, context: Context) -> Context:
+        self._compile_items(context.literal(self._operation))
+        context.literal(FROM).sql(self._from)
+
+        if (condition := self._condition) is not True:
+            context.literal(WHERE).sql(condition)
+
+        if self._order_by:
+            context.literal(ORDER_BY).sql(ColumnSelect(*self._order_by))
+
+        if self._limit is not None:
+            context.literal(LIMIT).sql(self._limit)
+        elif (self._offset is not None
+              and (limit_max := context.engine.limit_max) is not None):
+            context.literal(LIMIT).raw_value(str(limit_max), ())
+
+        if self._offset is not None:
+            context.literal(OFFSET).sql(self._offset)
+
+        return context
+
+    def _compile_items(self, context: Context) -> Context:
+        """Renders the selected items.
+
+        Models and aliases are rendered from
+        their pre-rendered lists of columns.
+        """
+        for index, item in enumerate(self._selection):
+            if index:
+                context.literal(COMMA)
+
+            if isinstance(item, (Column, Projection)):
+                context.sql(item)
+            else:
+                context.raw_value(
+                    item.__identifiers__(context.engine).select, ())
+
+        return context
+
+    @property
+    def _selection(self) -> list[Union[SelectItem, Projection]]:
+        """Returns the selected items.
+
+        If only join columns are to be selected, joined models
+        and aliases are replaced by projections of their
+        primary key and the columns used in join conditions.
+        """
+        if not self._join_columns_only:
+            return self._items
+
+        root, *_ = tables(self._from)
+        used = set(map(id, join_columns(self._from)))
+        return [
+            item if isinstance(item, Column) or item is root
+            else Projection(item, tuple(
+                column for column in item.__column_table__
+                if id(column) in used or column.field.metadata.get('primary')
+            )) for item in self._items
+        ]
+
+    def only_join_columns(self, enabled: bool = True) -> SelectQuery:
+        """Selects only the primary key and the join
+        columns of joined models and aliases.
+
+        The other fields of their records are not loaded.
+        """
+        self._join_columns_only = enabled
+        return self
 
     @property
     def _columns(self) -> Iterator[Column]:
@@ -78,11 +178,149 @@ class SelectQuery(Query):
              typ: JoinType = JoinType.INNER,
              # pylint: disable-next=C0103
              on: Optional[Expression] = None) -> Query:
-        """Updates the join."""
-        if on is None:
-            on = find_relation(self._from, other)
+        """Updates the join.
 
-        self._from = Join(self._from, typ, other, on)
+        Without a join condition, the condition is derived from the
+        foreign keys. If the other table is not directly related to
+        any of the joined tables, the models on the shortest path
+        of relations to it are joined as well.
+        """
+        if on is not None:
+            self._from = Join(self._from, typ, other, on)
+            return self
+
+        for lhs, rhs in find_path(tables(self._from), other):
+            self._from = Join(self._from, typ, rhs, find_relation(lhs, rhs))
+
+        return self
+
+    def prefetch(self, *models: ModelType) -> SelectQuery:
+        """Prefetches records of related models.
+
+        Each model must be related to the first selected model or
+        to a model prefetched before it. For each batch of results,
+        the related records are fetched with one query per model and
+        chunk of keys. They are available through related().
+        """
+        self._prefetch.extend(models)
+        return self
+
+    @property
+    def _conditions(self) -> list[Union[Expression, Junction, bool]]:
+        if self._after is None:
+            return self._where
+
+        return [*self._where, self._after]
+
+    def paginate_after(self, last: Any, page_size: int) -> SelectQuery:
+        """Selects the page of results following the given result
+        of a previous page, or the first page if it is None.
+
+        The results are ordered by the ordered columns and the primary
+        key of the first selected model, which must be selected along
+        with the ordered columns. Rather than skipping the previous
+        rows, the rows following the last result are selected by
+        comparing the ordered columns to its values.
+        """
+        order = self._key_order()
+        self._order_by = order
+        self._limit = page_size
+        self._simplified = None
+        self._after = None if last is None else keyset(
+            order, self._key_getter(order)(last))
+        return self
+
+    def pages(self, page_size: int, database: Optional[Database] = None
+              ) -> Iterator[list[Any]]:
+        """Yields all results in pages of the given size."""
+        last = None
+
+        while True:
+            if page := list(
+                    self.paginate_after(last, page_size).execute(database)):
+                yield page
+
+            if len(page) < page_size:
+                return
+
+            last = page[-1]
+
+    async def apages(self, page_size: int,
+                     database: Optional[AsyncDatabase] = None
+                     ) -> AsyncIterator[list[Any]]:
+        """Asynchronously yields all results in pages of the given size."""
+        last = None
+
+        while True:
+            async with await self.paginate_after(
+                    last, page_size).aexecute(database) as results:
+                page = [record async for record in results]
+
+            if page:
+                yield page
+
+            if len(page) < page_size:
+                return
+
+            last = page[-1]
+
+    def _key_order(self) -> list[OrderedColumn]:
+        """Returns the total ordering of the results."""
+        root = tables(self._from)[0]
+
+        if (primary_key := model_of(root).__column_table__.primary_key
+                ) is None:
+            raise ValueError(f'Model has no primary key: {model_of(root)}')
+
+        return key_order(
+            self._order_by, getattr(root, primary_key.field.name))
+
+    def _key_getter(self, order: list[OrderedColumn]
+                    ) -> Callable[[Any], tuple[Any, ...]]:
+        """Returns a function that returns the values
+        of the ordered columns from a result.
+        """
+        if self._row_type is None:
+            return key_getter(self._items, order)
+
+        return plain_key_getter(
+            columns_of(self._selection), order,
+            self._row_type is RowType.DICT
+        )
+
+    def tuples(self) -> SelectQuery:
+        """Returns the results as tuples of the selected
+        columns' values instead of records.
+        """
+        self._row_type = RowType.TUPLE
+        return self
+
+    def dicts(self) -> SelectQuery:
+        """Returns the results as dicts of the selected
+        columns' values by field name instead of records.
+        """
+        self._row_type = RowType.DICT
+        return self
+
+    def namedtuples(self) -> SelectQuery:
+        """Returns the results as named tuples of the selected
+        columns' values by field name instead of records.
+        """
+        self._row_type = RowType.NAMEDTUPLE
+        return self
+
+    def cached(self, ttl: Optional[float] = None) -> SelectQuery:
+        """Caches the results in the database's result cache.
+
+        Cached results expire after the given time to live or else
+        the cache's default one. They are invalidated when a table
+        they were read from is written to by a query and again when
+        the writing transaction ends. Results are cached when executed
+        outside of transactions, within which the cache is bypassed.
+        Without a result cache the query is executed.
+        """
+        self._cached = True
+        self._cache_ttl = ttl
         return self
 
     def order_by(self, *items: Union[Column, OrderedColumn]) -> SelectQuery:
@@ -102,6 +340,7 @@ class SelectQuery(Query):
             warn(f'Overriding previous limit of {previous}')
 
         self._limit = limit
+        return self
 
     def offset(self, offset: int) -> SelectQuery:
         """Sets the offset."""
@@ -109,12 +348,378 @@ class SelectQuery(Query):
             warn(f'Overriding previous offset of {previous}')
 
         self._offset = offset
+        return self
+
+    @property
+    def _database(self) -> Optional[Database]:
+        """Returns the database of the first selected model."""
+        table = self._from
+
+        while isinstance(table, Join):
+            table = table.lhs
+
+        return table.__database__
+
+    @property
+    def _tables(self) -> tuple[str, ...]:
+        return table_names(self._from)
+
+    @property
+    def _plan_tables(self) -> dict[str, str]:
+        return plan_names(self._tables, {
+            table.name: table_name(table.model)
+            for table in tables(self._from) if isinstance(table, Alias)
+        })
+
+    def _cache(self, database: Union[Database, AsyncDatabase], sql: str,
+               parameters: Parameters) -> tuple[
+            Optional[ResultCache], Optional[Hashable]]:
+        """Returns the result cache and the cache key to use, if any.
+
+        Within transactions, the cache is bypassed, since the results
+        may include the transaction's uncommitted changes.
+        """
+        if not self._cached or database.in_transaction or (
+                cache := database.result_cache) is None:
+            return None, None
+
+        return cache, cache_key(sql, parameters)
+
+    def _cached_rows(self, database: Database, sql: str,
+                     parameters: Parameters) -> Optional[list[Any]]:
+        """Returns the cached rows or fetches and caches them.
+
+        Unless cached rows are returned, the query's plan is checked.
+        """
+        cache, key = self._cache(database, sql, parameters)
+
+        if key is not None and (rows := cache.get(key)) is not None:
+            return rows
+
+        self._check_plan(database, sql, parameters)
+
+        if key is None:
+            return None
+
+        versions = cache.versions(tables := self._tables)
+        return cache.set(key, tables, versions,
+                         database.fetchall(sql, parameters), self._cache_ttl)
 
-    def execute(self, database: Optional[Database] = None):
-        """Executes the query."""
+    async def _acached_rows(self, database: AsyncDatabase, sql: str,
+                            parameters: Parameters) -> Optional[list[Any]]:
+        """Returns the cached rows or asynchronously fetches and caches
+        them.
+
+        Unless cached rows are returned, the query's plan is checked.
+        """
+        cache, key = self._cache(database, sql, parameters)
+
+        if key is not None and (rows := cache.get(key)) is not None:
+            return rows
+
+        await self._acheck_plan(database, sql, parameters)
+
+        if key is None:
+            return None
+
+        versions = cache.versions(tables := self._tables)
+        return cache.set(
+            key, tables, versions,
+            await database.fetchall(sql, parameters), self._cache_ttl
+        )
+
+    def _prepare(
+            self, database: Optional[Union[Database, AsyncDatabase]],
+            identities: Optional[IdentityMap] = None
+    ) -> tuple[Union[Database, AsyncDatabase], str, Parameters, RowFactory]:
+        """Returns the database, SQL, parameters and row factory."""
+        database = self._get_database(database)
+        sql, parameters = self._statement(database)
+
+        if self._row_type is not None:
+            return database, sql, parameters, plain_row_factory(
+                self._selection, self._row_type)
+
+        return database, sql, parameters, row_factory(
+            self._selection,
+            None if identities is None else identities.hydrator
+        )
+
+    def _statement(self, database: Union[Database, AsyncDatabase]
+                   ) -> tuple[str, Parameters]:
         with self._alias_manager as manager:
             manager.register_aliases(self._aliases)
-            return super().execute(database=database)
+            return database.compile(self)
+
+    def _prefetcher(
+            self, database: Union[Database, AsyncDatabase],
+            identities: Optional[IdentityMap] = None
+    ) -> Optional[Callable[[list[Any]], Any]]:
+        """Returns a function that prefetches the related records
+        of a batch of results, asynchronously on asynchronous databases.
+        """
+        if not (plans := self._plan_prefetch()):
+            return None
+
+        size = chunk_size(database.engine, BATCH_SIZE)
+        roots = root_records(len(self._items))
+        fetch = fetcher(
+            lambda model, column, keys: select(model).where(column << keys),
+            database, identities
+        )
+
+        if isinstance(database, AsyncDatabase):
+            return lambda records: aprefetch(
+                roots(records), plans, fetch, size)
+
+        return lambda records: prefetch(roots(records), plans, fetch, size)
+
+    def _deferrer(self, database: Union[Database, AsyncDatabase]
+                  ) -> Optional[Callable[[list[Any]], None]]:
+        """Returns a function that attaches loaders of
+        deferred columns to a batch of results.
+        """
+        if self._row_type is not None or not (indexes := [
+                index for index, item in enumerate(self._selection)
+                if has_deferred(item)
+        ]):
+            return None
+
+        size = chunk_size(database.engine, BATCH_SIZE)
+        fetch = fetcher(
+            lambda key, column, keys: select(key, column).where(key << keys),
+            database
+        )
+        loaders = {
+            'afetch' if isinstance(database, AsyncDatabase) else 'fetch': fetch
+        }
+        single = len(self._items) == 1
+
+        def defer(records: list[Any]) -> None:
+            for index in indexes:
+                batch = records if single else [
+                    record[index] for record in records]
+                loader = DeferredLoader(batch, size, **loaders)
+
+                for record in batch:
+                    object.__setattr__(record, '__deferred__', loader)
+
+        return defer
+
+    def _processor(
+            self, database: Union[Database, AsyncDatabase],
+            identities: Optional[IdentityMap] = None
+    ) -> Optional[Callable[[list[Any]], Any]]:
+        """Returns a function that processes a batch of results.
+
+        On asynchronous databases, it returns an awaitable.
+        """
+        defer = self._deferrer(database)
+        fetch = self._prefetcher(database, identities)
+
+        if defer is None or fetch is None:
+            return defer or fetch
+
+        def process(records: list[Any]) -> Any:
+            defer(records)
+            return fetch(records)
+
+        return process
+
+    def _plan_prefetch(self) -> list[Prefetch]:
+        """Plans the prefetching of related records."""
+        if not self._prefetch:
+            return []
+
+        if isinstance(root := self._items[0], Column):
+            raise TypeError('Cannot prefetch related records of a column.')
+
+        if self._row_type is not None:
+            raise TypeError(
+                f'Cannot prefetch related records of {self._row_type.value}s.')
+
+        return plan(model_of(root), self._prefetch)
+
+    def __iter__(self) -> ResultIterator:
+        return self.execute()
+
+    def execute(self, database: Optional[Database] = None, *,
+                batch_size: int = BATCH_SIZE,
+                identities: Optional[IdentityMap] = None) -> ResultIterator:
+        """Executes the query and returns a lazy iterator over the results.
+
+        Rows are fetched in batches of the given size.
+        Records cached in the identity map are re-used.
+        """
+        database, sql, parameters, factory = self._prepare(
+            database, identities)
+        return ResultIterator(
+            database, sql, parameters, factory, batch_size=batch_size,
+            process=self._processor(database, identities),
+            rows=self._cached_rows(database, sql, parameters)
+        )
+
+    def _buffers(self, batch_size: int, use_numpy: Optional[bool]
+                 ) -> dict[str, ColumnBuffer]:
+        """Returns the buffers of the selected columns."""
+        return buffers(
+            columns_of(self._selection),
+            batch_size if self._limit is None else min(
+                batch_size, max(1, self._limit)),
+            use_numpy
+        )
+
+    def to_columns(
+            self, database: Optional[Database] = None, *,
+            batch_size: int = BATCH_SIZE,
+            use_numpy: Optional[bool] = None
+    ) -> dict[str, ColumnArray]:
+        """Executes the query and returns the values of the selected
+        columns by their field names, instead of records.
+
+        Rows are fetched in batches of the given size and their values
+        are appended to an array per column. Numeric columns are stored
+        in NumPy arrays if NumPy is installed or else in arrays of the
+        standard library. Other columns are stored as objects.
+        """
+        database, sql, parameters, _ = self._prepare(database)
+        result = self._buffers(batch_size, use_numpy)
+
+        if (rows := self._cached_rows(database, sql, parameters)) is not None:
+            fill(result, rows, batch_size)
+        else:
+            with database.cursor() as cursor:
+                cursor.execute(sql, parameters)
+
+                while rows := cursor.fetchmany(batch_size):
+                    fill(result, rows, batch_size)
+
+        return arrays(result)
+
+    async def ato_columns(
+            self, database: Optional[AsyncDatabase] = None, *,
+            batch_size: int = BATCH_SIZE,
+            use_numpy: Optional[bool] = None
+    ) -> dict[str, ColumnArray]:
+        """Asynchronously executes the query and returns the values
+        of the selected columns by their field names.
+        """
+        database, sql, parameters, _ = self._prepare(database)
+        result = self._buffers(batch_size, use_numpy)
+
+        if (rows := await self._acached_rows(
+                database, sql, parameters)) is not None:
+            fill(result, rows, batch_size)
+        else:
+            async with database.cursor() as cursor:
+                await cursor.execute(sql, parameters)
+
+                while rows := await cursor.fetchmany(batch_size):
+                    fill(result, rows, batch_size)
+
+        return arrays(result)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async with await self.aexecute() as results:
+            async for record in results:
+                yield record
+
+    async def aexecute(
+            self, database: Optional[AsyncDatabase] = None, *,
+            batch_size: int = BATCH_SIZE,
+            identities: Optional[IdentityMap] = None
+    ) -> AsyncResultIterator:
+        """Asynchronously executes the query and returns
+        a lazy asynchronous iterator over the results.
+
+        Rows are fetched in batches of the given size.
+        Records cached in the identity map are re-used.
+        """
+        database, sql, parameters, factory = self._prepare(
+            database, identities)
+        return await AsyncResultIterator(
+            database, sql, parameters, factory, batch_size=batch_size,
+            process=self._processor(database, identities),
+            rows=await self._acached_rows(database, sql, parameters)
+        ).open()
+
+
+def fill(buffers: dict[str, ColumnBuffer], rows: Sequence[Sequence[Any]],
+         batch_size: int) -> None:
+    """Appends the values of the rows to the column buffers in batches."""
+
+    for start in range(0, len(rows), batch_size):
+        for target, values in zip(
+                buffers.values(), zip(*rows[start:start + batch_size])):
+            target.extend(values)
+
+
+def arrays(buffers: dict[str, ColumnBuffer]) -> dict[str, ColumnArray]:
+    """Returns the values of the column buffers by their field names."""
+
+    return {name: target.result() for name, target in buffers.items()}
+
+
+def has_deferred(item: Union[SelectItem, Projection]) -> bool:
+    """Checks whether records of the item lack deferred columns."""
+
+    if isinstance(item, Column):
+        return False
+
+    if isinstance(item, Projection):
+        item = item.table
+
+    return len((table := item.__column_table__).selected) < len(table)
+
+
+def join_columns(source: Union[Alias, ModelType, Join]) -> Iterator[Column]:
+    """Yields the columns used in the join conditions."""
+
+    while isinstance(source, Join):
+        stack = [source.on]
+
+        while stack:
+            if isinstance(node := stack.pop(), Column):
+                yield node
+            elif isinstance(node, Expression):
+                stack.extend((node.lhs, node.rhs))
+            elif isinstance(node, Junction):
+                stack.extend(node.operands)
+
+        source = source.lhs
+
+
+def fetcher(
+        query: Callable[..., SelectQuery],
+        database: Union[Database, AsyncDatabase],
+        identities: Optional[IdentityMap] = None
+) -> Callable[..., Any]:
+    """Returns a function that executes the query returned by the given
+    function for its arguments and returns the results, asynchronously
+    on asynchronous databases.
+    """
+
+    if isinstance(database, AsyncDatabase):
+        async def afetch(*args: Any) -> list[Any]:
+            return [
+                result async for result in await query(*args).aexecute(
+                    database, identities=identities)
+            ]
+
+        return afetch
+
+    return lambda *args: query(*args).execute(database, identities=identities)
+
+
+def root_records(items: int) -> Callable[[list[Any]], list[Any]]:
+    """Returns a function that returns the records of the first
+    selected item from a batch of results.
+    """
+
+    if items == 1:
+        return lambda records: records
+
+    return lambda records: [record[0] for record in records]
 
 
 def select(*items: SelectItem) -> SelectQuery:
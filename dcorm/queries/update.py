@@ -0,0 +1,234 @@
+"""Update queries."""
+
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Hashable, Iterable, Iterator, Optional, Sequence
+from typing import Union
+
+from dcorm.aio import AsyncDatabase
+from dcorm.case import Case
+from dcorm.column import Column
+from dcorm.context import Context
+from dcorm.database import Database, get_database
+from dcorm.fingerprint import shape
+from dcorm.identity_map import IdentityMap
+from dcorm.inspection import primary_key
+from dcorm.literal import binary
+from dcorm.model import Model, ModelType
+from dcorm.operations import Operation
+from dcorm.operators import Operator
+from dcorm.queries.query import Query
+from dcorm.result_cache import table_names
+
+
+__all__ = [
+    'BATCH_SIZE', 'BulkUpdate', 'UpdateQuery', 'bulk_update', 'update'
+]
+
+
+BATCH_SIZE = 1000
+SET = binary('SET')
+WHERE = binary('WHERE')
+Row = Union[Model, dict[str, Any]]
+
+
+class UpdateQuery(Query):
+    """An UPDATE query."""
+
+    def __init__(self, model: ModelType):
+        super().__init__(Operation.UPDATE)
+        self._model = model
+        self._assignments: list[tuple[Column, Any]] = []
+
+    def set(self, values: Optional[dict[Column, Any]] = None,
+            **fields: Any) -> UpdateQuery:
+        """Adds assignments of columns or field names to values."""
+        if values is not None:
+            self._assignments.extend(values.items())
+
+        for name, value in fields.items():
+            self._assignments.append((column(self._model, name), value))
+
+        return self
+
+    def __fingerprint__(self, values: list[Any]) -> Hashable:
+        return (
+            UpdateQuery,
+            self._model,
+            tuple(
+                (target.name, shape(value, values))
+                for target, value in self._assignments
+            ),
+            None if (condition := self._condition) is True
+            else shape(condition, values)
+        )
+
+    def _compile(self, context: Context) -> Context:
+        if not self._assignments:
+            raise ValueError('No values to update.')
+
+        context.literal(self._operation).sql(self._model).literal(SET)
+
+        for index, (target, value) in enumerate(self._assignments):
+            if index:
+                context.raw_value(', ', ())
+
+            context.raw_value(context.quote(target.name), ())
+            context.literal(Operator.EQ).sql(value)
+
+        if (condition := self._condition) is not True:
+            context.literal(WHERE).sql(condition)
+
+        return context
+
+    @property
+    def _database(self) -> Optional[Database]:
+        return self._model.__database__
+
+    @property
+    def _tables(self) -> tuple[str, ...]:
+        return table_names(self._model)
+
+
+class BulkUpdate:
+    """Updates many rows with different values.
+
+    Each chunk of rows is updated by one statement, which selects the
+    new values by the rows' keys with CASE expressions. The chunk size
+    respects the engine's limit of bound parameters. All chunks are
+    updated within one transaction.
+    """
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            model: ModelType,
+            rows: Iterable[Row],
+            fields: Sequence[Union[Column, str]],
+            *,
+            key: Optional[Column] = None,
+            batch_size: Optional[int] = None
+    ):
+        self.model = model
+        self.rows = rows
+        self.columns = [
+            item if isinstance(item, Column) else column(model, item)
+            for item in fields
+        ]
+        self.key = primary_key(model) if key is None else key
+        self.batch_size = batch_size
+
+    def chunk_size(self, database: Database) -> int:
+        """Returns the amount of rows to update per statement."""
+        size = self.batch_size or BATCH_SIZE
+
+        if (limit := database.engine.max_params) is None:
+            return size
+
+        return max(1, min(size, limit // (2 * len(self.columns) + 1)))
+
+    def chunks(self, database: Database) -> Iterator[list[Row]]:
+        """Yields chunks of rows."""
+        rows = iter(self.rows)
+        size = self.chunk_size(database)
+
+        while chunk := list(islice(rows, size)):
+            yield chunk
+
+    def query(self, chunk: list[Row]) -> UpdateQuery:
+        """Returns the UPDATE query for a chunk of rows."""
+        keys = [row_value(row, self.key) for row in chunk]
+        return update(self.model).set({
+            target: Case(self.key, [
+                (key, row_value(row, target))
+                for key, row in zip(keys, chunk)
+            ], target)
+            for target in self.columns
+        }).where(self.key << keys)
+
+    def invalidate(self, identities: Optional[IdentityMap],
+                   chunk: list[Row]) -> None:
+        """Invalidates the records of a chunk of rows in the identity map.
+
+        Unless the rows are keyed by primary key, all
+        records of the model are invalidated instead.
+        """
+        if identities is None:
+            return
+
+        if self.key is not self.model.__column_table__.primary_key:
+            identities.invalidate(self.model)
+        else:
+            identities.invalidate(
+                self.model, [row_value(row, self.key) for row in chunk])
+
+    def execute(self, database: Optional[Database] = None, *,
+                identities: Optional[IdentityMap] = None) -> int:
+        """Updates the rows and returns the amount of updated rows.
+
+        The updated records are invalidated in the identity map.
+        """
+        database = get_database(database, self.model.__database__)
+
+        count = 0
+
+        with database.atomic():
+            for chunk in self.chunks(database):
+                self.invalidate(identities, chunk)
+                count += self.query(chunk).execute(database)
+
+        return count
+
+    async def aexecute(self, database: Optional[AsyncDatabase] = None, *,
+                       identities: Optional[IdentityMap] = None) -> int:
+        """Asynchronously updates the rows and returns
+        the amount of updated rows.
+
+        The updated records are invalidated in the identity map.
+        """
+        database = get_database(database, self.model.__database__)
+
+        count = 0
+
+        async with database.atomic():
+            for chunk in self.chunks(database):
+                self.invalidate(identities, chunk)
+                count += await self.query(chunk).aexecute(database)
+
+        return count
+
+
+def column(model: ModelType, name: str) -> Column:
+    """Returns the model's column of the given field name."""
+
+    if isinstance(value := getattr(model, name, None), Column):
+        return value
+
+    raise AttributeError(f'{model} has no field {name!r}.')
+
+
+def row_value(row: Row, target: Column) -> Any:
+    """Returns the value of the column's field from a record or dict."""
+
+    if isinstance(row, Model):
+        return getattr(row, target.field.name)
+
+    return row[target.field.name]
+
+
+def update(model: ModelType) -> UpdateQuery:
+    """Creates an update query."""
+
+    return UpdateQuery(model)
+
+
+def bulk_update(
+        model: ModelType,
+        rows: Iterable[Row],
+        fields: Sequence[Union[Column, str]],
+        *,
+        key: Optional[Column] = None,
+        batch_size: Optional[int] = None
+) -> BulkUpdate:
+    """Creates a bulk update of records or dicts."""
+
+    return BulkUpdate(model, rows, fields, key=key, batch_size=batch_size)
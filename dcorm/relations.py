@@ -1,19 +1,197 @@
 """Relations management."""
 
-from typing import Union
+from __future__ import annotations
+from collections import defaultdict, deque
+from typing import Any, Iterable, NamedTuple, Optional, Union
 
 from dcorm.alias import Alias
+from dcorm.column import Column
 from dcorm.expression import Expression
-from dcorm.model import Model
 
 
-__all__ = ['find_relation']
+__all__ = [
+    'GRAPH', 'ForeignKey', 'RelationGraph', 'find_path', 'find_relation'
+]
 
 
-RelationType = Union[Alias, Model]
+RelationType = Union[Alias, Any]    # An alias or a model.
+Reference = Union[Column, Any, str]  # A column, a model or their name.
+
+
+class ForeignKey(NamedTuple):
+    """A column referencing a column of another model."""
+
+    column: Column
+    target: Column
+
+
+class RelationGraph:
+    """Foreign keys between models, indexed by both models.
+
+    Models are registered when they are defined. References by name
+    are resolved once the referenced model has been registered. Names
+    are looked up in the module of the referencing model first and
+    must otherwise be unique.
+    """
+
+    def __init__(self):
+        self.edges: defaultdict[Any, defaultdict[Any, list[ForeignKey]]] = \
+            defaultdict(lambda: defaultdict(list))
+        self.models: defaultdict[str, list[Any]] = defaultdict(list)
+        self.pending: defaultdict[str, list[Column]] = defaultdict(list)
+
+    def register(self, model: Any) -> None:
+        """Registers the model's foreign keys.
+
+        A model replaces a previously defined model of the same
+        qualified name in the same module.
+        """
+        models = self.models[model.__name__]
+        models[:] = [
+            other for other in models if (other.__module__, other.__qualname__)
+            != (model.__module__, model.__qualname__)
+        ]
+        models.append(model)
+
+        for column in model.__column_table__:
+            if (reference := column.field.metadata.get('references')) is None:
+                continue
+
+            if (target := self.resolve(reference, model.__module__)) is None:
+                self.pending[reference.split('.')[0]].append(column)
+            else:
+                self.add(ForeignKey(column, target))
+
+        for column in self.pending.pop(model.__name__, ()):
+            self.add(ForeignKey(column, self.resolve(
+                column.field.metadata['references'], column.table.__module__)))
+
+    def model(self, name: str, module: Optional[str] = None) -> Optional[Any]:
+        """Returns the model of the given name.
+
+        Models of the given module take precedence. Returns None if
+        no such model is defined and raises a ValueError if the name
+        is ambiguous.
+        """
+        if not (models := self.models.get(name)):
+            return None
+
+        if len(models) > 1 and len(models := [
+                model for model in models if model.__module__ == module
+        ]) != 1:
+            raise ValueError(f'Ambiguous model name: {name!r}')
+
+        return models[0]
+
+    def resolve(self, reference: Reference, module: Optional[str] = None
+                ) -> Optional[Column]:
+        """Returns the referenced column.
+
+        Models and model names reference their primary key. Model names
+        are looked up in the given module first. Returns None if the
+        referenced model is not yet defined.
+        """
+        if isinstance(reference, Column):
+            return reference
+
+        if isinstance(reference, str):
+            name, _, attribute = reference.partition('.')
+
+            if (reference := self.model(name, module)) is None:
+                return None
+
+            if attribute:
+                return reference.__column_table__.by_name[attribute]
+
+        if (column := reference.__column_table__.primary_key) is None:
+            raise ValueError(f'Model has no primary key: {reference}')
+
+        return column
+
+    def add(self, foreign_key: ForeignKey) -> None:
+        """Adds a foreign key to the graph."""
+        source = foreign_key.column.table
+        target = foreign_key.target.table
+        self.edges[source][target].append(foreign_key)
+
+        if source is not target:
+            self.edges[target][source].append(foreign_key)
+
+    def foreign_keys(self, lhs: Any, rhs: Any) -> list[ForeignKey]:
+        """Returns the foreign keys between two models."""
+        if (edges := self.edges.get(lhs)) is None:
+            return []
+
+        return edges.get(rhs, [])
+
+    def path(self, sources: Iterable[Any], target: Any) -> list[Any]:
+        """Returns the shortest path of models from
+        any of the source models to the target model.
+        """
+        previous = {source: None for source in sources}
+        queue = deque(previous)
+        sources = list(previous)
+
+        while queue:
+            if (model := queue.popleft()) is target:
+                path = []
+
+                while model is not None:
+                    path.append(model)
+                    model = previous[model]
+
+                return path[::-1]
+
+            for neighbour in self.edges.get(model, ()):
+                if neighbour not in previous:
+                    previous[neighbour] = model
+                    queue.append(neighbour)
+
+        raise ValueError(f'No relation to {target} from {sources}.')
+
+
+GRAPH = RelationGraph()
+
+
+def model_of(table: RelationType) -> Any:
+    """Returns the model of a model or alias."""
+
+    return table.model if isinstance(table, Alias) else table
 
 
 def find_relation(lhs: RelationType, rhs: RelationType) -> Expression:
     """Returns a relation between the given models or aliases."""
 
-    raise NotImplementedError()
+    source, target = model_of(lhs), model_of(rhs)
+
+    if not (foreign_keys := GRAPH.foreign_keys(source, target)):
+        raise ValueError(f'No relation between {lhs} and {rhs}.')
+
+    if len(foreign_keys) > 1:
+        raise ValueError(f'Ambiguous relation between {lhs} and {rhs}.')
+
+    column, referenced = foreign_keys[0]
+
+    if column.table is not source:
+        lhs, rhs = rhs, lhs
+
+    return getattr(lhs, column.field.name) == getattr(
+        rhs, referenced.field.name)
+
+
+def find_path(tables: Iterable[RelationType], target: RelationType) -> list[
+        tuple[RelationType, RelationType]]:
+    """Returns the pairs of tables to join in order to join the target.
+
+    Tables, which are not yet joined and are on
+    the shortest path to the target, are joined by their models.
+    """
+
+    joined = {}
+
+    for table in tables:
+        joined.setdefault(model_of(table), table)
+
+    path = GRAPH.path(joined, model_of(target))
+    hops = [joined[path[0]], *path[1:-1], target]
+    return list(zip(hops, hops[1:]))
@@ -0,0 +1,279 @@
+"""Caches of query results."""
+
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Hashable, Iterable, NamedTuple, Optional, Sequence
+
+from dcorm.database import Parameters
+from dcorm.joins import tables
+from dcorm.relations import model_of
+
+
+__all__ = [
+    'ResultCache',
+    'LRUResultCache',
+    'SharedResultCache',
+    'cache_key',
+    'invalidate',
+    'table_names'
+]
+
+
+Versions = tuple[int, ...]
+
+
+class Entry(NamedTuple):
+    """A cached result."""
+
+    expires: float
+    tables: tuple[str, ...]
+    versions: Versions
+    rows: list[tuple[Any, ...]]
+
+
+class ResultCache:
+    """Base class of caches of the rows of select queries.
+
+    Entries are keyed on the SQL and parameters and expire after their
+    time to live. Each table has a version, which is incremented when
+    it is written to. Entries are valid as long as the tables they were
+    read from have the versions they had before the query was executed.
+    Subclasses store the entries and versions.
+    """
+
+    clock = staticmethod(monotonic)
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[list[tuple[Any, ...]]]:
+        """Returns the cached rows if they are still valid."""
+        if (entry := self._load(key)) is None:
+            self.misses += 1
+            return None
+
+        if (
+                entry.expires < self.clock()
+                or entry.versions != self.versions(entry.tables)
+        ):
+            self._discard(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.rows
+
+    def set(    # pylint: disable=R0913
+            self,
+            key: Hashable,
+            tables: Sequence[str],
+            versions: Versions,
+            rows: Iterable[Sequence[Any]],
+            ttl: Optional[float] = None
+    ) -> list[tuple[Any, ...]]:
+        """Stores the rows read from the tables at the given versions."""
+        rows = [tuple(row) for row in rows]
+        self._store(key, Entry(
+            self.clock() + (self.ttl if ttl is None else ttl),
+            tuple(tables), versions, rows
+        ))
+        return rows
+
+    def versions(self, tables: Sequence[str]) -> Versions:
+        """Returns the current versions of the tables."""
+        raise NotImplementedError()
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """Invalidates the entries read from any of the tables."""
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """Clears the cache."""
+        raise NotImplementedError()
+
+    def _load(self, key: Hashable) -> Optional[Entry]:
+        """Returns the entry of the key if stored."""
+        raise NotImplementedError()
+
+    def _store(self, key: Hashable, entry: Entry) -> None:
+        """Stores an entry."""
+        raise NotImplementedError()
+
+    def _discard(self, key: Hashable) -> None:
+        """Removes an entry if stored."""
+        raise NotImplementedError()
+
+
+class LRUResultCache(ResultCache):
+    """In-process LRU cache of query results."""
+
+    def __init__(self, ttl: float = 60, maxsize: int = 256):
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Entry] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def versions(self, tables: Sequence[str]) -> Versions:
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def _load(self, key: Hashable) -> Optional[Entry]:
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def _store(self, key: Hashable, entry: Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SharedResultCache(ResultCache):
+    """Cache of query results shared between processes.
+
+    Entries and versions are stored in mappings shared through a
+    multiprocessing manager, see create(). The cache may be passed to
+    worker processes. When full, expired entries are removed first and
+    otherwise those expiring first.
+    """
+
+    clock = staticmethod(time)
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            entries: Any,
+            versions: Any,
+            lock: Any,
+            ttl: float = 60,
+            maxsize: int = 1024
+    ):
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries = entries
+        self._versions = versions
+        self._lock = lock
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def create(cls, manager: Any, ttl: float = 60,
+               maxsize: int = 1024) -> SharedResultCache:
+        """Creates a cache shared through a started multiprocessing
+        manager, e.g. multiprocessing.Manager().
+        """
+        return cls(manager.dict(), manager.dict(), manager.Lock(),
+                   ttl=ttl, maxsize=maxsize)
+
+    def versions(self, tables: Sequence[str]) -> Versions:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def _load(self, key: Hashable) -> Optional[Entry]:
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        return Entry(*entry)
+
+    def _store(self, key: Hashable, entry: Entry) -> None:
+        with self._lock:
+            if key not in self._entries and len(
+                    self._entries) >= self.maxsize:
+                self._evict()
+
+            self._entries[key] = tuple(entry)
+
+    def _discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def _evict(self) -> None:
+        """Removes expired entries or else those expiring first."""
+        entries = sorted(
+            ((expires, key) for key, (expires, *_) in self._entries.items()),
+            key=lambda item: item[0]
+        )
+        now = self.clock()
+        expired = [key for expires, key in entries if expires < now]
+
+        for key in expired or [
+                key for _, key in entries[:max(1, self.maxsize // 8)]
+        ]:
+            self._entries.pop(key, None)
+
+
+def cache_key(sql: str, parameters: Parameters) -> Optional[Hashable]:
+    """Returns the cache key of a query, or None
+    if its parameters are not hashable.
+    """
+
+    if isinstance(parameters, dict):
+        key = (sql, tuple(sorted(parameters.items())))
+    else:
+        key = (sql, tuple(parameters))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def table_names(source: Any) -> tuple[str, ...]:
+    """Returns the names of the tables of a model,
+    alias or join, qualified by their schema.
+    """
+
+    return tuple(dict.fromkeys(
+        table_name(model_of(table)) for table in tables(source)))
+
+
+def table_name(model: Any) -> str:
+    """Returns the table name of a model, qualified by its schema."""
+
+    if (schema := model.__schema__) is None:
+        return model.__table_name__
+
+    return f'{schema}.{model.__table_name__}'
+
+
+def invalidate(database: Any, tables: Iterable[str]) -> None:
+    """Invalidates the database's cached results read from the tables."""
+
+    database.invalidate(tables)
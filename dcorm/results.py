@@ -0,0 +1,270 @@
+"""Query results."""
+
+from __future__ import annotations
+from collections import namedtuple
+from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+from dcorm.column import Column, Projection
+from dcorm.columnar import columns_of
+from dcorm.database import BaseDatabase, Parameters
+from dcorm.pool import Connection
+from dcorm.relations import model_of
+
+
+__all__ = [
+    'BATCH_SIZE', 'BaseResultIterator', 'ResultIterator', 'RowType',
+    'plain_row_factory', 'row_factory'
+]
+
+
+BATCH_SIZE = 500
+RowFactory = Callable[[Sequence[Any]], Any]
+Hydrators = Callable[[Any, Sequence[str]], RowFactory]
+
+
+class RowType(Enum):
+    """Types of plain rows."""
+
+    TUPLE = 'tuple'
+    DICT = 'dict'
+    NAMEDTUPLE = 'namedtuple'
+
+
+class BaseResultIterator:    # pylint: disable=R0902
+    """Base class of iterators over the rows of a query.
+
+    Rows are fetched in batches of the given size and converted
+    with the row factory one batch at a time. Each batch of results
+    may be processed further, e.g. to prefetch related records.
+    The connection is held until the rows are exhausted or the
+    iterator is closed. If the rows are given, e.g. from a result
+    cache, the query is not executed. Subclasses perform the I/O.
+    """
+
+    def __init__(   # pylint: disable=R0913
+            self,
+            database: BaseDatabase,
+            sql: str,
+            parameters: Parameters,
+            factory: RowFactory,
+            batch_size: int = BATCH_SIZE,
+            process: Optional[Callable[[list[Any]], Any]] = None,
+            rows: Optional[Iterable[Sequence[Any]]] = None
+    ):
+        self.database = database
+        self.sql = sql
+        self.parameters = parameters
+        self.factory = factory
+        self.batch_size = batch_size
+        self.process = process
+        self.rows = None if rows is None else iter(rows)
+        self._connection: Optional[Connection] = None
+        self._cursor: Optional[Any] = None
+        self._batch: Iterator[Any] = iter(())
+        self._closed = False
+
+    def _given(self) -> Optional[list[Sequence[Any]]]:
+        """Returns the next batch of given rows, an empty
+        batch if closed or None if the rows are to be fetched.
+        """
+        if self._closed:
+            return []
+
+        if self.rows is not None:
+            return list(islice(self.rows, self.batch_size))
+
+        return None
+
+    def _records(self, rows: Sequence[Any]) -> list[Any]:
+        """Converts a batch of rows."""
+        return list(map(self.factory, rows))
+
+    def _detach(self) -> tuple[Optional[Any], Optional[Connection]]:
+        """Marks the iterator closed and returns the cursor and
+        connection to close and release, if not already closed.
+        """
+        if self._closed:
+            return None, None
+
+        self._closed = True
+        self._batch = iter(())
+        cursor, self._cursor = self._cursor, None
+        connection, self._connection = self._connection, None
+        return cursor, connection
+
+
+class ResultIterator(BaseResultIterator):
+    """Lazily iterates over the rows of a query."""
+
+    def __iter__(self) -> ResultIterator:
+        return self
+
+    def __next__(self) -> Any:
+        while True:
+            for record in self._batch:
+                return record
+
+            if not (rows := self._fetch()):
+                self.close()
+                raise StopIteration()
+
+            self._batch = iter(self._convert(rows))
+
+    def __enter__(self) -> ResultIterator:
+        return self
+
+    def __exit__(self, typ, value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def _open(self) -> None:
+        """Executes the query."""
+        self._connection = self.database.acquire()
+
+        try:
+            self._cursor = self._connection.cursor()
+            self._cursor.execute(self.sql, self.parameters)
+        except BaseException:
+            self.close()
+            raise
+
+    def _fetch(self) -> Sequence[Any]:
+        """Fetches the next batch of rows."""
+        if (rows := self._given()) is not None:
+            return rows
+
+        if self._cursor is None:
+            self._open()
+
+        return self._cursor.fetchmany(self.batch_size)
+
+    def _convert(self, rows: Sequence[Any]) -> list[Any]:
+        """Converts and processes a batch of rows."""
+        records = self._records(rows)
+
+        if self.process is not None:
+            self.process(records)
+
+        return records
+
+    def close(self) -> None:
+        """Releases the cursor and the connection."""
+        cursor, connection = self._detach()
+
+        if cursor is not None:
+            cursor.close()
+
+        if connection is not None:
+            try:
+                self.database.autocommit(connection)
+            finally:
+                self.database.release(connection)
+
+
+def row_factory(items: Sequence[Any],
+                hydrators: Optional[Hydrators] = None) -> RowFactory:
+    """Returns a function that converts rows of the selected items.
+
+    Models, aliases and projections are converted into records and
+    columns into their values. If multiple items are selected, rows
+    become tuples. Complete records of models and aliases may be
+    created by the hydrators of an identity map instead.
+    """
+
+    factories = []
+
+    for item in items:
+        if isinstance(item, Column):
+            factories.append((1, None))
+            continue
+
+        if isinstance(item, Projection):
+            model = model_of(item.table)
+            factories.append((len(item.names), model.__hydrator__(
+                item.names)))
+            continue
+
+        names = item.__column_table__.selected_names
+        model = model_of(item)
+        factories.append((len(names), model.__hydrator__(names)
+                          if hydrators is None else hydrators(model, names)))
+
+    if len(factories) == 1:
+        if (factory := factories[0][1]) is None:
+            return lambda row: row[0]
+
+        return factory
+
+    def convert(row: Sequence[Any]) -> tuple[Any, ...]:
+        result = []
+        start = 0
+
+        for size, factory in factories:
+            if factory is None:
+                result.append(row[start])
+            else:
+                result.append(factory(row[start:start + size]))
+
+            start += size
+
+        return tuple(result)
+
+    return convert
+
+
+def plain_row_factory(items: Sequence[Any], typ: RowType) -> RowFactory:
+    """Returns a function that converts rows of the selected items into
+    plain rows of the given type, instead of records.
+
+    The values of models, aliases and projections are flattened into
+    the row in the order of their columns. Values are converted by the
+    fields' converters. Dicts and named tuples are keyed by field name.
+    """
+
+    return make_plain_row_factory(typ, tuple(
+        (model_of(column.table), column.field.name)
+        for column in columns_of(items)
+    ))
+
+
+@lru_cache(maxsize=256)
+def make_plain_row_factory(typ: RowType, fields: tuple[
+        tuple[Any, str], ...]) -> RowFactory:
+    """Generates a function that converts rows into plain rows
+    of the given type, whose values correspond to the given
+    pairs of models and field names.
+    """
+
+    names = [name for _, name in fields]
+
+    if typ is not RowType.TUPLE and len(set(names)) < len(names):
+        raise ValueError(f'Duplicate field names: {names}')
+
+    namespace = {}
+    values = []
+
+    for index, (model, name) in enumerate(fields):
+        if (converter := model.__converters__.get(name)) is None:
+            values.append(f'row[{index}]')
+        else:
+            namespace[f'c{index}'] = converter
+            values.append(
+                f'None if (v := row[{index}]) is None else c{index}(v)')
+
+    if typ is RowType.DICT:
+        result = '{%s}' % ', '.join(
+            f'{name!r}: {value}' for name, value in zip(names, values))
+    elif typ is RowType.NAMEDTUPLE:
+        namespace['Row'] = namedtuple('Row', names)
+        result = f'Row({", ".join(values)})'
+    else:
+        result = f'({", ".join(values)},)' if values else '()'
+
+    exec(   # pylint: disable=W0122
+        f'def convert(row):\n    return {result}\n', namespace)
+    return namespace['convert']
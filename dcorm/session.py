@@ -0,0 +1,131 @@
+"""Sessions with an identity map."""
+
+from __future__ import annotations
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, Optional, Union
+
+from dcorm.aio import AsyncDatabase, AsyncResultIterator
+from dcorm.database import Database
+from dcorm.identity_map import IdentityMap
+from dcorm.queries.delete import DeleteQuery
+from dcorm.queries.insert import BulkInsert, InsertQuery
+from dcorm.queries.select import SelectQuery
+from dcorm.queries.update import BulkUpdate, UpdateQuery
+from dcorm.results import ResultIterator
+
+
+__all__ = ['Session']
+
+
+Write = Union[BulkInsert, BulkUpdate, DeleteQuery, InsertQuery, UpdateQuery]
+
+
+class Session:
+    """Executes queries on a database with an identity map.
+
+    Repeatedly selected records of models with a primary key are the
+    same instances, as long as they have not been evicted. Updates and
+    deletes through the session invalidate the affected records.
+    Records are not refreshed from the database while cached.
+    """
+
+    def __init__(self, database: Union[Database, AsyncDatabase], *,
+                 maxsize: int = 1024):
+        self.database = database
+        self.identities = IdentityMap(maxsize)
+
+    def get(self, model: Any, key: Any) -> Optional[Any]:
+        """Returns the record of the model with the
+        given primary key or None if it does not exist.
+        """
+        if (record := self.identities.get(model, key)) is not None:
+            return record
+
+        return next(iter(self.execute(
+            select_by_key(model, key).limit(1))), None)
+
+    async def aget(self, model: Any, key: Any) -> Optional[Any]:
+        """Asynchronously returns the record of the model with
+        the given primary key or None if it does not exist.
+        """
+        if (record := self.identities.get(model, key)) is not None:
+            return record
+
+        async with await self.aexecute(
+                select_by_key(model, key).limit(1)) as records:
+            async for record in records:
+                return record
+
+        return None
+
+    def execute(self, query: Union[SelectQuery, Write]) -> Union[
+            ResultIterator, int]:
+        """Executes a query.
+
+        Returns an iterator over the results of select
+        queries and the amount of affected rows otherwise.
+        """
+        if isinstance(query, (BulkUpdate, SelectQuery)):
+            return query.execute(self.database, identities=self.identities)
+
+        self.invalidate(query)
+        return query.execute(self.database)
+
+    async def aexecute(self, query: Union[SelectQuery, Write]) -> Union[
+            AsyncResultIterator, int]:
+        """Asynchronously executes a query.
+
+        Returns an iterator over the results of select
+        queries and the amount of affected rows otherwise.
+        """
+        if isinstance(query, (BulkUpdate, SelectQuery)):
+            return await query.aexecute(
+                self.database, identities=self.identities)
+
+        self.invalidate(query)
+        return await query.aexecute(self.database)
+
+    def invalidate(self, query: Write) -> None:
+        """Invalidates the records affected by a write query.
+
+        Inserted rows are new and thus do not affect cached records.
+        Bulk updates invalidate the records of each chunk of rows.
+        """
+        if isinstance(query, (DeleteQuery, UpdateQuery)):
+            # pylint: disable-next=W0212
+            self.identities.invalidate(query._model)
+
+    @contextmanager
+    def atomic(self) -> Iterator[Any]:
+        """Runs the block in a transaction.
+
+        If the transaction is rolled back, the identity map is cleared.
+        """
+        try:
+            with self.database.atomic() as connection:
+                yield connection
+        except BaseException:
+            self.identities.clear()
+            raise
+
+    @asynccontextmanager
+    async def aatomic(self) -> AsyncIterator[Any]:
+        """Runs the block in an asynchronous transaction.
+
+        If the transaction is rolled back, the identity map is cleared.
+        """
+        try:
+            async with self.database.atomic() as connection:
+                yield connection
+        except BaseException:
+            self.identities.clear()
+            raise
+
+
+def select_by_key(model: Any, key: Any) -> SelectQuery:
+    """Returns a query selecting the record with the given primary key."""
+
+    if (primary_key := model.__column_table__.primary_key) is None:
+        raise ValueError(f'Model has no primary key: {model}')
+
+    return SelectQuery(model).where(primary_key == key)
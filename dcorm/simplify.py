@@ -0,0 +1,237 @@
+"""Simplification of conditions."""
+
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Hashable, Optional
+
+from dcorm.compiler import compiler
+from dcorm.containers import CONTAINERS
+from dcorm.expression import Expression
+from dcorm.expression_base import ExpressionBase, Junction
+from dcorm.fingerprint import ShapeError, fingerprint
+from dcorm.operators import Operator
+
+
+__all__ = ['simplify']
+
+
+COMPARISONS = {
+    Operator.EQ: eq,
+    Operator.NE: ne,
+    Operator.LT: lt,
+    Operator.LE: le,
+    Operator.GT: gt,
+    Operator.GE: ge
+}
+MERGES = {
+    Operator.AND: (Operator.NE, Operator.NOT_IN),
+    Operator.OR: (Operator.EQ, Operator.IN)
+}
+
+
+def simplify(condition: Any) -> Any:
+    """Returns an equivalent, simplified condition.
+
+    Constant operands are folded, duplicate operands of junctions are
+    removed, equality comparisons of the same column joined by OR are
+    merged into IN and inequalities joined by AND into NOT IN.
+    Unchanged nodes are returned as they are.
+    """
+
+    if isinstance(condition, Junction):
+        return simplify_junction(condition)
+
+    if isinstance(condition, Expression):
+        return simplify_expression(condition)
+
+    return condition
+
+
+def simplify_junction(junction: Junction) -> Any:
+    """Simplifies an AND or OR junction."""
+
+    # True absorbs disjunctions and is neutral in conjunctions.
+    absorbing = junction.operator is Operator.OR
+    operands = []
+    seen = set()
+    changed = False
+
+    for operand in junction.operands:
+        if (simplified := simplify(operand)) is not operand:
+            changed = True
+
+        if simplified is absorbing:
+            return absorbing
+
+        if simplified is (not absorbing):
+            changed = True
+            continue
+
+        if (
+                isinstance(simplified, Junction)
+                and simplified.operator is junction.operator
+        ):
+            candidates = simplified.operands
+            changed = True
+        else:
+            candidates = (simplified,)
+
+        for candidate in candidates:
+            if (key := identity(candidate)) is not None:
+                if key in seen:
+                    changed = True
+                    continue
+
+                seen.add(key)
+
+            operands.append(candidate)
+
+    if len(merged := merge(operands, *MERGES[junction.operator])) != len(
+            operands):
+        operands, changed = merged, True
+
+    if not operands:
+        return not absorbing
+
+    if len(operands) == 1:
+        return operands[0]
+
+    if changed:
+        return Junction(junction.operator, tuple(operands))
+
+    return junction
+
+
+def simplify_expression(expression: Expression) -> Any:
+    """Simplifies a binary or unary expression."""
+
+    operator, lhs, rhs = expression.operator, expression.lhs, expression.rhs
+
+    if operator is Operator.NOT:
+        if (operand := simplify(lhs)) is True or operand is False:
+            return not operand
+
+        if operand is lhs:
+            return expression
+
+        return Expression(operand, Operator.NOT)
+
+    if operator in {Operator.IN, Operator.NOT_IN}:
+        if isinstance(rhs, (tuple, list, frozenset, set)) and not rhs:
+            return operator is Operator.NOT_IN
+
+        return expression
+
+    if (
+            (function := COMPARISONS.get(operator)) is not None
+            and is_constant(lhs) and is_constant(rhs)
+    ):
+        try:
+            return bool(function(lhs, rhs))
+        except TypeError:
+            return expression
+
+    return expression
+
+
+def merge(operands: list[Any], compare: Operator,
+          test: Operator) -> list[Any]:
+    """Merges comparisons and membership tests of the same column,
+    i.e. equalities and IN tests joined by OR or inequalities
+    and NOT IN tests joined by AND.
+    """
+
+    groups: dict[Hashable, list[Any]] = {}
+    order = []
+
+    for operand in operands:
+        if (key := membership(operand, compare, test)) is None:
+            order.append(operand)
+            continue
+
+        if (values := groups.get(key)) is None:
+            groups[key] = values = []
+            order.append((key, operand))
+
+        if operand.operator is compare:
+            values.append(operand.rhs)
+        else:
+            values.extend(operand.rhs)
+
+    if len(order) == len(operands):
+        return operands
+
+    result = []
+
+    for item in order:
+        if not isinstance(item, tuple):
+            result.append(item)
+        elif len(values := unique(groups[item[0]])) == 1:
+            result.append(Expression(item[1].lhs, compare, values[0]))
+        else:
+            result.append(Expression(item[1].lhs, test, values))
+
+    return result
+
+
+def membership(operand: Any, compare: Operator,
+               test: Operator) -> Optional[Hashable]:
+    """Returns the key of the column that is compared to or
+    tested against constant values, and None otherwise.
+    """
+
+    if not isinstance(operand, Expression):
+        return None
+
+    if operand.operator is compare:
+        if not is_constant(operand.rhs):
+            return None
+    elif operand.operator is test:
+        if not isinstance(operand.rhs, tuple) or not all(
+                map(is_constant, operand.rhs)):
+            return None
+    else:
+        return None
+
+    if not isinstance(operand.lhs, ExpressionBase):
+        return None
+
+    return identity(operand.lhs)
+
+
+def identity(obj: Any) -> Optional[Hashable]:
+    """Returns a hashable key of structurally equal nodes,
+    or None if it cannot be determined.
+    """
+
+    try:
+        key, values = fingerprint(obj)
+    except ShapeError:
+        return None
+
+    key = (key, *values)
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def unique(values: list[Any]) -> tuple[Any, ...]:
+    """Returns the values without duplicates, keeping their order."""
+
+    try:
+        return tuple(dict.fromkeys(values))
+    except TypeError:
+        return tuple(values)
+
+
+def is_constant(value: Any) -> bool:
+    """Checks whether the value is rendered as a parameter."""
+
+    return (
+        value is not None
+        and not isinstance(value, CONTAINERS)
+        and compiler(type(value)) is None
+    )
@@ -0,0 +1,58 @@
+"""SQLite reference backend."""
+
+import sqlite3
+from typing import Any
+
+from dcorm.aio import AsyncDatabase
+from dcorm.database import Database
+from dcorm.engine import Engine
+from dcorm.paramstyle import ParamStyle
+
+
+__all__ = ['SQLITE', 'AsyncSQLiteDatabase', 'SQLiteDatabase']
+
+
+SQLITE = Engine(
+    param=ParamStyle.QMARK,
+    explain='EXPLAIN QUERY PLAN',
+    index_schema_prefix=True,
+    references_schema=False,
+    limit_max=-1,
+    nulls_ordering=sqlite3.sqlite_version_info >= (3, 30),
+    max_params=32766 if sqlite3.sqlite_version_info >= (3, 32) else 999
+)
+
+
+class SQLiteDatabase(Database, engine=SQLITE, driver=sqlite3):
+    """An SQLite database.
+
+    Connections do not begin transactions implicitly. Since every
+    connection to ':memory:' opens a separate database, in-memory
+    databases use a single connection.
+    """
+
+    def __init__(self, database: str, **kwargs: Any):
+        kwargs.setdefault('check_same_thread', False)
+        kwargs['isolation_level'] = None
+
+        if database == ':memory:':
+            kwargs['max_connections'] = 1
+
+        super().__init__(database, **kwargs)
+
+
+class AsyncSQLiteDatabase(AsyncDatabase, engine=SQLITE, driver=sqlite3):
+    """An asynchronous SQLite database.
+
+    Each connection runs on its own thread and does
+    not begin transactions implicitly.
+    """
+
+    def __init__(self, database: str, **kwargs: Any):
+        kwargs.setdefault('check_same_thread', False)
+        kwargs['isolation_level'] = None
+
+        if database == ':memory:':
+            kwargs['max_connections'] = 1
+
+        super().__init__(database, **kwargs)
@@ -0,0 +1,50 @@
+"""Cache of compiled SQL statements."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Optional
+
+
+__all__ = ['StatementCache']
+
+
+class StatementCache:
+    """LRU cache of rendered SQL templates keyed on query shape."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Returns the template for the given key if cached."""
+        with self._lock:
+            try:
+                template = self._templates[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def set(self, key: Hashable, template: str) -> None:
+        """Stores a template, evicting the least recently used one."""
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clears the cache."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = self.misses = 0
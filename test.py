@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from dcorm import field, select, Model
+from dcorm.context import Context
 from dcorm.engine import Engine
 
 
@@ -16,7 +17,7 @@ class MyModel(Model):
 def main():
 
     engine = Engine()
-    print('Engine:', engine, engine._sql)
+    print('Engine:', engine)
     record = MyModel(3, 'Pee-Wee Herman')
     print('Record:', record)
     record.no_such_attr = 'foo'
@@ -24,8 +25,8 @@ def main():
     condition = (~(MyModel.id == 1)) & (MyModel.name == 'Monty')
     print('Condition:', condition)
     query = select(MyModel).where(condition)
-    print('Engine:', engine := query.__sql__(engine))
-    print('Query:', engine.query_string())
+    print('Context:', context := query.__sql__(Context(engine)))
+    print('Query:', context.query_string())
 
 
 if __name__ == '__main__':
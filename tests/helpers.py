@@ -0,0 +1,54 @@
+"""Test helpers."""
+
+from os import close, unlink
+from tempfile import mkstemp
+from typing import Any
+from unittest import TestCase
+
+from dcorm.sqlite import AsyncSQLiteDatabase, SQLiteDatabase
+
+
+__all__ = ['DatabaseTestCase', 'temporary_file']
+
+
+def temporary_file() -> str:
+    """Creates an empty temporary file and returns its path."""
+
+    descriptor, path = mkstemp(suffix='.sqlite3')
+    close(descriptor)
+    return path
+
+
+class DatabaseTestCase(TestCase):
+    """Tests against a temporary SQLite database file.
+
+    The schema is created by executing the statements of SCHEMA.
+    """
+
+    SCHEMA: tuple[str, ...] = ()
+
+    def setUp(self):
+        self.path = temporary_file()
+        self.addCleanup(unlink, self.path)
+        self.database = self.open_database()
+        self.addCleanup(self.database.close)
+
+        for statement in self.SCHEMA:
+            self.database.execute(statement)
+
+    def open_database(self, **kwargs: Any) -> SQLiteDatabase:
+        """Opens the temporary database."""
+        return SQLiteDatabase(self.path, **kwargs)
+
+    def open_async_database(self, **kwargs: Any) -> AsyncSQLiteDatabase:
+        """Opens the temporary database asynchronously."""
+        return AsyncSQLiteDatabase(self.path, **kwargs)
+
+    def rows(self, sql: str) -> list[tuple[Any, ...]]:
+        """Returns the rows of a query on a separate connection."""
+        database = self.open_database()
+
+        try:
+            return database.fetchall(sql)
+        finally:
+            database.close()
@@ -0,0 +1,203 @@
+"""Tests of asynchronous execution."""
+
+from asyncio import gather, run, sleep
+from unittest import TestCase
+
+from dcorm import AsyncConnectionPool, Model, field, insert_many, related
+from dcorm import select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Owner(Model, table_name='owner'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class Pet(Model, table_name='pet'):
+    """A test model referencing owners."""
+
+    id: int = field(primary=True)
+    owner: int = field(references=Owner)
+    name: str
+
+
+class Connection:
+    """A fake asynchronous connection."""
+
+    def __init__(self, pool: AsyncConnectionPool):
+        self.pool = pool
+        self.closed = False
+        self.closed_while_locked = None
+
+    async def close(self):
+        """Closes the connection."""
+        self.closed = True
+        # pylint: disable-next=W0212
+        self.closed_while_locked = self.pool._condition.locked()
+
+
+class AsyncConnectionPoolTest(TestCase):
+    """Tests of the asynchronous connection pool."""
+
+    @staticmethod
+    def pool(**kwargs) -> AsyncConnectionPool:
+        """Returns a pool of fake connections."""
+        async def connect():
+            return Connection(pool)
+
+        pool = AsyncConnectionPool(connect, **kwargs)
+        return pool
+
+    def test_reuse(self):
+        async def main():
+            pool = self.pool(max_size=2)
+            connection = await pool.acquire()
+            await pool.release(connection)
+            self.assertIs(await pool.acquire(), connection)
+            self.assertEqual(len(pool), 1)
+
+        run(main())
+
+    def test_timeout(self):
+        async def main():
+            pool = self.pool(max_size=1, timeout=0.01)
+            await pool.acquire()
+
+            with self.assertRaises(TimeoutError):
+                await pool.acquire()
+
+        run(main())
+
+    def test_timeout_during_check(self):
+        async def main():
+            async def check(_):
+                await sleep(delay)
+                return True
+
+            delay = 1
+            pool = self.pool(max_size=1, timeout=0.1, check=check)
+            await pool.release(connection := await pool.acquire())
+
+            with self.assertRaises(TimeoutError):
+                await pool.acquire()
+
+            delay = 0
+            self.assertTrue(connection.closed)
+            self.assertIsNot(await pool.acquire(), connection)
+
+        run(main())
+
+    def test_waiting(self):
+        async def main():
+            pool = self.pool(max_size=1)
+            connection = await pool.acquire()
+
+            async def release():
+                await sleep(0.01)
+                await pool.release(connection)
+
+            acquired, _ = await gather(pool.acquire(), release())
+            self.assertIs(acquired, connection)
+
+        run(main())
+
+    def test_expired_closed_outside_lock(self):
+        async def main():
+            pool = self.pool(idle_timeout=0)
+            await pool.release(connection := await pool.acquire())
+            await sleep(0.001)
+            self.assertIsNot(await pool.acquire(), connection)
+            self.assertTrue(connection.closed)
+            self.assertFalse(connection.closed_while_locked)
+
+        run(main())
+
+    def test_close(self):
+        async def main():
+            pool = self.pool()
+            await pool.release(connection := await pool.acquire())
+            await pool.close()
+            self.assertTrue(connection.closed)
+            self.assertEqual(len(pool), 0)
+
+        run(main())
+
+
+class AsyncDatabaseTest(DatabaseTestCase):
+    """Tests of asynchronous databases."""
+
+    SCHEMA = (
+        'CREATE TABLE owner (id INTEGER PRIMARY KEY, name TEXT NOT NULL)',
+        'CREATE TABLE pet (id INTEGER PRIMARY KEY, owner INTEGER NOT NULL, '
+        'name TEXT NOT NULL)'
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Owner, [Owner(1, 'Ann'), Owner(2, 'Bob')]).execute(
+            self.database)
+        insert_many(Pet, [Pet(1, 1, 'Rex'), Pet(2, 1, 'Tom'), Pet(3, 2, 'Kit')
+                          ]).execute(self.database)
+
+    def run_async(self, function):
+        """Runs a coroutine function with an asynchronous database."""
+        database = self.open_async_database(max_connections=2)
+
+        async def main():
+            try:
+                return await function(database)
+            finally:
+                await database.close()
+
+        return run(main())
+
+    def test_select(self):
+        async def main(database):
+            async with await select(Owner).order_by(Owner.id).aexecute(
+                    database, batch_size=1) as owners:
+                return [owner async for owner in owners]
+
+        self.assertEqual(self.run_async(main), list(
+            select(Owner).order_by(Owner.id).execute(self.database)))
+
+    def test_prefetch(self):
+        async def main(database):
+            async with await select(Owner).order_by(Owner.id).prefetch(
+                    Pet).aexecute(database) as owners:
+                return [
+                    (owner.name, [pet.name for pet in related(owner, Pet)])
+                    async for owner in owners
+                ]
+
+        self.assertEqual(
+            self.run_async(main), [('Ann', ['Rex', 'Tom']), ('Bob', ['Kit'])])
+
+    def test_to_columns(self):
+        async def main(database):
+            return await select(Pet.id, Pet.name).order_by(
+                Pet.id).ato_columns(database, use_numpy=False)
+
+        columns = self.run_async(main)
+        self.assertEqual(list(columns['id']), [1, 2, 3])
+        self.assertEqual(columns['name'], ['Rex', 'Tom', 'Kit'])
+
+    def test_concurrent_tasks(self):
+        async def count(database):
+            return (await database.fetchall('SELECT COUNT(*) FROM pet'))[0][0]
+
+        async def main(database):
+            return await gather(*(count(database) for _ in range(5)))
+
+        self.assertEqual(self.run_async(main), [3] * 5)
+
+    def test_executemany(self):
+        async def main(database):
+            return await insert_many(
+                Owner, [Owner(3, 'Cid'), Owner(4, 'Dan')], executemany=True
+            ).aexecute(database)
+
+        self.run_async(main)
+        self.assertEqual(self.rows('SELECT COUNT(*) FROM owner'), [(4,)])
@@ -0,0 +1,55 @@
+"""Tests of the benchmark suite."""
+
+from json import dump, load
+from os import unlink
+from pathlib import Path
+from subprocess import run
+from sys import executable, modules
+from unittest import TestCase
+
+from dcorm.relations import GRAPH
+
+from tests.helpers import temporary_file
+
+
+ROOT = Path(__file__).parent.parent
+
+
+def suite(*args: str) -> int:
+    """Runs the benchmark suite in a separate process
+    and returns its exit code.
+    """
+
+    return run(
+        [executable, '-m', 'benchmarks.suite', '-k', 'compile.small',
+         '-r', '1', '-d', '0.01', *args],
+        cwd=ROOT, capture_output=True, check=False
+    ).returncode
+
+
+class BenchmarkTest(TestCase):
+    """Tests of running benchmarks and comparing them to a baseline."""
+
+    def setUp(self):
+        self.path = temporary_file()
+        self.addCleanup(unlink, self.path)
+
+    def test_not_part_of_the_package(self):
+        self.assertNotIn('benchmarks.suite', modules)
+        self.assertNotIn('Author', GRAPH.models)
+
+    def test_results(self):
+        self.assertEqual(suite('-o', self.path), 0)
+
+        with open(self.path, encoding='utf-8') as file:
+            results = load(file)['results']
+
+        self.assertEqual(list(results), ['compile.small'])
+        self.assertGreater(results['compile.small']['median'], 0)
+
+    def test_regression(self):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            dump({'results': {'compile.small': {'median': 1e-9}}}, file)
+
+        self.assertEqual(suite('-b', self.path), 1)
+        self.assertEqual(suite('-b', self.path, '-t', '1e9'), 0)
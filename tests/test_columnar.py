@@ -0,0 +1,92 @@
+"""Tests of columnar results."""
+
+from array import array
+from asyncio import run
+from datetime import date
+from math import isnan
+from typing import Optional
+from unittest import skipIf, skipUnless
+
+from dcorm import Model, field, select
+from dcorm.columnar import numpy
+
+from tests.helpers import DatabaseTestCase
+
+
+class Sensor(Model, table_name='sensor'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    day: date
+    value: Optional[float]
+    count: Optional[int]
+    ok: bool
+
+
+class ColumnarTest(DatabaseTestCase):
+    """Tests of fetching the values of columns into arrays."""
+
+    SCHEMA = (
+        'CREATE TABLE sensor (id INTEGER PRIMARY KEY, day TEXT, value REAL, '
+        'count INT, ok INT)',
+        "INSERT INTO sensor VALUES (1, '2024-01-01', 1.5, 1, 1), "
+        "(2, '2024-01-02', NULL, NULL, 0), (3, '2024-01-03', 2.5, 3, 1)",
+    )
+
+    def columns(self, **kwargs):
+        """Returns the columns of all sensor values."""
+        return select(Sensor).order_by(Sensor.id).to_columns(
+            self.database, use_numpy=False, **kwargs)
+
+    def test_arrays(self):
+        columns = self.columns(batch_size=2)
+        self.assertEqual(list(columns), ['id', 'day', 'value', 'count', 'ok'])
+        self.assertEqual(columns['id'], array('q', [1, 2, 3]))
+        self.assertEqual(columns['ok'], array('b', [1, 0, 1]))
+        self.assertEqual(columns['day'], [
+            date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)])
+
+    def test_nulls(self):
+        columns = self.columns()
+        self.assertIsInstance(columns['value'], array)
+        self.assertTrue(isnan(columns['value'][1]))
+        self.assertEqual(columns['count'], [1, None, 3])
+
+    def test_selected_columns(self):
+        columns = select(Sensor.id, Sensor.value).where(
+            Sensor.ok == 1).to_columns(self.database, use_numpy=False)
+        self.assertEqual(columns, {
+            'id': array('q', [1, 3]), 'value': array('d', [1.5, 2.5])})
+
+    def test_duplicate_names(self):
+        alias = Sensor.alias('other')
+
+        with self.assertRaisesRegex(ValueError, 'Duplicate'):
+            select(Sensor.id, alias.id).join(
+                alias, on=alias.id == Sensor.id).to_columns(self.database)
+
+    @skipIf(numpy is not None, 'NumPy is installed.')
+    def test_numpy_missing(self):
+        with self.assertRaises(ImportError):
+            select(Sensor).to_columns(self.database, use_numpy=True)
+
+    @skipUnless(numpy is not None, 'NumPy is not installed.')
+    def test_numpy(self):
+        columns = select(Sensor).order_by(Sensor.id).to_columns(
+            self.database, batch_size=2, use_numpy=True)
+        self.assertEqual(columns['id'].dtype, numpy.int64)
+        self.assertEqual(columns['id'].tolist(), [1, 2, 3])
+        self.assertTrue(numpy.isnan(columns['value'][1]))
+        self.assertEqual(columns['count'].tolist(), [1, None, 3])
+
+    def test_async(self):
+        async def columns():
+            database = self.open_async_database()
+
+            try:
+                return await select(Sensor.id).order_by(
+                    Sensor.id).ato_columns(database, use_numpy=False)
+            finally:
+                await database.close()
+
+        self.assertEqual(run(columns()), {'id': array('q', [1, 2, 3])})
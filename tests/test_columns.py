@@ -0,0 +1,71 @@
+"""Tests of per-model column metadata."""
+
+from dcorm import Engine, Model, columns, field, insert_many, primary_key
+from dcorm import select
+
+from dcorm.column import MAX_IDENTIFIERS
+
+from tests.helpers import DatabaseTestCase
+
+
+class Employee(Model, table_name='employee'):
+    """A test model with a renamed column."""
+
+    id: int = field(primary=True)
+    title: str = field(column_name='full name')
+    manager: int = 0
+
+
+class ColumnsTest(DatabaseTestCase):
+    """Tests of column tables and quoted identifiers."""
+
+    SCHEMA = (
+        'CREATE TABLE employee (id INTEGER PRIMARY KEY, "full name" TEXT, '
+        'manager INT)',
+    )
+
+    def test_column_table(self):
+        table = Employee.__column_table__
+        self.assertEqual(table.names, ('id', 'title', 'manager'))
+        self.assertIs(table.by_name['title'], Employee.title)
+        self.assertIs(primary_key(Employee), Employee.id)
+        self.assertEqual([column.name for column in columns(Employee)],
+                         ['id', 'full name', 'manager'])
+
+    def test_identifiers_are_cached(self):
+        engine = Engine(quotes='`{}`')
+        identifiers = Employee.__identifiers__(engine)
+        self.assertIs(Employee.__identifiers__(engine), identifiers)
+        self.assertEqual(identifiers.table, '`employee`')
+        self.assertEqual(identifiers.columns['full name'],
+                         '`employee`.`full name`')
+
+    def test_identifiers_are_bounded(self):
+        for _ in range(MAX_IDENTIFIERS + 1):
+            Employee.__identifiers__(Engine())
+
+        # pylint: disable-next=W0212
+        self.assertEqual(len(Employee.__column_table__._identifiers),
+                         MAX_IDENTIFIERS)
+
+    def test_renamed_column(self):
+        insert_many(Employee, [Employee(1, 'Ada')]).execute(self.database)
+        self.assertEqual(self.rows('SELECT "full name" FROM employee'),
+                         [('Ada',)])
+        self.assertEqual([employee.title for employee in select(
+            Employee).where(Employee.title == 'Ada').execute(self.database)],
+            ['Ada'])
+
+    def test_alias(self):
+        insert_many(Employee, [
+            Employee(1, 'Ada'), Employee(2, 'Bob', 1), Employee(3, 'Cy', 1)
+        ]).execute(self.database)
+        boss = Employee.alias('boss')
+        sql, _ = self.database.compile(select(boss.title).where(boss.id == 1))
+        self.assertEqual(
+            sql, 'SELECT "boss"."full name" FROM "employee" AS "boss" '
+            'WHERE "boss"."id" = ?')
+        query = select(Employee.title, boss.title).join(
+            boss, on=Employee.manager == boss.id).order_by(Employee.id)
+        self.assertEqual(list(query.execute(self.database)),
+                         [('Bob', 'Ada'), ('Cy', 'Ada')])
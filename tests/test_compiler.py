@@ -0,0 +1,113 @@
+"""Tests of type-dispatched compilation."""
+
+from dcorm import Context, Engine, Model, ShapeError, StatementCache, field
+from dcorm import ParamStyle, fingerprint, insert_many, register, select
+from dcorm.compiler import unregister
+from dcorm.paramstyle import PARAM
+
+from tests.helpers import DatabaseTestCase
+
+
+class Cents:
+    """An amount of money stored in cents."""
+
+    def __init__(self, amount: float):
+        self.amount = amount
+
+
+class Euros(Cents):
+    """An amount of Euros."""
+
+
+class Point:
+    """A point in a plane."""
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+
+class Broken:
+    """A node whose rendering fails."""
+
+    def __sql__(self, context: Context) -> Context:
+        return context.raw_value(self.missing, ())  # pylint: disable=E1101
+
+
+def compile_cents(cents: Cents, context: Context) -> Context:
+    """Renders an amount of money as cents."""
+
+    return context.value(round(cents.amount * 100))
+
+
+def compile_point(point: Point, context: Context) -> Context:
+    """Renders a point as in the compiler module's example."""
+
+    return context.raw_value(f'POINT({PARAM}, {PARAM})', (point.x, point.y))
+
+
+class Price(Model, table_name='price'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    cents: int
+
+
+class CompilerTest(DatabaseTestCase):
+    """Tests of compilers registered for types."""
+
+    SCHEMA = ('CREATE TABLE price (id INTEGER PRIMARY KEY, cents INT)',)
+
+    def setUp(self):
+        super().setUp()
+        register(Cents)(compile_cents)
+        self.addCleanup(unregister, Cents)
+
+    def test_registered_compiler(self):
+        insert_many(Price, [
+            Price(1, 150), Price(2, 250)
+        ]).execute(self.database)
+        self.assertEqual([price.id for price in select(Price).where(
+            Price.cents > Euros(2)).execute(self.database)], [2])
+
+    def test_subclasses_inherit(self):
+        self.assertEqual(
+            Context(Engine()).sql(Price.cents == Euros(1.5)).query(),
+            ('"price"."cents" = ?', [150])
+        )
+
+    def test_unregister(self):
+        unregister(Cents)
+        value = Cents(1)
+        self.assertEqual(Context(Engine()).sql(value).values, [value])
+        register(Cents)(compile_cents)
+        self.assertEqual(Context(Engine()).sql(value).values, [100])
+
+    def test_errors_propagate(self):
+        with self.assertRaises(AttributeError):
+            Context(Engine()).sql(Price.cents == Broken())
+
+    def test_statement_cache(self):
+        engine = Engine(statement_cache=(cache := StatementCache()))
+
+        for amount in (1, 2):
+            self.assertEqual(Context(engine).sql(select(Price.id).where(
+                Price.cents > Euros(amount))).query(), (
+                    'SELECT "price"."id" FROM "price" '
+                    'WHERE "price"."cents" > ?', [amount * 100]
+                ))
+
+        self.assertEqual(len(cache), 0)
+
+        with self.assertRaises(ShapeError):
+            fingerprint(Price.cents > Euros(1))
+
+    def test_parameter_styles(self):
+        register(Point)(compile_point)
+        self.addCleanup(unregister, Point)
+        context = Context(Engine(param=ParamStyle.NAMED)).sql(
+            Price.cents == Point(1, 2))
+        self.assertEqual(context.query(), (
+            '"price"."cents" = POINT(:p1, :p2)', {'p1': 1, 'p2': 2}))
+        self.assertEqual(
+            context.query_string(), '"price"."cents" = POINT(1, 2)')
@@ -0,0 +1,74 @@
+"""Tests of compilation contexts."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+
+from dcorm import Context, Engine, Model, field, insert_many, select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Planet(Model, table_name='planet'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+    moons: int
+
+
+def compiled(engine: Engine, moons: int) -> tuple[str, list]:
+    """Compiles a query on planets with the given amount of moons."""
+
+    query = select(Planet).where(
+        (Planet.moons >= moons) & (Planet.name != 'Pluto'))
+    return Context(engine).sql(query).query()
+
+
+class ContextTest(DatabaseTestCase):
+    """Tests of compilation state kept apart from the engine."""
+
+    SCHEMA = (
+        'CREATE TABLE planet (id INTEGER PRIMARY KEY, name TEXT, moons INT)',
+    )
+
+    def test_engine_is_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            self.database.engine.quotes = '`{}`'
+
+    def test_contexts_are_independent(self):
+        engine = Engine()
+        first = Context(engine).sql(Planet.moons == 1)
+        second = Context(engine).sql(Planet.moons == 2)
+        self.assertEqual(first.template, second.template)
+        self.assertEqual((first.values, second.values), ([1], [2]))
+
+    def test_concurrent_compilation(self):
+        engine = Engine()
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(
+                lambda moons: compiled(engine, moons), range(200)))
+
+        for moons, (sql, parameters) in enumerate(results):
+            self.assertEqual(sql, results[0][0])
+            self.assertEqual(parameters, [moons, 'Pluto'])
+
+    def test_concurrent_queries(self):
+        insert_many(Planet, [
+            Planet(1, 'Earth', 1), Planet(2, 'Mars', 2),
+            Planet(3, 'Jupiter', 95), Planet(4, 'Pluto', 5)
+        ]).execute(self.database)
+
+        def names(moons: int) -> list[str]:
+            return [planet.name for planet in select(Planet).where(
+                Planet.moons >= moons).order_by(Planet.id).execute(
+                self.database)]
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(names, [1, 2, 5, 96] * 10))
+
+        self.assertEqual(results[:4], [
+            ['Earth', 'Mars', 'Jupiter', 'Pluto'],
+            ['Mars', 'Jupiter', 'Pluto'], ['Jupiter', 'Pluto'], []
+        ])
+        self.assertEqual(results[4:], results[:4] * 9)
@@ -0,0 +1,164 @@
+"""Tests of data definition queries."""
+
+from dcorm import Context, Engine, FieldType, Index, Model, create_indexes
+from dcorm import create_table, field
+from dcorm.sqlite import SQLITE, SQLiteDatabase
+
+from tests.helpers import DatabaseTestCase
+
+
+class Measurement(Model, table_name='measurement'):
+    """A test model."""
+
+    id: int = field(primary=True, field_type=FieldType.AUTO)
+    count: int
+    total: int = field(field_type=FieldType.BIGINT)
+    ratio: float = field(field_type=FieldType.FLOAT)
+    label: str = field(field_type=FieldType.UUID)
+
+
+class Ticket(Model, table_name='ticket', indexes=[
+        Index('code', unique=True),
+        Index('code', where=lambda model: model.open == 1),
+        Index('code', include=['open'])
+]):
+    """A test model with indexes on the same column."""
+
+    id: int = field(primary=True)
+    code: str = field(index=True)
+    open: int
+
+
+class Duplicate(Model, table_name='duplicate', indexes=[Index('code')]):
+    """A test model with duplicate indexes."""
+
+    id: int = field(primary=True)
+    code: str = field(index=True)
+
+
+MAIN = SQLiteDatabase(':memory:', schema='main')
+
+
+class Shelf(Model, table_name='shelf', database=MAIN):
+    """A test model in a schema."""
+
+    id: int = field(primary=True)
+
+
+class Folder(Model, table_name='folder', database=MAIN):
+    """A test model in a schema referencing another model."""
+
+    id: int = field(primary=True)
+    shelf: int = field(references=Shelf)
+
+
+def definition(engine: Engine) -> str:
+    """Returns the CREATE TABLE statement of measurements."""
+
+    return Context(engine).sql(create_table(Measurement)).template
+
+
+def names(model: type) -> list[str]:
+    """Returns the names of the model's indexes."""
+
+    return [query._index.index_name(model)    # pylint: disable=W0212
+            for query in create_indexes(model)]
+
+
+class FieldTypeTest(DatabaseTestCase):
+    """Tests of the SQL types of field types."""
+
+    def test_distinct_members(self):
+        self.assertIsNot(FieldType.INT, FieldType.AUTO)
+        self.assertIsNot(FieldType.FLOAT, FieldType.DOUBLE)
+        self.assertIsNot(FieldType.UUID, FieldType.TEXT)
+        self.assertEqual(len(FieldType.__members__), len(FieldType))
+
+    def test_default_types(self):
+        self.assertEqual(definition(self.database.engine), (
+            'CREATE TABLE IF NOT EXISTS "measurement" ('
+            '"id" INTEGER NOT NULL PRIMARY KEY, "count" INTEGER NOT NULL, '
+            '"total" BIGINT NOT NULL, "ratio" REAL NOT NULL, '
+            '"label" TEXT NOT NULL)'
+        ))
+
+    def test_overrides_do_not_affect_aliases(self):
+        engine = Engine(field_types={
+            'AUTO': 'SERIAL', 'FLOAT': 'FLOAT4', 'UUID': 'UUID'})
+        sql = definition(engine)
+        self.assertIn('"id" SERIAL', sql)
+        self.assertIn('"count" INTEGER', sql)
+        self.assertIn('"ratio" FLOAT4', sql)
+        self.assertIn('"label" UUID', sql)
+
+    def test_field_type_overrides(self):
+        engine = Engine(field_types={'INT': FieldType.BIGINT})
+        sql = definition(engine)
+        self.assertIn('"id" INTEGER', sql)
+        self.assertIn('"count" BIGINT', sql)
+
+    def test_sql(self):
+        self.assertEqual(FieldType.AUTO.sql, 'INTEGER')
+        self.assertEqual(FieldType.UUIDB.sql, 'BLOB')
+
+    def test_create(self):
+        create_table(Measurement).execute(self.database)
+        self.assertEqual(
+            [row[1:3] for row in self.rows('PRAGMA table_info(measurement)')],
+            [('id', 'INTEGER'), ('count', 'INTEGER'), ('total', 'BIGINT'),
+             ('ratio', 'REAL'), ('label', 'TEXT')]
+        )
+
+
+class ReferencesTest(DatabaseTestCase):
+    """Tests of foreign key constraints."""
+
+    def test_schema_qualified_references(self):
+        self.assertIn(
+            'REFERENCES "main"."shelf" ("id")',
+            Context(Engine()).sql(create_table(Folder)).template
+        )
+        self.assertIn(
+            'REFERENCES "shelf" ("id")',
+            Context(SQLITE).sql(create_table(Folder)).template
+        )
+
+        for model in (Shelf, Folder):
+            create_table(model).execute(self.database)
+
+        self.assertEqual(
+            self.rows('PRAGMA foreign_key_list(folder)')[0][2:5],
+            ('shelf', 'shelf', 'id')
+        )
+
+
+class IndexTest(DatabaseTestCase):
+    """Tests of index names."""
+
+    SCHEMA = (
+        'CREATE TABLE ticket (id INTEGER PRIMARY KEY, code TEXT, open INT)',
+    )
+
+    def test_distinct_names(self):
+        index_names = names(Ticket)
+        self.assertEqual(index_names[:2],
+                         ['ticket_code', 'ticket_code_unique'])
+        self.assertEqual(len(set(index_names)), 4)
+
+    def test_names_do_not_grow_identifiers(self):
+        # pylint: disable-next=W0212
+        identifiers = Ticket.__column_table__._identifiers
+        names(Ticket)
+        size = len(identifiers)
+        self.assertEqual(names(Ticket), names(Ticket))
+        self.assertEqual(len(identifiers), size)
+
+    def test_create(self):
+        self.assertEqual(create_indexes(Ticket).execute(self.database), 4)
+        self.assertEqual(len(self.rows(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = 'ticket'")), 4)
+
+    def test_duplicate_names(self):
+        with self.assertRaisesRegex(ValueError, 'duplicate_code'):
+            list(create_indexes(Duplicate))
@@ -0,0 +1,179 @@
+"""Tests of databases and connection pools."""
+
+from asyncio import run
+from unittest import TestCase
+
+from dcorm import Model, field, insert_many
+from dcorm.pool import ConnectionPool
+
+from tests.helpers import DatabaseTestCase
+
+
+class Entry(Model, table_name='entry'):
+    """A test model."""
+
+    id: int = field(primary=True)
+
+
+class Rollback(Exception):
+    """Raised to roll back a transaction."""
+
+
+class TransactionTest(DatabaseTestCase):
+    """Tests of transactions."""
+
+    SCHEMA = ('CREATE TABLE entry (id INTEGER PRIMARY KEY)',)
+
+    def insert(self, key: int) -> None:
+        """Inserts an entry."""
+        self.database.execute('INSERT INTO entry (id) VALUES (?)', [key])
+
+    def entries(self) -> list[int]:
+        """Returns the committed entries."""
+        return [key for key, in self.rows('SELECT id FROM entry ORDER BY id')]
+
+    def test_commit(self):
+        with self.database.atomic():
+            self.insert(1)
+            self.assertEqual(self.entries(), [])
+
+        self.assertEqual(self.entries(), [1])
+
+    def test_rollback(self):
+        with self.assertRaises(Rollback), self.database.atomic():
+            self.insert(1)
+            raise Rollback()
+
+        self.assertEqual(self.entries(), [])
+
+    def test_nested_rollback(self):
+        with self.assertRaises(Rollback), self.database.atomic():
+            with self.database.atomic():
+                self.insert(1)
+
+            raise Rollback()
+
+        self.assertEqual(self.entries(), [])
+
+    def test_nested_rollback_in_nested_block(self):
+        with self.assertRaises(Rollback), self.database.atomic():
+            with self.database.atomic():
+                self.insert(1)
+                raise Rollback()
+
+        self.assertEqual(self.entries(), [])
+
+    def test_savepoint_rollback(self):
+        with self.database.atomic():
+            self.insert(1)
+
+            with self.assertRaises(Rollback), self.database.atomic():
+                self.insert(2)
+                raise Rollback()
+
+            self.insert(3)
+
+        self.assertEqual(self.entries(), [1, 3])
+
+    def test_rollback_around_insert_many(self):
+        with self.assertRaises(Rollback), self.database.atomic():
+            insert_many(Entry, [Entry(1), Entry(2)]).execute(self.database)
+            raise Rollback()
+
+        self.assertEqual(self.entries(), [])
+
+    def test_autocommit(self):
+        self.insert(1)
+        self.assertEqual(self.entries(), [1])
+        self.assertFalse(self.database.in_transaction)
+
+    def test_async_nested_rollback(self):
+        database = self.open_async_database()
+
+        async def transaction():
+            async with database.atomic():
+                async with database.atomic():
+                    await database.execute(
+                        'INSERT INTO entry (id) VALUES (1)')
+
+                raise Rollback()
+
+        async def main():
+            try:
+                await transaction()
+            finally:
+                await database.close()
+
+        with self.assertRaises(Rollback):
+            run(main())
+
+        self.assertEqual(self.entries(), [])
+
+    def test_async_rollback_around_insert_many(self):
+        database = self.open_async_database()
+
+        async def main():
+            try:
+                async with database.atomic():
+                    await insert_many(Entry, [Entry(1)]).aexecute(database)
+                    raise Rollback()
+            finally:
+                await database.close()
+
+        with self.assertRaises(Rollback):
+            run(main())
+
+        self.assertEqual(self.entries(), [])
+
+
+class Connection:
+    """A fake connection."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        """Closes the connection."""
+        self.closed = True
+
+
+class ConnectionPoolTest(TestCase):
+    """Tests of the connection pool."""
+
+    def test_reuse(self):
+        pool = ConnectionPool(Connection, max_size=2)
+        connection = pool.acquire()
+        pool.release(connection)
+        self.assertIs(pool.acquire(), connection)
+        self.assertEqual(len(pool), 1)
+
+    def test_timeout(self):
+        pool = ConnectionPool(Connection, max_size=1, timeout=0.01)
+        pool.acquire()
+
+        with self.assertRaises(TimeoutError):
+            pool.acquire()
+
+    def test_discard(self):
+        pool = ConnectionPool(Connection, max_size=1)
+        pool.release(connection := pool.acquire(), discard=True)
+        self.assertTrue(connection.closed)
+        self.assertEqual(len(pool), 0)
+        self.assertIsNot(pool.acquire(), connection)
+
+    def test_idle_timeout(self):
+        pool = ConnectionPool(Connection, idle_timeout=0)
+        pool.release(connection := pool.acquire())
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(len(pool), 1)
+
+    def test_unhealthy(self):
+        pool = ConnectionPool(Connection, check=lambda _: False)
+        pool.release(connection := pool.acquire())
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertTrue(connection.closed)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(Connection, min_size=2, max_size=1)
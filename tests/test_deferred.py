@@ -0,0 +1,114 @@
+"""Tests of deferred columns."""
+
+from asyncio import run
+from gc import collect
+from weakref import ref
+
+from dcorm import Model, field, insert_many, select
+from dcorm.deferred import aload
+
+from tests.helpers import DatabaseTestCase
+
+
+class Document(Model, table_name='document'):
+    """A test model with a deferred column."""
+
+    id: int = field(primary=True)
+    title: str
+    body: bytes = field(lazy=True)
+
+
+class SlottedDocument(Model, table_name='document', slots=True):
+    """A slotted test model with a deferred column."""
+
+    id: int = field(primary=True)
+    title: str
+    body: bytes = field(lazy=True)
+
+
+class DeferredTest(DatabaseTestCase):
+    """Tests of loading deferred columns by batch."""
+
+    SCHEMA = (
+        'CREATE TABLE document (id INTEGER PRIMARY KEY, title TEXT, '
+        'body BLOB)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Document, [
+            Document(id, f't{id}', bytes([id])) for id in range(1, 4)
+        ]).execute(self.database)
+        self.statements = []
+        connection = self.database.pool.acquire()
+        connection.set_trace_callback(self.statements.append)
+        self.database.pool.release(connection)
+
+    def selects(self) -> int:
+        """Returns the amount of executed select statements."""
+        return sum(sql.startswith('SELECT "') for sql in self.statements)
+
+    def test_not_selected(self):
+        sql, _ = self.database.compile(select(Document))
+        self.assertNotIn('body', sql)
+
+    def test_batch_load(self):
+        for model in (Document, SlottedDocument):
+            with self.subTest(model=model):
+                self.statements.clear()
+                records = list(select(model).execute(self.database))
+                self.assertEqual(records[1].body, b'\x02')
+                self.assertEqual(
+                    [record.body for record in records],
+                    [b'\x01', b'\x02', b'\x03']
+                )
+                self.assertEqual(self.selects(), 2)
+
+    def test_loaded_records_are_detached(self):
+        for model in (Document, SlottedDocument):
+            with self.subTest(model=model):
+                records = list(select(model).execute(self.database))
+                loader = records[0].__deferred__
+                self.assertEqual(records[0].body, b'\x01')
+                self.assertEqual(loader.records, [])
+
+                for record in records:
+                    self.assertFalse(hasattr(record, '__deferred__'))
+
+    def test_loader_does_not_keep_batch_alive(self):
+        records = list(select(Document).execute(self.database))
+        self.assertEqual(records[0].body, b'\x01')
+        other = ref(records[2])
+        del records[1:]
+        collect()
+        self.assertIsNone(other())
+
+    def test_deleted_record(self):
+        records = list(select(Document).execute(self.database))
+        self.database.execute('DELETE FROM document WHERE id = 2')
+        self.assertEqual(records[0].body, b'\x01')
+        self.assertTrue(hasattr(records[1], '__deferred__'))
+
+        with self.assertRaises(LookupError):
+            records[1].body     # pylint: disable=W0104
+
+    def test_async(self):
+        async def bodies():
+            database = self.open_async_database()
+
+            try:
+                records = [
+                    record async for record in
+                    await select(Document).aexecute(database)
+                ]
+
+                with self.assertRaises(RuntimeError):
+                    records[0].body     # pylint: disable=W0104
+
+                await aload(records, Document.body)
+                self.assertFalse(hasattr(records[0], '__deferred__'))
+                return [record.body for record in records]
+            finally:
+                await database.close()
+
+        self.assertEqual(run(bodies()), [b'\x01', b'\x02', b'\x03'])
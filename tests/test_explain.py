@@ -0,0 +1,96 @@
+"""Tests of query plans and plan checks."""
+
+from warnings import catch_warnings
+
+from dcorm import LRUResultCache, Model, PlanCheck, field, insert_many, select
+from dcorm.explain import parse_plan
+
+from tests.helpers import DatabaseTestCase
+
+
+class Shelf(Model, table_name='shelf'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class Volume(Model, table_name='volume'):
+    """A test model referencing shelves."""
+
+    id: int = field(primary=True)
+    shelf: int = field(references=Shelf.id)
+    title: str
+
+
+class CountingCheck(PlanCheck):
+    """A plan check counting the checked statements."""
+
+    __slots__ = ('checked',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checked = []
+
+    def check(self, database, sql, parameters, tables):
+        self.checked.append(sql)
+        super().check(database, sql, parameters, tables)
+
+
+class PlanTest(DatabaseTestCase):
+    """Tests of plan checks."""
+
+    SCHEMA = (
+        'CREATE TABLE shelf (id INTEGER PRIMARY KEY, name TEXT)',
+        'CREATE TABLE volume (id INTEGER PRIMARY KEY, shelf INT, title TEXT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Shelf, [Shelf(1, 'a')]).execute(self.database)
+        insert_many(Volume, [
+            Volume(id, 1, f't{id}') for id in range(1, 11)
+        ]).execute(self.database)
+
+    def test_sort_blames_preceding_table(self):
+        plan = parse_plan([
+            (2, 0, 0, 'SCAN shelf'),
+            (3, 0, 0, 'USE TEMP B-TREE FOR ORDER BY'),
+            (5, 0, 0, 'SEARCH volume USING INDEX volume_shelf (shelf=?)')
+        ])
+        check = PlanCheck(scans=False)
+        problems = list(check._problems(  # pylint: disable=W0212
+            plan, {'shelf': 'shelf', 'volume': 'volume'}))
+        self.assertEqual([table for table, _ in problems], ['shelf'])
+
+    def test_sort_of_small_table_passes(self):
+        self.database.plan_check = PlanCheck(5, error=True, scans=False)
+        query = select(Volume, Shelf).join(
+            Shelf, on=Volume.shelf == Shelf.id).order_by(Shelf.name)
+        self.assertIn('TEMP B-TREE', str(query.explain(self.database)))
+        self.assertEqual(len(list(query.execute(self.database))), 10)
+
+        with self.assertRaisesRegex(RuntimeError, "table 'volume'"):
+            list(select(Volume).order_by(Volume.title).execute(self.database))
+
+    def test_full_scan(self):
+        self.database.plan_check = PlanCheck(5)
+
+        with catch_warnings(record=True) as warnings:
+            list(select(Volume).execute(self.database))
+            list(select(Shelf).execute(self.database))
+
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("Full scan of table 'volume' with 10 rows",
+                      str(warnings[0].message))
+
+    def test_cache_hits_are_not_checked(self):
+        check = CountingCheck(100)
+        database = self.open_database(
+            result_cache=LRUResultCache(ttl=60), plan_check=check)
+        self.addCleanup(database.close)
+
+        for _ in range(3):
+            list(select(Volume).cached().execute(database))
+
+        self.assertEqual(len(check.checked), 1)
@@ -0,0 +1,95 @@
+"""Tests of row hydration."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from dcorm import Model, field, select
+
+from tests.helpers import DatabaseTestCase
+
+
+KEY = UUID('12345678-1234-5678-1234-567812345678')
+
+
+class Order(Model, table_name='orders'):
+    """A test model with fields of various types."""
+
+    initialized = 0
+
+    id: int = field(primary=True)
+    placed: datetime
+    due: date
+    total: Decimal
+    paid: bool
+    key: UUID
+    note: Optional[str] = None
+    tags: list = field(default_factory=list, converter=lambda value: (
+        value.split(',') if isinstance(value, str) else value))
+
+    def __post_init__(self):
+        type(self).initialized += 1
+
+
+class SlottedOrder(Model, table_name='orders', slots=True):
+    """A slotted test model."""
+
+    id: int = field(primary=True)
+    placed: datetime
+    due: date
+    total: Decimal
+    paid: bool
+    key: UUID
+    note: Optional[str] = None
+
+
+class HydrationTest(DatabaseTestCase):
+    """Tests of records created from database rows."""
+
+    SCHEMA = (
+        'CREATE TABLE orders (id INTEGER PRIMARY KEY, placed TEXT, due TEXT, '
+        'total TEXT, paid INT, key BLOB, note TEXT, tags TEXT)',
+        "INSERT INTO orders VALUES (1, '2024-05-01 12:30:00', '2024-06-01', "
+        "'12.50', 1, x'12345678123456781234567812345678', NULL, 'a,b')",
+        "INSERT INTO orders VALUES (2, '2024-05-02 08:00:00', '2024-06-02', "
+        "'3', 0, '12345678-1234-5678-1234-567812345678', 'x', '')",
+    )
+
+    def test_converted_values(self):
+        first, second = select(Order).order_by(Order.id).execute(self.database)
+        self.assertEqual(first.placed, datetime(2024, 5, 1, 12, 30))
+        self.assertEqual(first.due, date(2024, 6, 1))
+        self.assertEqual(first.total, Decimal('12.50'))
+        self.assertIs(first.paid, True)
+        self.assertIs(second.paid, False)
+        self.assertEqual((first.key, second.key), (KEY, KEY))
+        self.assertIsNone(first.note)
+        self.assertEqual(first.tags, ['a', 'b'])
+
+    def test_slotted(self):
+        first, second = select(SlottedOrder).order_by(
+            SlottedOrder.id).execute(self.database)
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertEqual(first.total, Decimal('12.50'))
+        self.assertEqual(second.key, KEY)
+        self.assertEqual(second.note, 'x')
+
+    def test_init_is_bypassed(self):
+        initialized = Order.initialized
+        self.assertEqual(len(list(select(Order).execute(self.database))), 2)
+        self.assertEqual(Order.initialized, initialized)
+
+    def test_equal_to_constructed(self):
+        record = next(iter(select(Order).where(Order.id == 1).execute(
+            self.database)))
+        self.assertEqual(record, Order(
+            1, datetime(2024, 5, 1, 12, 30), date(2024, 6, 1),
+            Decimal('12.50'), True, KEY, tags=['a', 'b']
+        ))
+
+    def test_hydrators_are_cached(self):
+        names = ('id', 'total')
+        self.assertIs(Order.__hydrator__(names), Order.__hydrator__(names))
+        record = Order.__hydrator__(names)((5, '1.5'))
+        self.assertEqual((record.id, record.total), (5, Decimal('1.5')))
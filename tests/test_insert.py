@@ -0,0 +1,110 @@
+"""Tests of bulk inserts."""
+
+from dataclasses import replace
+from sqlite3 import IntegrityError
+
+from dcorm import Model, field, insert_many
+from dcorm.sqlite import SQLITE, SQLiteDatabase
+
+from tests.helpers import DatabaseTestCase
+
+
+class LimitedSQLiteDatabase(
+        SQLiteDatabase, engine=replace(SQLITE, max_params=7)):
+    """An SQLite database with a small limit of bound parameters."""
+
+
+class Event(Model, table_name='event'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+    level: int = 0
+
+
+class BulkInsertTest(DatabaseTestCase):
+    """Tests of inserting rows in chunks."""
+
+    SCHEMA = (
+        'CREATE TABLE event (id INTEGER PRIMARY KEY, name TEXT, level INT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.statements = []
+
+    def trace(self, database: SQLiteDatabase) -> None:
+        """Records the insert statements executed on the database."""
+        def trace(sql: str) -> None:
+            if sql.startswith('INSERT'):
+                self.statements.append(sql)
+
+        with database.connection() as connection:
+            connection.set_trace_callback(trace)
+
+    def events(self) -> list[tuple]:
+        """Returns the inserted rows."""
+        return self.rows('SELECT id, name, level FROM event ORDER BY id')
+
+    def test_records_and_dicts(self):
+        self.assertEqual(insert_many(Event, [
+            Event(1, 'a', 2), Event(2, 'b')
+        ]).execute(self.database), 2)
+        self.assertEqual(insert_many(Event, [
+            {'id': 3, 'name': 'c'}, {'id': 4, 'name': 'd', 'level': 5}
+        ]).execute(self.database), 2)
+        self.assertEqual(self.events(), [
+            (1, 'a', 2), (2, 'b', 0), (3, 'c', 0), (4, 'd', 5)])
+
+    def test_chunks_respect_parameter_limit(self):
+        database = LimitedSQLiteDatabase(self.path)
+        self.addCleanup(database.close)
+        self.trace(database)
+        rows = ({'id': id, 'name': str(id)} for id in range(1, 6))
+        self.assertEqual(insert_many(Event, rows).execute(database), 5)
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual(len(self.events()), 5)
+
+    def test_batch_size(self):
+        self.trace(self.database)
+        insert_many(Event, [
+            Event(id, str(id)) for id in range(1, 8)
+        ], batch_size=3).execute(self.database)
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual(self.statements[0].count('), ('), 2)
+
+    def test_executemany(self):
+        self.assertEqual(insert_many(Event, [
+            Event(id, str(id)) for id in range(1, 11)
+        ], executemany=True, batch_size=4).execute(self.database), 10)
+        self.assertEqual(len(self.events()), 10)
+
+    def test_rows_are_consumed_lazily(self):
+        consumed = []
+
+        def rows():
+            for id in range(1, 5):  # pylint: disable=W0622
+                consumed.append(id)
+                yield Event(id, str(id))
+
+        query = insert_many(Event, rows(), batch_size=2)
+        self.assertEqual(consumed, [])
+        query.execute(self.database)
+        self.assertEqual(consumed, [1, 2, 3, 4])
+
+    def test_failure_rolls_back_all_chunks(self):
+        rows = [Event(id, str(id)) for id in (1, 2, 3, 3)]
+
+        with self.assertRaises(IntegrityError):
+            insert_many(Event, rows, batch_size=2).execute(self.database)
+
+        self.assertEqual(self.events(), [])
+
+    def test_missing_value(self):
+        with self.assertRaisesRegex(ValueError, 'name'):
+            insert_many(Event, [
+                {'id': 1, 'name': 'a'}, {'id': 2}
+            ]).execute(self.database)
+
+    def test_empty(self):
+        self.assertEqual(insert_many(Event, []).execute(self.database), 0)
@@ -0,0 +1,173 @@
+"""Tests of bulk loading."""
+
+from asyncio import run
+from dataclasses import replace
+from datetime import date
+from io import StringIO
+from typing import Optional
+
+from dcorm import BulkLoader, FileFormat, Model, RowError, field
+from dcorm.sqlite import SQLITE, SQLiteDatabase
+
+from tests.helpers import DatabaseTestCase
+
+
+class Reading(Model, table_name='reading'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    day: date
+    value: float
+    valid: bool = True
+    note: Optional[str] = None
+
+
+SCHEMA = (
+    'CREATE TABLE reading (id INTEGER PRIMARY KEY, day TEXT NOT NULL, '
+    'value REAL NOT NULL, valid BOOLEAN NOT NULL, note TEXT)'
+)
+
+
+class LimitedDatabase(SQLiteDatabase, engine=replace(SQLITE, max_params=7)):
+    """An SQLite database with a small limit of bound parameters."""
+
+
+class Abort(Exception):
+    """Raised by error handlers to abort loading."""
+
+
+def csv(rows: int) -> StringIO:
+    """Returns a CSV file with the given amount of rows."""
+
+    return StringIO('id,day,value\n' + ''.join(
+        f'{index},2024-01-01,{index / 2}\n' for index in range(1, rows + 1)))
+
+
+class BulkLoaderTest(DatabaseTestCase):
+    """Tests of loading records from files."""
+
+    SCHEMA = (SCHEMA,)
+
+    def count(self) -> int:
+        """Returns the amount of committed rows."""
+        return self.rows('SELECT COUNT(*) FROM reading')[0][0]
+
+    def test_csv(self):
+        file = StringIO(
+            'id,day,value,valid,note\n'
+            '1,2024-01-01,1.5,yes,\n'
+            '2,2024-01-02,2,false,hello\n'
+        )
+        result = Reading.load_from(file, 'csv', self.database)
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(self.rows('SELECT * FROM reading ORDER BY id'), [
+            (1, '2024-01-01', 1.5, 1, None),
+            (2, '2024-01-02', 2.0, 0, 'hello')
+        ])
+
+    def test_csv_fields_and_defaults(self):
+        file = StringIO('1,2024-01-01,3.5\n')
+        result = Reading.load_from(
+            file, FileFormat.CSV, self.database,
+            fields=['id', 'day', 'value']
+        )
+        self.assertEqual(result.inserted, 1)
+        self.assertEqual(
+            self.rows('SELECT valid, note FROM reading'), [(1, None)])
+
+    def test_chunks_respect_parameter_limit(self):
+        database = LimitedDatabase(self.path)
+        self.addCleanup(database.close)
+        loader = BulkLoader(Reading, csv(5), FileFormat.CSV)
+        self.assertEqual([
+            (len(fields), len(chunk))
+            for fields, chunk in loader.chunks(database)
+        ], [(5, 1)] * 5)
+        self.assertEqual(BulkLoader(
+            Reading, csv(5), FileFormat.CSV).execute(database).inserted, 5)
+
+    def test_no_database(self):
+        with self.assertRaisesRegex(ValueError, 'No database'):
+            BulkLoader(Reading, csv(1), FileFormat.CSV).execute()
+
+    def test_jsonl(self):
+        file = StringIO(
+            '{"id": 1, "day": "2024-01-01", "value": 1, "note": "x"}\n'
+            '\n'
+            '{"id": 2, "day": "2024-01-02", "value": 2.5, "valid": false}\n'
+        )
+        result = Reading.load_from(file, 'jsonl', self.database)
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual(self.rows('SELECT * FROM reading ORDER BY id'), [
+            (1, '2024-01-01', 1.0, 1, 'x'),
+            (2, '2024-01-02', 2.5, 0, None)
+        ])
+
+    def test_errors(self):
+        file = StringIO(
+            '{"id": 1, "day": "2024-01-01", "value": 1}\n'
+            'not json\n'
+            '{"id": 3, "day": "2024-01-03"}\n'
+            '{"id": 4, "day": "not a date", "value": 4}\n'
+            '{"id": 1, "day": "2024-01-05", "value": 5}\n'
+            '{"id": 6, "day": "2024-01-06", "value": 6}\n'
+        )
+        result = Reading.load_from(
+            file, 'jsonl', self.database, batch_size=10)
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual([error.line for error in result.errors], [2, 3, 4, 5])
+        self.assertEqual(
+            self.rows('SELECT id FROM reading ORDER BY id'), [(1,), (6,)])
+
+    def test_abort_rolls_back_since_last_commit(self):
+        def on_error(error: RowError) -> None:
+            raise Abort(error)
+
+        file = StringIO(csv(10).getvalue() + '11,not a date,1\n')
+
+        with self.assertRaises(Abort):
+            Reading.load_from(
+                file, 'csv', self.database, batch_size=2, commit_every=4,
+                on_error=on_error
+            )
+
+        self.assertEqual(self.count(), 8)
+
+    def test_abort_without_commits(self):
+        def on_error(error: RowError) -> None:
+            raise Abort(error)
+
+        file = StringIO(csv(10).getvalue() + '11,not a date,1\n')
+
+        with self.assertRaises(Abort):
+            Reading.load_from(
+                file, 'csv', self.database, batch_size=2, on_error=on_error)
+
+        self.assertEqual(self.count(), 0)
+
+    def test_commit_every(self):
+        counts = []
+
+        def lines():
+            for line in csv(10):
+                counts.append(self.count())
+                yield line
+
+        Reading.load_from(
+            lines(), 'csv', self.database, batch_size=2, commit_every=4)
+        self.assertEqual(self.count(), 10)
+        self.assertEqual(sorted(set(counts)), [0, 4, 8])
+
+    def test_async(self):
+        database = self.open_async_database()
+
+        async def main():
+            try:
+                return await Reading.aload_from(
+                    csv(5), 'csv', database, batch_size=2)
+            finally:
+                await database.close()
+
+        self.assertEqual(run(main()).inserted, 5)
+        self.assertEqual(self.count(), 5)
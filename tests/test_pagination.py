@@ -0,0 +1,74 @@
+"""Tests of keyset pagination."""
+
+from asyncio import run
+
+from dcorm import Model, field, insert_many, select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Post(Model, table_name='post'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    score: int
+    title: str
+
+
+class PaginationTest(DatabaseTestCase):
+    """Tests of paging by the values of the last result."""
+
+    SCHEMA = (
+        'CREATE TABLE post (id INTEGER PRIMARY KEY, score INT, title TEXT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Post, [
+            Post(id, id % 3, f't{id}') for id in range(1, 11)
+        ]).execute(self.database)
+
+    def expected(self, *order: str) -> list[int]:
+        """Returns the ids in the given order."""
+        return [row[0] for row in self.rows(
+            f'SELECT id FROM post ORDER BY {", ".join(order)}')]
+
+    def test_pages_by_primary_key(self):
+        pages = list(select(Post).pages(4, self.database))
+        self.assertEqual([[post.id for post in page] for page in pages],
+                         [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]])
+
+    def test_pages_with_ties(self):
+        pages = select(Post).order_by(Post.score.desc()).pages(
+            3, self.database)
+        self.assertEqual([post.id for page in pages for post in page],
+                         self.expected('score DESC', 'id'))
+
+    def test_paginate_after(self):
+        query = select(Post).order_by(Post.score)
+        first = list(query.paginate_after(None, 4).execute(self.database))
+        second = list(query.paginate_after(first[-1], 4).execute(
+            self.database))
+        self.assertEqual([post.id for post in first + second],
+                         self.expected('score', 'id')[:8])
+        self.assertNotIn('OFFSET', self.database.compile(query)[0])
+
+    def test_exact_multiple(self):
+        pages = list(select(Post).pages(5, self.database))
+        self.assertEqual([len(page) for page in pages], [5, 5])
+
+    def test_async(self):
+        async def ids():
+            database = self.open_async_database()
+
+            try:
+                return [
+                    [post.id for post in page] async for page in
+                    select(Post).order_by(Post.score).apages(4, database)
+                ]
+            finally:
+                await database.close()
+
+        pages = run(ids())
+        self.assertEqual([len(page) for page in pages], [4, 4, 2])
+        self.assertEqual(sum(pages, []), self.expected('score', 'id'))
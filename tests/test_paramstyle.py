@@ -0,0 +1,82 @@
+"""Tests of bind parameters."""
+
+from dataclasses import replace
+
+from dcorm import Context, Engine, Model, ParamStyle, field, insert_many
+from dcorm import select
+from dcorm.sqlite import SQLITE, SQLiteDatabase
+
+from tests.helpers import DatabaseTestCase
+
+
+class NumericSQLiteDatabase(
+        SQLiteDatabase, engine=replace(SQLITE, param=ParamStyle.NUMERIC)):
+    """An SQLite database using numeric parameters."""
+
+
+class NamedSQLiteDatabase(
+        SQLiteDatabase, engine=replace(SQLITE, param=ParamStyle.NAMED)):
+    """An SQLite database using named parameters."""
+
+
+class Quote(Model, table_name='quote'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    text: str
+
+
+TEXTS = ["It's", '100% "sure"', "'; DROP TABLE quote; --", '?', ':p1']
+
+
+class ParamStyleTest(DatabaseTestCase):
+    """Tests of values passed as driver bind parameters."""
+
+    SCHEMA = ('CREATE TABLE quote (id INTEGER PRIMARY KEY, text TEXT)',)
+
+    def test_placeholders(self):
+        condition = (Quote.id == 1) & (Quote.text % 'a%')
+        expected = {
+            ParamStyle.QMARK: ('"quote"."id" = ? AND "quote"."text" LIKE ?',
+                               [1, 'a%']),
+            ParamStyle.FORMAT: ('"quote"."id" = %s AND "quote"."text" LIKE %s',
+                                [1, 'a%']),
+            ParamStyle.NUMERIC: (
+                '"quote"."id" = :1 AND "quote"."text" LIKE :2', [1, 'a%']),
+            ParamStyle.NAMED: (
+                '"quote"."id" = :p1 AND "quote"."text" LIKE :p2',
+                {'p1': 1, 'p2': 'a%'}),
+            ParamStyle.PYFORMAT: (
+                '"quote"."id" = %(p1)s AND "quote"."text" LIKE %(p2)s',
+                {'p1': 1, 'p2': 'a%'})
+        }
+
+        for param, query in expected.items():
+            with self.subTest(param=param):
+                self.assertEqual(
+                    Context(Engine(param=param)).sql(condition).query(),
+                    query
+                )
+
+    def test_percent_signs_are_escaped(self):
+        sql, _ = Context(Engine(param=ParamStyle.FORMAT)).raw_value(
+            "a LIKE '%'", ()).query()
+        self.assertEqual(sql, "a LIKE '%%'")
+
+    def test_round_trip(self):
+        for database_type in (
+                SQLiteDatabase, NumericSQLiteDatabase, NamedSQLiteDatabase):
+            with self.subTest(database=database_type.__name__):
+                database = database_type(self.path)
+                self.addCleanup(database.close)
+                database.execute('DELETE FROM quote')
+                insert_many(Quote, [
+                    Quote(index, text) for index, text in enumerate(TEXTS)
+                ]).execute(database)
+
+                for index, text in enumerate(TEXTS):
+                    self.assertEqual([quote.id for quote in select(
+                        Quote).where(Quote.text == text).execute(database)],
+                        [index])
+
+        self.assertEqual(len(self.rows('SELECT * FROM quote')), len(TEXTS))
@@ -0,0 +1,117 @@
+"""Tests of prefetching related records."""
+
+from asyncio import run
+
+from dcorm import Model, field, insert_many, related, select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Club(Model, table_name='club'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class Player(Model, table_name='player'):
+    """A test model referencing clubs."""
+
+    id: int = field(primary=True)
+    name: str
+    club: int = field(references=Club)
+
+
+class Goal(Model, table_name='goal'):
+    """A test model referencing players."""
+
+    id: int = field(primary=True)
+    player: int = field(references=Player)
+    minute: int
+
+
+class PrefetchTest(DatabaseTestCase):
+    """Tests of prefetching with one query per model and batch."""
+
+    SCHEMA = (
+        'CREATE TABLE club (id INTEGER PRIMARY KEY, name TEXT)',
+        'CREATE TABLE player (id INTEGER PRIMARY KEY, name TEXT, club INT)',
+        'CREATE TABLE goal (id INTEGER PRIMARY KEY, player INT, minute INT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Club, [
+            Club(id, f'c{id}') for id in range(1, 4)
+        ]).execute(self.database)
+        insert_many(Player, [
+            Player(id, f'p{id}', (id - 1) % 2 + 1) for id in range(1, 7)
+        ]).execute(self.database)
+        insert_many(Goal, [
+            Goal(1, 1, 10), Goal(2, 1, 20), Goal(3, 4, 30)
+        ]).execute(self.database)
+        self.statements = []
+
+        with self.database.connection() as connection:
+            connection.set_trace_callback(self.trace)
+
+    def trace(self, sql: str) -> None:
+        """Records the executed queries."""
+        if sql.startswith('SELECT "'):
+            self.statements.append(sql)
+
+    def test_referencing_records(self):
+        clubs = list(select(Club).order_by(Club.id).prefetch(Player).execute(
+            self.database))
+        self.assertEqual(
+            [[player.name for player in related(club, Player)]
+             for club in clubs],
+            [['p1', 'p3', 'p5'], ['p2', 'p4', 'p6'], []]
+        )
+        self.assertEqual(len(self.statements), 2)
+
+    def test_referenced_records(self):
+        players = list(select(Player).order_by(Player.id).prefetch(
+            Club).execute(self.database))
+        self.assertEqual([related(player, Club).name for player in players],
+                         ['c1', 'c2'] * 3)
+        self.assertEqual(len(self.statements), 2)
+
+    def test_nested(self):
+        clubs = list(select(Club).order_by(Club.id).prefetch(
+            Player, Goal).execute(self.database))
+        self.assertEqual(
+            [[len(related(player, Goal)) for player in related(club, Player)]
+             for club in clubs],
+            [[2, 0, 0], [0, 1, 0], []]
+        )
+        self.assertEqual(len(self.statements), 3)
+
+    def test_batches(self):
+        players = list(select(Player).order_by(Player.id).prefetch(
+            Club).execute(self.database, batch_size=4))
+        self.assertEqual(len(players), 6)
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual(related(players[5], Club).name, 'c2')
+
+    def test_not_prefetched(self):
+        club = next(iter(select(Club).execute(self.database)))
+
+        with self.assertRaises(LookupError):
+            related(club, Player)
+
+    def test_async(self):
+        async def names():
+            database = self.open_async_database()
+
+            try:
+                return [
+                    [player.name for player in related(club, Player)]
+                    async for club in await select(Club).order_by(
+                        Club.id).prefetch(Player).aexecute(database)
+                ]
+            finally:
+                await database.close()
+
+        self.assertEqual(run(names()),
+                         [['p1', 'p3', 'p5'], ['p2', 'p4', 'p6'], []])
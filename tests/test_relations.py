@@ -0,0 +1,137 @@
+"""Tests of foreign keys and join inference."""
+
+from dcorm import Model, field, insert_many, select
+from dcorm.relations import GRAPH, find_relation
+
+from tests.helpers import DatabaseTestCase
+
+
+class Resident(Model, table_name='resident'):
+    """A test model referencing a model by name before it is defined."""
+
+    id: int = field(primary=True)
+    name: str
+    town: int = field(references='Town')
+
+
+class Region(Model, table_name='region'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class Town(Model, table_name='town'):
+    """A test model referencing regions."""
+
+    id: int = field(primary=True)
+    name: str
+    region: int = field(references=Region.id)
+
+
+class Route(Model, table_name='route'):
+    """A test model referencing towns twice."""
+
+    id: int = field(primary=True)
+    origin: int = field(references=Town)
+    destination: int = field(references=Town)
+
+
+class Forecast(Model, table_name='forecast'):
+    """A test model without relations."""
+
+    id: int = field(primary=True)
+
+
+def harbour(module: str) -> type:
+    """Returns a test model named like the model of another module."""
+
+    class Harbour(Model, table_name='harbour'):
+        """A test model."""
+
+        __module__ = module
+        id: int = field(primary=True)
+
+    return Harbour
+
+
+Harbour = harbour('tests.ports')
+OtherHarbour = harbour('tests.other_ports')
+
+
+class Ship(Model, table_name='ship'):
+    """A test model referencing a model by an ambiguous name."""
+
+    __module__ = 'tests.other_ports'
+    id: int = field(primary=True)
+    harbour: int = field(references='Harbour')
+
+
+class RelationsTest(DatabaseTestCase):
+    """Tests of joins derived from foreign keys."""
+
+    SCHEMA = (
+        'CREATE TABLE region (id INTEGER PRIMARY KEY, name TEXT)',
+        'CREATE TABLE town (id INTEGER PRIMARY KEY, name TEXT, region INT)',
+        'CREATE TABLE resident (id INTEGER PRIMARY KEY, name TEXT, town INT)',
+        'CREATE TABLE route (id INTEGER PRIMARY KEY, origin INT, '
+        'destination INT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Region, [Region(1, 'north'), Region(2, 'south')]).execute(
+            self.database)
+        insert_many(Town, [
+            Town(1, 'a', 1), Town(2, 'b', 2), Town(3, 'c', 2)
+        ]).execute(self.database)
+        insert_many(Resident, [
+            Resident(1, 'x', 1), Resident(2, 'y', 2), Resident(3, 'z', 3)
+        ]).execute(self.database)
+
+    def test_direct_join(self):
+        query = select(Resident.name, Town.name).join(Town).order_by(
+            Resident.id)
+        self.assertIn('ON "resident"."town" = "town"."id"',
+                      self.database.compile(query)[0])
+        self.assertEqual(list(query.execute(self.database)),
+                         [('x', 'a'), ('y', 'b'), ('z', 'c')])
+
+    def test_reverse_join(self):
+        query = select(Region.name, Town.name).join(Town).order_by(Town.id)
+        self.assertEqual(list(query.execute(self.database)),
+                         [('north', 'a'), ('south', 'b'), ('south', 'c')])
+
+    def test_path_join(self):
+        query = select(Resident.name).join(Region).where(
+            Region.name == 'south').order_by(Resident.id)
+        self.assertIn('"town"', self.database.compile(query)[0])
+        self.assertEqual(list(query.execute(self.database)), ['y', 'z'])
+
+    def test_ambiguous_relation(self):
+        with self.assertRaisesRegex(ValueError, 'Ambiguous'):
+            select(Route).join(Town)
+
+    def test_explicit_condition(self):
+        query = select(Route).join(Town, on=Route.origin == Town.id)
+        self.assertEqual(list(query.execute(self.database)), [])
+
+    def test_no_relation(self):
+        with self.assertRaisesRegex(ValueError, 'No relation'):
+            select(Region).join(Forecast)
+
+    def test_only_join_columns(self):
+        query = select(Resident, Town).join(Town).order_by(
+            Resident.id).only_join_columns()
+        resident, town = next(iter(query.execute(self.database)))
+        self.assertEqual((resident.name, town.id), ('x', 1))
+
+        with self.assertRaisesRegex(AttributeError, "'name' is not loaded"):
+            town.name   # pylint: disable=W0104
+
+    def test_same_model_names(self):
+        self.assertIs(GRAPH.resolve('Harbour', 'tests.ports'), Harbour.id)
+        self.assertIs(find_relation(Ship, OtherHarbour).rhs, OtherHarbour.id)
+
+        with self.assertRaisesRegex(ValueError, 'Ambiguous model name'):
+            GRAPH.resolve('Harbour')
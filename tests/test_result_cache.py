@@ -0,0 +1,104 @@
+"""Tests of the result cache."""
+
+from asyncio import run
+from threading import Thread
+
+from dcorm import LRUResultCache, Model, delete, field, insert_many, select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Item(Model, table_name='item'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class Rollback(Exception):
+    """Raised to roll back a transaction."""
+
+
+class ResultCacheTest(DatabaseTestCase):
+    """Tests of cached select queries."""
+
+    SCHEMA = ('CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)',)
+
+    def setUp(self):
+        super().setUp()
+        self.cache = LRUResultCache(ttl=60)
+        self.database = self.open_database(result_cache=self.cache)
+        self.addCleanup(self.database.close)
+        insert_many(Item, [Item(1, 'a')]).execute(self.database)
+
+    def names(self) -> list[str]:
+        """Returns the names of the items by a cached query."""
+        return [
+            item.name for item in select(Item).order_by(Item.id).cached(
+            ).execute(self.database)
+        ]
+
+    def test_hit(self):
+        self.assertEqual(self.names(), ['a'])
+        self.assertEqual(self.names(), ['a'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_invalidation(self):
+        self.assertEqual(self.names(), ['a'])
+        insert_many(Item, [Item(2, 'b')]).execute(self.database)
+        self.assertEqual(self.names(), ['a', 'b'])
+        delete(Item).where(Item.id == 1).execute(self.database)
+        self.assertEqual(self.names(), ['b'])
+
+    def test_ttl(self):
+        self.cache.ttl = -1
+        self.assertEqual(self.names(), ['a'])
+        self.database.execute("INSERT INTO item VALUES (2, 'b')")
+        self.assertEqual(self.names(), ['a', 'b'])
+
+    def test_bypassed_in_transaction(self):
+        with self.database.atomic():
+            insert_many(Item, [Item(2, 'b')]).execute(self.database)
+            self.assertEqual(self.names(), ['a', 'b'])
+            self.assertEqual(len(self.cache), 0)
+
+        self.assertEqual(self.names(), ['a', 'b'])
+
+    def test_rollback_not_cached(self):
+        with self.assertRaises(Rollback), self.database.atomic():
+            insert_many(Item, [Item(2, 'b')]).execute(self.database)
+            self.assertEqual(self.names(), ['a', 'b'])
+            raise Rollback()
+
+        self.assertEqual(self.names(), ['a'])
+
+    def test_concurrent_reader_during_transaction(self):
+        with self.database.atomic():
+            insert_many(Item, [Item(2, 'b')]).execute(self.database)
+            reader = Thread(target=self.names)
+            reader.start()
+            reader.join()
+            self.assertEqual(len(self.cache), 1)
+
+        self.assertEqual(self.names(), ['a', 'b'])
+
+    def test_async_iteration(self):
+        database = self.open_async_database(result_cache=self.cache)
+
+        class Stock(Model, table_name='item', database=database):
+            """A test model on an asynchronous database."""
+
+            id: int = field(primary=True)
+            name: str
+
+        async def main():
+            try:
+                return [
+                    [item.name async for item in select(Stock).cached()]
+                    for _ in range(2)
+                ]
+            finally:
+                await database.close()
+
+        self.assertEqual(run(main()), [['a'], ['a']])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
@@ -0,0 +1,63 @@
+"""Tests of streamed query results."""
+
+from dcorm import Model, field, insert_many, select
+from dcorm.results import ResultIterator
+
+from tests.helpers import DatabaseTestCase
+
+
+class Sample(Model, table_name='sample'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    value: float
+
+
+class ResultIteratorTest(DatabaseTestCase):
+    """Tests of fetching results in batches."""
+
+    SCHEMA = ('CREATE TABLE sample (id INTEGER PRIMARY KEY, value REAL)',)
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Sample, [
+            Sample(id, id / 2) for id in range(1, 11)
+        ]).execute(self.database)
+
+    def iterator(self, batches: list[int]) -> ResultIterator:
+        """Returns an iterator over the ids recording its batch sizes."""
+        return ResultIterator(
+            self.database, 'SELECT id FROM sample ORDER BY id', (),
+            lambda row: row[0], batch_size=3,
+            process=lambda records: batches.append(len(records))
+        )
+
+    def test_batches(self):
+        batches = []
+        self.assertEqual(list(self.iterator(batches)), list(range(1, 11)))
+        self.assertEqual(batches, [3, 3, 3, 1])
+
+    def test_lazy_fetching(self):
+        batches = []
+        results = self.iterator(batches)
+        self.assertEqual(batches, [])
+        self.assertEqual(next(results), 1)
+        self.assertEqual(batches, [3])
+        self.assertEqual([next(results) for _ in range(3)], [2, 3, 4])
+        self.assertEqual(batches, [3, 3])
+        results.close()
+
+    def test_connection_is_held_while_streaming(self):
+        results = select(Sample).order_by(Sample.id).execute(
+            self.database, batch_size=4)
+        self.assertEqual(next(results).id, 1)
+        self.assertEqual(self.database.pool.idle, 0)
+        results.close()
+        self.assertEqual(self.database.pool.idle, 1)
+        self.assertEqual(list(results), [])
+
+    def test_exhaustion_releases_connection(self):
+        with select(Sample).execute(self.database, batch_size=4) as results:
+            self.assertEqual(sum(sample.value for sample in results), 27.5)
+            self.assertEqual(self.database.pool.idle, 1)
+
@@ -0,0 +1,82 @@
+"""Tests of plain row modes."""
+
+from asyncio import run
+from datetime import date
+
+from dcorm import Model, field, insert_many, select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Visit(Model, table_name='visit'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    day: date
+    guest: str
+
+
+class RowModesTest(DatabaseTestCase):
+    """Tests of tuples, dicts and named tuples instead of records."""
+
+    SCHEMA = (
+        'CREATE TABLE visit (id INTEGER PRIMARY KEY, day TEXT, guest TEXT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Visit, [
+            Visit(1, date(2024, 5, 1), 'ann'), Visit(2, date(2024, 5, 2), 'bo')
+        ]).execute(self.database)
+
+    def query(self):
+        """Returns a query of all visits."""
+        return select(Visit).order_by(Visit.id)
+
+    def test_tuples(self):
+        self.assertEqual(list(self.query().tuples().execute(self.database)), [
+            (1, date(2024, 5, 1), 'ann'), (2, date(2024, 5, 2), 'bo')])
+
+    def test_dicts(self):
+        self.assertEqual(
+            list(select(Visit.guest, Visit.day).order_by(Visit.id).dicts(
+                ).execute(self.database)),
+            [{'guest': 'ann', 'day': date(2024, 5, 1)},
+             {'guest': 'bo', 'day': date(2024, 5, 2)}]
+        )
+
+    def test_namedtuples(self):
+        rows = list(self.query().namedtuples().execute(self.database))
+        self.assertNotIsInstance(rows[0], Visit)
+        self.assertEqual(rows[0]._fields, ('id', 'day', 'guest'))
+        self.assertEqual([row.day for row in rows],
+                         [date(2024, 5, 1), date(2024, 5, 2)])
+
+    def test_null_values(self):
+        self.rows("INSERT INTO visit VALUES (3, NULL, 'cy')")
+        self.assertEqual(
+            list(self.query().where(Visit.id == 3).tuples().execute(
+                self.database)),
+            [(3, None, 'cy')]
+        )
+
+    def test_duplicate_names(self):
+        alias = Visit.alias('other')
+        query = select(Visit.id, alias.id).join(
+            alias, on=alias.id == Visit.id)
+        self.assertEqual(len(list(query.tuples().execute(self.database))), 2)
+
+        with self.assertRaisesRegex(ValueError, 'Duplicate'):
+            list(query.dicts().execute(self.database))
+
+    def test_async(self):
+        async def rows():
+            database = self.open_async_database()
+
+            try:
+                return [row async for row in await self.query().dicts(
+                    ).aexecute(database)]
+            finally:
+                await database.close()
+
+        self.assertEqual([row['guest'] for row in run(rows())], ['ann', 'bo'])
@@ -0,0 +1,92 @@
+"""Tests of sessions."""
+
+from asyncio import run
+
+from dcorm import Model, Session, bulk_update, field, insert_many, update
+
+from tests.helpers import DatabaseTestCase
+
+
+class Member(Model, table_name='member'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+    team: str
+
+
+class SessionTest(DatabaseTestCase):
+    """Tests of the identity map of sessions."""
+
+    SCHEMA = (
+        'CREATE TABLE member (id INTEGER PRIMARY KEY, name TEXT, team TEXT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Member, [
+            Member(1, 'a', 'x'), Member(2, 'b', 'x'), Member(3, 'c', 'y')
+        ]).execute(self.database)
+        self.session = Session(self.database)
+
+    def test_identity(self):
+        member = self.session.get(Member, 1)
+        self.assertIs(self.session.get(Member, 1), member)
+        self.assertIsNone(self.session.get(Member, 4))
+
+    def test_update_invalidates(self):
+        member = self.session.get(Member, 1)
+        self.session.execute(
+            update(Member).set(name='z').where(Member.id == 1))
+        self.assertIsNot(self.session.get(Member, 1), member)
+        self.assertEqual(self.session.get(Member, 1).name, 'z')
+
+    def test_bulk_update_streams_rows(self):
+        consumed = []
+
+        def rows():
+            for id, name in [(1, 'd'), (2, 'e')]:  # pylint: disable=W0622
+                consumed.append(id)
+                yield {'id': id, 'name': name}
+
+        query = bulk_update(Member, rows(), ['name'], batch_size=1)
+        self.session.execute(query)
+        self.assertEqual(consumed, [1, 2])
+        self.assertNotIsInstance(query.rows, list)
+        self.assertEqual(
+            self.rows('SELECT name FROM member ORDER BY id'),
+            [('d',), ('e',), ('c',)]
+        )
+
+    def test_bulk_update_invalidates_keys(self):
+        first = self.session.get(Member, 1)
+        third = self.session.get(Member, 3)
+        self.session.execute(
+            bulk_update(Member, [{'id': 1, 'name': 'd'}], ['name']))
+        self.assertEqual(self.session.get(Member, 1).name, 'd')
+        self.assertIsNot(self.session.get(Member, 1), first)
+        self.assertIs(self.session.get(Member, 3), third)
+
+    def test_bulk_update_by_other_key_invalidates_model(self):
+        third = self.session.get(Member, 3)
+        self.session.execute(bulk_update(
+            Member, [{'team': 'y', 'name': 'd'}], ['name'], key=Member.team))
+        self.assertIsNot(self.session.get(Member, 3), third)
+        self.assertEqual(self.session.get(Member, 3).name, 'd')
+
+    def test_async_bulk_update_invalidates_keys(self):
+        async def updated():
+            database = self.open_async_database()
+            session = Session(database)
+
+            try:
+                first = await session.aget(Member, 1)
+                await session.aexecute(
+                    bulk_update(Member, [{'id': 1, 'name': 'd'}], ['name']))
+                return first, await session.aget(Member, 1)
+            finally:
+                await database.close()
+
+        first, second = run(updated())
+        self.assertIsNot(second, first)
+        self.assertEqual(second.name, 'd')
@@ -0,0 +1,74 @@
+"""Tests of flattened and simplified conditions."""
+
+from functools import reduce
+from operator import and_, or_
+
+from dcorm import Model, field, insert_many, select
+from dcorm.expression_base import Junction
+from dcorm.simplify import simplify
+
+from tests.helpers import DatabaseTestCase
+
+
+class Tag(Model, table_name='tag'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class SimplifyTest(DatabaseTestCase):
+    """Tests of conditions against SQLite."""
+
+    SCHEMA = ('CREATE TABLE tag (id INTEGER PRIMARY KEY, name TEXT)',)
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Tag, [
+            Tag(id, f'n{id % 7}') for id in range(1, 101)
+        ]).execute(self.database)
+
+    def ids(self, condition) -> list[int]:
+        """Returns the ids of the tags matching the condition."""
+        return [tag.id for tag in select(Tag).where(condition).order_by(
+            Tag.id).execute(self.database)]
+
+    def test_flattened_chains(self):
+        condition = reduce(and_, [Tag.id > index for index in range(5000)])
+        self.assertIsInstance(condition, Junction)
+        self.assertEqual(len(condition.operands), 5000)
+        sql, parameters = self.database.compile(select(Tag).where(condition))
+        self.assertEqual(sql.count(' AND '), 4999)
+        self.assertEqual(parameters, list(range(5000)))
+
+    def test_long_conjunction(self):
+        condition = reduce(and_, [Tag.id > index for index in range(500)])
+        self.assertEqual(self.ids(condition), [])
+        condition = reduce(and_, [Tag.id > index for index in range(95)])
+        self.assertEqual(self.ids(condition), list(range(95, 101)))
+
+    def test_long_disjunction(self):
+        condition = reduce(or_, [Tag.id == id for id in range(3000)])
+        self.assertEqual(self.ids(condition), list(range(1, 101)))
+        sql, _ = self.database.compile(select(Tag).where(condition))
+        self.assertEqual(sql.count(' IN '), 1)
+
+    def test_long_conjunction_of_inequalities(self):
+        condition = reduce(and_, [Tag.id != id for id in range(3, 3000)])
+        self.assertEqual(self.ids(condition), [1, 2])
+
+    def test_constants(self):
+        self.assertEqual(self.ids(Tag.id << []), [])
+        self.assertEqual(len(self.ids(~(Tag.id << []))), 100)
+        self.assertIs(simplify((Tag.id == 1) | True), True)
+        self.assertIs(simplify((Tag.id == 1) & False), False)
+
+    def test_duplicates(self):
+        condition = (Tag.name == 'n1') & (Tag.id < 20) & (Tag.name == 'n1')
+        self.assertEqual(len(simplify(condition).operands), 2)
+        self.assertEqual(self.ids(condition), [1, 8, 15])
+
+    def test_mixed(self):
+        condition = ((Tag.id == 1) | (Tag.id == 2) | (Tag.name == 'n3')) & (
+            Tag.id < 20)
+        self.assertEqual(self.ids(condition), [1, 2, 3, 10, 17])
@@ -0,0 +1,77 @@
+"""Tests of slotted models and expression nodes."""
+
+from sys import getsizeof
+
+from dcorm import Model, field, insert_many, select
+
+from tests.helpers import DatabaseTestCase
+
+
+class Point(Model, table_name='point', slots=True):
+    """A slotted test model."""
+
+    id: int = field(primary=True)
+    x: float
+    y: float = 0.0
+    label: str = 'origin'
+
+
+class PlainPoint(Model, table_name='point'):
+    """A test model without slots."""
+
+    id: int = field(primary=True)
+    x: float
+    y: float = 0.0
+    label: str = 'origin'
+
+
+class SlotsTest(DatabaseTestCase):
+    """Tests of records stored in slots."""
+
+    SCHEMA = (
+        'CREATE TABLE point (id INTEGER PRIMARY KEY, x REAL, y REAL, '
+        'label TEXT)',
+    )
+
+    def test_no_instance_dict(self):
+        point = Point(1, 2.0)
+        plain = PlainPoint(1, 2.0)
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertLess(
+            getsizeof(point), getsizeof(plain) + getsizeof(plain.__dict__))
+
+        with self.assertRaises(AttributeError):
+            point.z = 1     # pylint: disable=W0201
+
+    def test_defaults_and_conversion(self):
+        point = Point(1, 2)
+        self.assertEqual((point.y, point.label), (0.0, 'origin'))
+        self.assertIsInstance(point.x, float)
+        point.y = '1.5'
+        self.assertEqual(point.y, 1.5)
+
+    def test_class_attributes_are_columns(self):
+        self.assertEqual(
+            self.database.compile(select(Point).where(Point.x > 1)),
+            ('SELECT "point"."id", "point"."x", "point"."y", "point"."label" '
+             'FROM "point" WHERE "point"."x" > ?', [1])
+        )
+
+    def test_round_trip(self):
+        insert_many(Point, [
+            Point(1, 1.0), Point(2, 2.0, 3.0, 'b')
+        ]).execute(self.database)
+        self.assertEqual(
+            list(select(Point).order_by(Point.id).execute(self.database)),
+            [Point(1, 1.0), Point(2, 2.0, 3.0, 'b')]
+        )
+        self.assertEqual(
+            [point.label for point in select(PlainPoint).order_by(
+                PlainPoint.id).execute(self.database)],
+            ['origin', 'b']
+        )
+
+    def test_slotted_expressions(self):
+        expression = (Point.x > 1) & (Point.y < 2)
+        self.assertFalse(hasattr(expression, '__dict__'))
+        self.assertFalse(hasattr(Point.x, '__dict__'))
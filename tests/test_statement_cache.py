@@ -0,0 +1,83 @@
+"""Tests of the compiled statement cache."""
+
+from dataclasses import replace
+
+from dcorm import Context, Model, StatementCache, field, fingerprint, select
+from dcorm import insert_many
+from dcorm.sqlite import SQLITE, SQLiteDatabase
+
+from tests.helpers import DatabaseTestCase
+
+
+CACHE = StatementCache(maxsize=4)
+
+
+class CachedSQLiteDatabase(SQLiteDatabase,
+                           engine=replace(SQLITE, statement_cache=CACHE)):
+    """An SQLite database with a statement cache."""
+
+
+class Fruit(Model, table_name='fruit'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    name: str
+
+
+class StatementCacheTest(DatabaseTestCase):
+    """Tests of templates cached by query shape."""
+
+    SCHEMA = ('CREATE TABLE fruit (id INTEGER PRIMARY KEY, name TEXT)',)
+
+    def setUp(self):
+        super().setUp()
+        CACHE.clear()
+        self.database = self.open_database()
+        self.addCleanup(self.database.close)
+        insert_many(Fruit, [
+            Fruit(1, 'apple'), Fruit(2, 'banana'), Fruit(3, 'cherry')
+        ]).execute(self.database)
+
+    def open_database(self, **kwargs):
+        return CachedSQLiteDatabase(self.path, **kwargs)
+
+    def names(self, query) -> list[str]:
+        """Returns the names of the selected fruits."""
+        return [fruit.name for fruit in query.execute(self.database)]
+
+    def test_same_shape(self):
+        first = fingerprint(select(Fruit).where(Fruit.id == 1))
+        second = fingerprint(select(Fruit).where(Fruit.id == 2))
+        self.assertEqual(first.key, second.key)
+        self.assertEqual((first.values, second.values), ([1], [2]))
+
+    def test_different_shape(self):
+        self.assertNotEqual(
+            fingerprint(select(Fruit).where(Fruit.id == 1)).key,
+            fingerprint(select(Fruit).where(Fruit.name == 'a')).key
+        )
+        self.assertNotEqual(
+            fingerprint(select(Fruit).where(Fruit.id << [1, 2])).key,
+            fingerprint(select(Fruit).where(Fruit.id << [1, 2, 3])).key
+        )
+
+    def test_hits_bind_new_values(self):
+        self.assertEqual(
+            self.names(select(Fruit).where(Fruit.id == 1)), ['apple'])
+        hits = CACHE.hits
+        self.assertEqual(
+            self.names(select(Fruit).where(Fruit.id == 2)), ['banana'])
+        self.assertEqual(CACHE.hits, hits + 1)
+
+    def test_cached_template_matches_compiled(self):
+        query = select(Fruit).where(Fruit.name == 'cherry').order_by(Fruit.id)
+        uncached = Context(SQLITE).sql(query).query()
+        self.database.compile(query)
+        self.assertEqual(self.database.compile(query), uncached)
+
+    def test_eviction(self):
+        for size in range(1, 7):
+            self.database.compile(
+                select(Fruit).where(Fruit.id << list(range(size))))
+
+        self.assertEqual(len(CACHE), 4)
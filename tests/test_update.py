@@ -0,0 +1,87 @@
+"""Tests of update and delete queries."""
+
+from sqlite3 import IntegrityError
+
+from dcorm import Model, bulk_update, delete, field, insert_many, update
+
+from tests.helpers import DatabaseTestCase
+
+
+class Account(Model, table_name='account'):
+    """A test model."""
+
+    id: int = field(primary=True)
+    owner: str
+    balance: int
+    active: bool = True
+
+
+class UpdateTest(DatabaseTestCase):
+    """Tests of set-based updates and deletes."""
+
+    SCHEMA = (
+        'CREATE TABLE account (id INTEGER PRIMARY KEY, owner TEXT UNIQUE, '
+        'balance INT, active INT)',
+    )
+
+    def setUp(self):
+        super().setUp()
+        insert_many(Account, [
+            Account(id, f'o{id}', id * 10) for id in range(1, 6)
+        ]).execute(self.database)
+
+    def balances(self) -> list[int]:
+        """Returns the balances of the accounts by id."""
+        return [row[0] for row in self.rows(
+            'SELECT balance FROM account ORDER BY id')]
+
+    def test_update(self):
+        self.assertEqual(update(Account).set(
+            balance=Account.balance + 1, active=False
+        ).where(Account.id > 3).execute(self.database), 2)
+        self.assertEqual(self.balances(), [10, 20, 30, 41, 51])
+        self.assertEqual(
+            self.rows('SELECT id FROM account WHERE active = 0'),
+            [(4,), (5,)])
+
+    def test_update_columns(self):
+        update(Account).set({Account.balance: 0}).execute(self.database)
+        self.assertEqual(self.balances(), [0] * 5)
+
+    def test_update_without_values(self):
+        with self.assertRaises(ValueError):
+            update(Account).execute(self.database)
+
+    def test_delete(self):
+        self.assertEqual(delete(Account).where(
+            Account.balance >= 30).execute(self.database), 3)
+        self.assertEqual(self.balances(), [10, 20])
+        self.assertEqual(delete(Account).execute(self.database), 2)
+        self.assertEqual(self.balances(), [])
+
+    def test_bulk_update(self):
+        self.assertEqual(bulk_update(Account, [
+            Account(2, 'o2', 200), {'id': 4, 'balance': 400},
+            {'id': 5, 'balance': 500}
+        ], ['balance'], batch_size=2).execute(self.database), 3)
+        self.assertEqual(self.balances(), [10, 200, 30, 400, 500])
+
+    def test_bulk_update_by_key(self):
+        bulk_update(Account, [
+            {'owner': 'o1', 'balance': 1, 'active': False},
+            {'owner': 'o3', 'balance': 3, 'active': True}
+        ], [Account.balance, Account.active], key=Account.owner).execute(
+            self.database)
+        self.assertEqual(self.balances(), [1, 20, 3, 40, 50])
+        self.assertEqual(
+            self.rows('SELECT id FROM account WHERE active = 0'), [(1,)])
+
+    def test_bulk_update_is_atomic(self):
+        with self.assertRaises(IntegrityError):
+            bulk_update(Account, [
+                {'id': 1, 'owner': 'x'}, {'id': 2, 'owner': 'y'},
+                {'id': 3, 'owner': 'x'}
+            ], ['owner'], batch_size=2).execute(self.database)
+
+        self.assertEqual(self.rows('SELECT owner FROM account WHERE id = 1'),
+                         [('o1',)])